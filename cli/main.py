@@ -836,9 +836,11 @@ def run_analysis():
         message_buffer.current_report = None
         message_buffer.final_report = None
 
-        # Update agent status to in_progress for the first analyst
-        first_analyst = f"{selections['analysts'][0].value.capitalize()} Analyst"
-        message_buffer.update_agent_status(first_analyst, "in_progress")
+        # Update agent status to in_progress for the first analyst (all of them when parallel)
+        parallel_analysts = bool(config.get("parallel_analysts", False))
+        selected_analysts = [analyst.value for analyst in selections["analysts"]]
+        for analyst in selected_analysts if parallel_analysts else selected_analysts[:1]:
+            message_buffer.update_agent_status(f"{analyst.capitalize()} Analyst", "in_progress")
         update_display(layout)
 
         # Create spinner text
@@ -847,19 +849,26 @@ def run_analysis():
         )
         update_display(layout, spinner_text)
 
-        # Initialize state and get graph args
-        init_agent_state = graph.propagator.create_initial_state(
-            selections["ticker"], selections["analysis_date"]
-        )
-        args = graph.propagator.get_graph_args()
-
         # Stream the analysis
         trace = []
+        # Parallel analysts converse on their own message channels
+        message_channels = ["messages"] + (
+            [f"{analyst}_messages" for analyst in selected_analysts] if parallel_analysts else []
+        )
+        last_message_ids = {}
         try:
-            for chunk in graph.graph.stream(init_agent_state, **args):
-                if chunk.get("messages"):
+            # Same input path as propagate: resumes a checkpointed run when checkpoint_db_path is set
+            for chunk in graph.stream(selections["ticker"], selections["analysis_date"]):
+                for channel in message_channels:
+                    if not chunk.get(channel):
+                        continue
                     # Get the last message from the chunk
-                    last_message = chunk["messages"][-1]
+                    last_message = chunk[channel][-1]
+                    # Parallel analyst channels are re-sent unchanged in every chunk
+                    message_id = getattr(last_message, "id", None)
+                    if parallel_analysts and message_id is not None and last_message_ids.get(channel) == message_id:
+                        continue
+                    last_message_ids[channel] = message_id
 
                     # Extract message content and type
                     if hasattr(last_message, "content"):
@@ -891,7 +900,7 @@ def run_analysis():
                     )
                     message_buffer.update_agent_status("Market Analyst", "completed")
                     # Set next analyst to in_progress
-                    if "social" in selections["analysts"]:
+                    if "social" in selections["analysts"] and not parallel_analysts:
                         message_buffer.update_agent_status(
                             "Social Analyst", "in_progress"
                         )
@@ -902,7 +911,7 @@ def run_analysis():
                     )
                     message_buffer.update_agent_status("Social Analyst", "completed")
                     # Set next analyst to in_progress
-                    if "news" in selections["analysts"]:
+                    if "news" in selections["analysts"] and not parallel_analysts:
                         message_buffer.update_agent_status(
                             "News Analyst", "in_progress"
                         )
@@ -913,7 +922,7 @@ def run_analysis():
                     )
                     message_buffer.update_agent_status("News Analyst", "completed")
                     # Set next analyst to in_progress
-                    if "fundamentals" in selections["analysts"]:
+                    if "fundamentals" in selections["analysts"] and not parallel_analysts:
                         message_buffer.update_agent_status(
                             "Fundamentals Analyst", "in_progress"
                         )
@@ -925,7 +934,18 @@ def run_analysis():
                     message_buffer.update_agent_status(
                         "Fundamentals Analyst", "completed"
                     )
-                    # Set all research team members to in_progress
+
+                # Set all research team members to in_progress once every analyst has reported
+                if all(
+                    chunk.get(section)
+                    for analyst, section in (
+                        ("market", "market_report"),
+                        ("social", "sentiment_report"),
+                        ("news", "news_report"),
+                        ("fundamentals", "fundamentals_report"),
+                    )
+                    if analyst in selected_analysts
+                ) and message_buffer.agent_status.get("Bull Researcher") == "pending":
                     update_research_team_status("in_progress")
 
                 # Research Team - Handle Investment Debate State
@@ -159,6 +159,10 @@ class RunSession:
         self.emit("report_update", {"section": section, "content": content})
 
     def run(self) -> None:
+        """Run to completion on a private event loop (when no server loop is available)."""
+        asyncio.run(self.arun())
+
+    async def arun(self) -> None:
         self.status = "running"
         self.emit("run_status", {"status": self.status})
 
@@ -183,19 +187,29 @@ class RunSession:
             if not selected_analysts:
                 raise ValueError("No analysts selected.")
 
-            self._set_agent_status(f"{selected_analysts[0].capitalize()} Analyst", "in_progress")
-
-            graph = TradingAgentsGraph(selected_analysts=selected_analysts, config=config, debug=True)
+            # Parallel analysts all start at once; sequential ones are advanced as reports arrive.
+            parallel = bool(config.get("parallel_analysts", False))
+            for analyst in selected_analysts if parallel else selected_analysts[:1]:
+                self._set_agent_status(f"{analyst.capitalize()} Analyst", "in_progress")
 
-            init_agent_state = graph.propagator.create_initial_state(
-                self.request.ticker, self.request.analysis_date
+            # Construction opens memory stores and clients; keep it off the event loop.
+            graph = await asyncio.to_thread(
+                TradingAgentsGraph, selected_analysts=selected_analysts, config=config, debug=True
             )
-            args = graph.propagator.get_graph_args()
 
             last_seen: dict[str, str] = {}
-            for chunk in graph.graph.stream(init_agent_state, **args):
-                if chunk.get("messages"):
-                    last_message = chunk["messages"][-1]
+            # Parallel analysts converse on their own channels; only emit messages that are new.
+            channels = ["messages"] + ([f"{a}_messages" for a in selected_analysts] if parallel else [])
+            last_message_ids: dict[str, Any] = {}
+            async for chunk in graph.astream(self.request.ticker, self.request.analysis_date):
+                for channel in channels:
+                    if not chunk.get(channel):
+                        continue
+                    last_message = chunk[channel][-1]
+                    message_id = getattr(last_message, "id", None)
+                    if parallel and message_id is not None and last_message_ids.get(channel) == message_id:
+                        continue
+                    last_message_ids[channel] = message_id
                     content = _extract_content_string(getattr(last_message, "content", str(last_message)))
                     self.emit("message", {"content": content})
 
@@ -221,26 +235,15 @@ class RunSession:
                         self._set_report(section, value)
 
                 # Status heuristics, similar to CLI
-                if last_seen.get("market_report"):
-                    self._set_agent_status("Market Analyst", "completed")
-                    next_analyst = _next_selected_analyst(selected_analysts, "market")
-                    if next_analyst:
-                        self._set_agent_status(f"{next_analyst.capitalize()} Analyst", "in_progress")
-
-                if last_seen.get("sentiment_report"):
-                    self._set_agent_status("Social Analyst", "completed")
-                    next_analyst = _next_selected_analyst(selected_analysts, "social")
-                    if next_analyst:
-                        self._set_agent_status(f"{next_analyst.capitalize()} Analyst", "in_progress")
-
-                if last_seen.get("news_report"):
-                    self._set_agent_status("News Analyst", "completed")
-                    next_analyst = _next_selected_analyst(selected_analysts, "news")
-                    if next_analyst:
+                for analyst, section in _ANALYST_REPORTS.items():
+                    if analyst not in selected_analysts or not last_seen.get(section):
+                        continue
+                    self._set_agent_status(f"{analyst.capitalize()} Analyst", "completed")
+                    next_analyst = None if parallel else _next_selected_analyst(selected_analysts, analyst)
+                    if next_analyst and self.agent_status.get(f"{next_analyst.capitalize()} Analyst") == "pending":
                         self._set_agent_status(f"{next_analyst.capitalize()} Analyst", "in_progress")
 
-                if last_seen.get("fundamentals_report"):
-                    self._set_agent_status("Fundamentals Analyst", "completed")
+                if all(last_seen.get(_ANALYST_REPORTS[a]) for a in selected_analysts if a in _ANALYST_REPORTS):
                     for agent in ("Bull Researcher", "Bear Researcher", "Research Manager", "Trader"):
                         if self.agent_status.get(agent) == "pending":
                             self._set_agent_status(agent, "in_progress")
@@ -284,6 +287,14 @@ def _queue_put_nowait_drop_oldest(queue: asyncio.Queue, item: Any) -> None:
             pass
 
 
+_ANALYST_REPORTS = {
+    "market": "market_report",
+    "social": "sentiment_report",
+    "news": "news_report",
+    "fundamentals": "fundamentals_report",
+}
+
+
 def _next_selected_analyst(selected: list[str], current: str) -> str | None:
     try:
         idx = selected.index(current)
@@ -299,6 +310,7 @@ class RunManager:
         self._runs: dict[str, RunSession] = {}
         self._lock = threading.Lock()
         self._loop: asyncio.AbstractEventLoop | None = None
+        self._tasks: set[Any] = set()
 
     def set_loop(self, loop: asyncio.AbstractEventLoop) -> None:
         self._loop = loop
@@ -312,9 +324,15 @@ class RunManager:
         with self._lock:
             self._runs[run_id] = session
 
-        # Start background thread
-        t = threading.Thread(target=session.run, name=f"run-{run_id}", daemon=True)
-        t.start()
+        if self._loop is not None:
+            # Runs share the server's event loop: model calls are awaited, tool calls use the bounded tool pool
+            task = asyncio.run_coroutine_threadsafe(session.arun(), self._loop)
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+        else:
+            # Start background thread
+            t = threading.Thread(target=session.run, name=f"run-{run_id}", daemon=True)
+            t.start()
         return session
 
     def get_run(self, run_id: str) -> RunSession | None:
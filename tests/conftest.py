@@ -0,0 +1,61 @@
+"""Offline fixtures: a TradingAgentsGraph on a scripted chat model, local embeddings and no vendor calls."""
+
+from typing import Any, List
+
+import pytest
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+
+import tradingagents.graph.trading_graph as trading_graph
+import tradingagents.i18n as i18n
+from tradingagents.default_config import DEFAULT_CONFIG
+
+
+class ScriptedChatModel(BaseChatModel):
+    """Answers every prompt with a short report and never calls tools; records the tools it is bound to."""
+
+    calls: List[Any] = []
+    bound_tool_names: List[str] = []
+
+    @property
+    def _llm_type(self) -> str:
+        return "scripted"
+
+    def bind_tools(self, tools, **kwargs):
+        self.bound_tool_names = [tool.name for tool in tools]
+        return self
+
+    def _generate(self, messages, stop=None, run_manager=None, **kwargs):
+        self.calls.append(messages)
+        content = f"Report on: {str(messages[0].content)[:40]}. FINAL TRANSACTION PROPOSAL: **HOLD**"
+        return ChatResult(generations=[ChatGeneration(message=AIMessage(content=content))])
+
+
+@pytest.fixture
+def scripted_llm():
+    return ScriptedChatModel()
+
+
+@pytest.fixture
+def make_graph(monkeypatch, tmp_path):
+    """Factory for offline graphs; keyword arguments override the config."""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(trading_graph, "ChatOpenAI", lambda **kwargs: ScriptedChatModel())
+    # The risk debaters format their templates with `trader_decision` and `history` only.
+    for key in ("agent_risky_prompt", "agent_safe_prompt", "agent_neutral_prompt"):
+        monkeypatch.setitem(i18n._TRANSLATIONS["en"], key, "Risk view on {trader_decision}. {history}")
+
+    def make(**overrides):
+        config = {
+            **DEFAULT_CONFIG,
+            "language": "en",
+            "project_dir": str(tmp_path),
+            "embedding_provider": "hashing",
+            "memory_vector_backend": "numpy",
+            "memory_snapshot_dir": "",
+            **overrides,
+        }
+        return trading_graph.TradingAgentsGraph(["market"], config=config)
+
+    return make
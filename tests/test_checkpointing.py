@@ -0,0 +1,16 @@
+import pytest
+
+pytest.importorskip("langgraph.checkpoint.sqlite")
+
+
+def test_cli_stream_with_checkpointer(make_graph, tmp_path):
+    # The CLI streams through TradingAgentsGraph.stream, which supplies the checkpoint thread.
+    graph = make_graph(checkpoint_db_path=str(tmp_path / "runs.sqlite"))
+
+    chunks = list(graph.stream("NVDA", "2024-05-10"))
+    assert chunks[-1]["final_trade_decision"]
+
+    # A finished run is not recomputed: its stored state comes back as one chunk.
+    resumed = list(graph.stream("NVDA", "2024-05-10"))
+    assert len(resumed) == 1
+    assert resumed[0]["final_trade_decision"] == chunks[-1]["final_trade_decision"]
@@ -0,0 +1,40 @@
+from tradingagents.agents import create_risk_manager
+from tradingagents.graph.reflection import Reflector
+
+
+class RecordingMemory:
+    name = "risk_manager_memory"
+
+    def __init__(self):
+        self.queries = []
+
+    def get_memories(self, situation, n_matches=1, ticker=None):
+        self.queries.append(situation)
+        return [{"recommendation": "Size down into earnings"}]
+
+
+def test_risk_manager_recalls_with_the_stored_situation(scripted_llm):
+    state = {
+        "company_of_interest": "NVDA",
+        "market_report": "market",
+        "sentiment_report": "sentiment",
+        "news_report": "news",
+        "fundamentals_report": "fundamentals",
+        "investment_plan": "Buy",
+        "risk_debate_state": {
+            "history": "",
+            "risky_history": "",
+            "safe_history": "",
+            "neutral_history": "",
+            "current_risky_response": "",
+            "current_safe_response": "",
+            "current_neutral_response": "",
+            "count": 3,
+        },
+    }
+    memory = RecordingMemory()
+    create_risk_manager(scripted_llm, memory, "en").invoke(state)
+
+    # Lessons are stored under the reflector's situation text; the query must use the same text.
+    assert memory.queries == [Reflector(scripted_llm)._extract_current_situation(state)]
+    assert "fundamentals" in memory.queries[0]
@@ -0,0 +1,28 @@
+import pytest
+
+from tradingagents.agents.utils.memory import FinancialSituationMemory
+from tradingagents.default_config import DEFAULT_CONFIG
+
+
+def _config(**overrides):
+    return {**DEFAULT_CONFIG, "embedding_provider": "hashing", "memory_bank": "registry-test", **overrides}
+
+
+@pytest.mark.parametrize("backend", ["numpy", "chroma"])
+def test_ephemeral_banks_are_separate_per_embedding_setup(backend):
+    wide = FinancialSituationMemory("bull_memory", _config(memory_vector_backend=backend, local_embedding_dimensions=1024))
+    narrow = FinancialSituationMemory("bull_memory", _config(memory_vector_backend=backend, local_embedding_dimensions=256))
+    wide.add_situations([("Rates rising, tech selling off", "Trim growth names")], metadata={"ticker": "NVDA"})
+    narrow.add_situations([("Rates rising, tech selling off", "Trim growth names")], metadata={"ticker": "NVDA"})
+
+    assert wide.situation_collection is not narrow.situation_collection
+    assert narrow.get_memories("Tech selling off", ticker="NVDA")[0]["recommendation"] == "Trim growth names"
+    assert wide.get_memories("Tech selling off", ticker="NVDA")[0]["recommendation"] == "Trim growth names"
+
+
+@pytest.mark.parametrize("backend", ["numpy", "chroma"])
+def test_persistent_bank_rejects_another_embedding_model(backend, tmp_path):
+    persistent = {"memory_vector_backend": backend, "memory_backend": "persistent", "memory_dir": str(tmp_path)}
+    FinancialSituationMemory("bull_memory", _config(local_embedding_dimensions=1024, **persistent))
+    with pytest.raises(ValueError, match="embedding model local-hashing-1024"):
+        FinancialSituationMemory("bull_memory", _config(local_embedding_dimensions=256, **persistent))
@@ -0,0 +1,37 @@
+import pytest
+from langchain_core.messages import HumanMessage
+
+from tradingagents.agents import (
+    create_fundamentals_analyst,
+    create_market_analyst,
+    create_news_analyst,
+    create_social_media_analyst,
+)
+from tradingagents.dataflows.prefetch import prefetch_plan
+from tradingagents.default_config import DEFAULT_CONFIG
+
+ANALYSTS = {
+    "market": create_market_analyst,
+    "social": create_social_media_analyst,
+    "news": create_news_analyst,
+    "fundamentals": create_fundamentals_analyst,
+}
+
+
+@pytest.mark.parametrize("analyst", sorted(ANALYSTS))
+def test_prefetch_plan_only_uses_the_analysts_tools(analyst, scripted_llm):
+    node = ANALYSTS[analyst](scripted_llm, "en")
+    node.invoke({"trade_date": "2024-05-10", "company_of_interest": "NVDA", "messages": [HumanMessage("NVDA")]})
+
+    planned = {method for method, _ in prefetch_plan([analyst], "NVDA", "2024-05-10", DEFAULT_CONFIG)}
+    assert planned
+    assert planned <= set(scripted_llm.bound_tool_names)
+
+
+@pytest.mark.parametrize("data_prefetch, memoized", [(False, False), (True, True)])
+def test_tool_result_memo_follows_data_prefetch(monkeypatch, data_prefetch, memoized):
+    from tradingagents.dataflows import tool_results
+
+    config = {**DEFAULT_CONFIG, "data_prefetch": data_prefetch}
+    monkeypatch.setattr(tool_results, "get_config", lambda: config)
+    assert tool_results.memo_enabled() is memoized
@@ -1,6 +1,8 @@
 from .utils.agent_utils import create_msg_delete
 from .utils.agent_states import AgentState, InvestDebateState, RiskDebateState
 from .utils.memory import FinancialSituationMemory
+from .utils.memory_recall import create_memory_recall
+from .utils.data_prefetch import create_data_prefetch
 
 from .analysts.fundamentals_analyst import create_fundamentals_analyst
 from .analysts.market_analyst import create_market_analyst
@@ -23,6 +25,8 @@ __all__ = [
     "FinancialSituationMemory",
     "AgentState",
     "create_msg_delete",
+    "create_memory_recall",
+    "create_data_prefetch",
     "InvestDebateState",
     "RiskDebateState",
     "create_bear_researcher",
@@ -1,7 +1,7 @@
 from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
 import time
 import json
-from tradingagents.agents.utils.agent_utils import get_fundamentals, get_balance_sheet, get_cashflow, get_income_statement, get_insider_sentiment, get_insider_transactions
+from tradingagents.agents.utils.agent_utils import get_fundamentals, get_balance_sheet, get_cashflow, get_income_statement, get_insider_sentiment, get_insider_transactions, llm_node
 from tradingagents.dataflows.config import get_config
 from tradingagents.i18n import get_text
 
@@ -45,7 +45,7 @@ def create_fundamentals_analyst(llm, lang: str = "en"):
 
         chain = prompt | llm.bind_tools(tools)
 
-        result = chain.invoke(state["messages"])
+        result = yield chain, state["messages"]
 
         report = ""
 
@@ -57,4 +57,4 @@ def create_fundamentals_analyst(llm, lang: str = "en"):
             "fundamentals_report": report,
         }
 
-    return fundamentals_analyst_node
+    return llm_node(fundamentals_analyst_node)
@@ -1,7 +1,7 @@
 from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
 import time
 import json
-from tradingagents.agents.utils.agent_utils import get_stock_data, get_indicators
+from tradingagents.agents.utils.agent_utils import get_stock_data, get_indicators, llm_node
 from tradingagents.dataflows.config import get_config
 from tradingagents.i18n import get_text
 
@@ -44,7 +44,7 @@ def create_market_analyst(llm, lang: str = "en"):
 
         chain = prompt | llm.bind_tools(tools)
 
-        result = chain.invoke(state["messages"])
+        result = yield chain, state["messages"]
 
         report = ""
 
@@ -56,4 +56,4 @@ def create_market_analyst(llm, lang: str = "en"):
             "market_report": report,
         }
 
-    return market_analyst_node
+    return llm_node(market_analyst_node)
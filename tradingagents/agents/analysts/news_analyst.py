@@ -1,7 +1,7 @@
 from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
 import time
 import json
-from tradingagents.agents.utils.agent_utils import get_news, get_global_news
+from tradingagents.agents.utils.agent_utils import get_news, get_global_news, llm_node
 from tradingagents.dataflows.config import get_config
 from tradingagents.i18n import get_text
 
@@ -41,7 +41,7 @@ def create_news_analyst(llm, lang: str = "en"):
         prompt = prompt.partial(ticker=ticker)
 
         chain = prompt | llm.bind_tools(tools)
-        result = chain.invoke(state["messages"])
+        result = yield chain, state["messages"]
 
         report = ""
 
@@ -53,4 +53,4 @@ def create_news_analyst(llm, lang: str = "en"):
             "news_report": report,
         }
 
-    return news_analyst_node
+    return llm_node(news_analyst_node)
@@ -1,7 +1,7 @@
 from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
 import time
 import json
-from tradingagents.agents.utils.agent_utils import get_news
+from tradingagents.agents.utils.agent_utils import get_news, llm_node
 from tradingagents.dataflows.config import get_config
 from tradingagents.i18n import get_text
 
@@ -42,7 +42,7 @@ def create_social_media_analyst(llm, lang: str = "en"):
 
         chain = prompt | llm.bind_tools(tools)
 
-        result = chain.invoke(state["messages"])
+        result = yield chain, state["messages"]
 
         report = ""
 
@@ -54,4 +54,4 @@ def create_social_media_analyst(llm, lang: str = "en"):
             "sentiment_report": report,
         }
 
-    return social_media_analyst_node
+    return llm_node(social_media_analyst_node)
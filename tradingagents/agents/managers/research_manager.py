@@ -1,20 +1,17 @@
 import time
 import json
 from tradingagents.i18n import get_text
+from tradingagents.agents.utils.agent_utils import llm_node
+from tradingagents.agents.utils.memory_recall import recall_memories
 
 
 def create_research_manager(llm, memory, lang: str = "en"):
     def research_manager_node(state) -> dict:
         history = state["investment_debate_state"].get("history", "")
-        market_research_report = state["market_report"]
-        sentiment_report = state["sentiment_report"]
-        news_report = state["news_report"]
-        fundamentals_report = state["fundamentals_report"]
 
         investment_debate_state = state["investment_debate_state"]
 
-        curr_situation = f"{market_research_report}\n\n{sentiment_report}\n\n{news_report}\n\n{fundamentals_report}"
-        past_memories = memory.get_memories(curr_situation, n_matches=2)
+        past_memories = recall_memories(state, memory, n_matches=2)
 
         past_memory_str = ""
         for i, rec in enumerate(past_memories, 1):
@@ -29,7 +26,7 @@ def create_research_manager(llm, memory, lang: str = "en"):
             bear_history=bear_history,
             past_memory_str=past_memory_str,
         )
-        response = llm.invoke(prompt)
+        response = yield llm, prompt
 
         new_investment_debate_state = {
             "judge_decision": response.content,
@@ -45,4 +42,4 @@ def create_research_manager(llm, memory, lang: str = "en"):
             "investment_plan": response.content,
         }
 
-    return research_manager_node
+    return llm_node(research_manager_node)
@@ -1,6 +1,8 @@
 import time
 import json
 from tradingagents.i18n import get_text
+from tradingagents.agents.utils.agent_utils import llm_node
+from tradingagents.agents.utils.memory_recall import recall_memories
 
 
 def create_risk_manager(llm, memory, lang: str = "en"):
@@ -10,14 +12,9 @@ def create_risk_manager(llm, memory, lang: str = "en"):
 
         history = state["risk_debate_state"]["history"]
         risk_debate_state = state["risk_debate_state"]
-        market_research_report = state["market_report"]
-        news_report = state["news_report"]
-        fundamentals_report = state["news_report"]
-        sentiment_report = state["sentiment_report"]
         trader_plan = state["investment_plan"]
 
-        curr_situation = f"{market_research_report}\n\n{sentiment_report}\n\n{news_report}\n\n{fundamentals_report}"
-        past_memories = memory.get_memories(curr_situation, n_matches=2)
+        past_memories = recall_memories(state, memory, n_matches=2)
 
         past_memory_str = ""
         for i, rec in enumerate(past_memories, 1):
@@ -36,7 +33,7 @@ def create_risk_manager(llm, memory, lang: str = "en"):
             past_memory_str=past_memory_str,
         )
 
-        response = llm.invoke(prompt)
+        response = yield llm, prompt
 
         new_risk_debate_state = {
             "judge_decision": response.content,
@@ -56,4 +53,4 @@ def create_risk_manager(llm, memory, lang: str = "en"):
             "final_trade_decision": response.content,
         }
 
-    return risk_manager_node
+    return llm_node(risk_manager_node)
@@ -2,6 +2,8 @@ from langchain_core.messages import AIMessage
 import time
 import json
 from tradingagents.i18n import get_text
+from tradingagents.agents.utils.agent_utils import llm_node
+from tradingagents.agents.utils.memory_recall import recall_memories
 
 
 def create_bull_researcher(llm, memory, lang: str = "en"):
@@ -16,8 +18,7 @@ def create_bull_researcher(llm, memory, lang: str = "en"):
         news_report = state["news_report"]
         fundamentals_report = state["fundamentals_report"]
 
-        curr_situation = f"{market_research_report}\n\n{sentiment_report}\n\n{news_report}\n\n{fundamentals_report}"
-        past_memories = memory.get_memories(curr_situation, n_matches=2)
+        past_memories = recall_memories(state, memory, n_matches=2)
 
         past_memory_str = ""
         for i, rec in enumerate(past_memories, 1):
@@ -33,7 +34,7 @@ def create_bull_researcher(llm, memory, lang: str = "en"):
             past_memory_str=past_memory_str,
         )
 
-        response = llm.invoke(prompt)
+        response = yield llm, prompt
 
         argument = f"Bull Analyst: {response.content}"
 
@@ -47,4 +48,4 @@ def create_bull_researcher(llm, memory, lang: str = "en"):
 
         return {"investment_debate_state": new_investment_debate_state}
 
-    return bull_node
+    return llm_node(bull_node)
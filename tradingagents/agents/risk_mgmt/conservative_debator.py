@@ -2,6 +2,7 @@ from langchain_core.messages import AIMessage
 import time
 import json
 from tradingagents.i18n import get_text
+from tradingagents.agents.utils.agent_utils import llm_node
 
 
 def create_safe_debator(llm, lang: str = "en"):
@@ -31,7 +32,7 @@ def create_safe_debator(llm, lang: str = "en"):
             current_neutral_response=current_neutral_response,
         )
 
-        response = llm.invoke(prompt)
+        response = yield llm, prompt
 
         argument = f"Safe Analyst: {response.content}"
 
@@ -53,4 +54,4 @@ def create_safe_debator(llm, lang: str = "en"):
 
         return {"risk_debate_state": new_risk_debate_state}
 
-    return safe_node
+    return llm_node(safe_node)
@@ -1,6 +1,7 @@
 import time
 import json
 from tradingagents.i18n import get_text
+from tradingagents.agents.utils.agent_utils import llm_node
 
 
 def create_neutral_debator(llm, lang: str = "en"):
@@ -30,7 +31,7 @@ def create_neutral_debator(llm, lang: str = "en"):
             current_safe_response=current_safe_response,
         )
 
-        response = llm.invoke(prompt)
+        response = yield llm, prompt
 
         argument = f"Neutral Analyst: {response.content}"
 
@@ -50,4 +51,4 @@ def create_neutral_debator(llm, lang: str = "en"):
 
         return {"risk_debate_state": new_risk_debate_state}
 
-    return neutral_node
+    return llm_node(neutral_node)
@@ -2,19 +2,16 @@ import functools
 import time
 import json
 from tradingagents.i18n import get_text
+from tradingagents.agents.utils.agent_utils import llm_node
+from tradingagents.agents.utils.memory_recall import recall_memories
 
 
 def create_trader(llm, memory, lang: str = "en"):
     def trader_node(state, name):
         company_name = state["company_of_interest"]
         investment_plan = state["investment_plan"]
-        market_research_report = state["market_report"]
-        sentiment_report = state["sentiment_report"]
-        news_report = state["news_report"]
-        fundamentals_report = state["fundamentals_report"]
 
-        curr_situation = f"{market_research_report}\n\n{sentiment_report}\n\n{news_report}\n\n{fundamentals_report}"
-        past_memories = memory.get_memories(curr_situation, n_matches=2)
+        past_memories = recall_memories(state, memory, n_matches=2)
 
         past_memory_str = ""
         if past_memories:
@@ -38,7 +35,7 @@ def create_trader(llm, memory, lang: str = "en"):
             context,
         ]
 
-        result = llm.invoke(messages)
+        result = yield llm, messages
 
         return {
             "messages": [result],
@@ -46,4 +43,4 @@ def create_trader(llm, memory, lang: str = "en"):
             "sender": name,
         }
 
-    return functools.partial(trader_node, name="Trader")
+    return llm_node(functools.partial(trader_node, name="Trader"))
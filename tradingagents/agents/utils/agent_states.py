@@ -1,10 +1,12 @@
-from typing import Annotated, Sequence
+from typing import Annotated, Any, Dict, List, Sequence
 from datetime import date, timedelta, datetime
 from typing_extensions import TypedDict, Optional
 from langchain_openai import ChatOpenAI
 from tradingagents.agents import *
 from langgraph.prebuilt import ToolNode
+from langchain_core.messages import AnyMessage
 from langgraph.graph import END, StateGraph, START, MessagesState
+from langgraph.graph.message import add_messages
 
 
 # Researcher team state
@@ -61,6 +63,17 @@ class AgentState(MessagesState):
     ]
     fundamentals_report: Annotated[str, "Report from the Fundamentals Researcher"]
 
+    # per-analyst message channels, used when analysts run in parallel (parallel_analysts)
+    market_messages: Annotated[list[AnyMessage], add_messages]
+    social_messages: Annotated[list[AnyMessage], add_messages]
+    news_messages: Annotated[list[AnyMessage], add_messages]
+    fundamentals_messages: Annotated[list[AnyMessage], add_messages]
+
+    # memory recall step
+    past_memories: Annotated[
+        Dict[str, List[Dict[str, Any]]], "Past lessons recalled once per run, keyed by memory bank"
+    ]
+
     # researcher team discussion step
     investment_debate_state: Annotated[
         InvestDebateState, "Current state of the debate on if to invest or not"
@@ -1,4 +1,5 @@
 from langchain_core.messages import HumanMessage, RemoveMessage
+from langchain_core.runnables import RunnableLambda
 
 # Import tools from separate utility files
 from tradingagents.agents.utils.core_stock_tools import (
@@ -20,6 +21,35 @@ from tradingagents.agents.utils.news_data_tools import (
     get_global_news
 )
 
+def llm_node(step):
+    """
+    Graph node from a generator `step(state)` that yields `(runnable, input)` for each model
+    call, is sent the response, and returns the state update. The calls use `invoke` when the
+    graph runs with `invoke`/`stream` and are awaited with `ainvoke` under `ainvoke`/`astream`,
+    so async runs do not hold a thread while waiting on the model.
+    """
+
+    def run(state, config):
+        steps = step(state)
+        try:
+            runnable, payload = next(steps)
+            while True:
+                runnable, payload = steps.send(runnable.invoke(payload, config))
+        except StopIteration as done:
+            return done.value
+
+    async def arun(state, config):
+        steps = step(state)
+        try:
+            runnable, payload = next(steps)
+            while True:
+                runnable, payload = steps.send(await runnable.ainvoke(payload, config))
+        except StopIteration as done:
+            return done.value
+
+    return RunnableLambda(run, afunc=arun, name=getattr(step, "__name__", None))
+
+
 def create_msg_delete():
     def delete_messages(state):
         """Clear messages and add placeholder for Anthropic compatibility"""
@@ -0,0 +1,29 @@
+"""
+Data prefetch stage.
+
+An optional first graph node that issues the analysts' predictable data requests for the
+run's (ticker, trade date) concurrently (see `tradingagents.dataflows.prefetch`). By default
+it does not wait: the first LLM turns overlap the network I/O, and tool calls that arrive
+while a prefetch is still in flight join it instead of fetching again.
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import wait
+
+from tradingagents.dataflows.config import get_config
+from tradingagents.dataflows.prefetch import prefetch_plan, start_prefetch
+
+
+def create_data_prefetch(selected_analysts):
+    selected_analysts = list(selected_analysts)
+
+    def data_prefetch_node(state) -> dict:
+        config = get_config()
+        calls = prefetch_plan(selected_analysts, state["company_of_interest"], state["trade_date"], config)
+        futures = start_prefetch(calls, max_workers=int(config.get("prefetch_max_workers", 8)))
+        if config.get("prefetch_wait", False):
+            wait(futures, timeout=config.get("prefetch_timeout_seconds", 120))
+        return {}
+
+    return data_prefetch_node
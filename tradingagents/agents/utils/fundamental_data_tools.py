@@ -1,6 +1,7 @@
 from langchain_core.tools import tool
 from typing import Annotated
 from tradingagents.dataflows.interface import route_to_vendor
+from tradingagents.dataflows.rendering import render_tool_output
 
 
 @tool
@@ -17,7 +18,9 @@ def get_fundamentals(
     Returns:
         str: A formatted report containing comprehensive fundamental data
     """
-    return route_to_vendor("get_fundamentals", ticker, curr_date)
+    return render_tool_output(
+        "get_fundamentals", route_to_vendor("get_fundamentals", ticker, curr_date)
+    )
 
 
 @tool
@@ -36,7 +39,9 @@ def get_balance_sheet(
     Returns:
         str: A formatted report containing balance sheet data
     """
-    return route_to_vendor("get_balance_sheet", ticker, freq, curr_date)
+    return render_tool_output(
+        "get_balance_sheet", route_to_vendor("get_balance_sheet", ticker, freq, curr_date)
+    )
 
 
 @tool
@@ -55,7 +60,9 @@ def get_cashflow(
     Returns:
         str: A formatted report containing cash flow statement data
     """
-    return route_to_vendor("get_cashflow", ticker, freq, curr_date)
+    return render_tool_output(
+        "get_cashflow", route_to_vendor("get_cashflow", ticker, freq, curr_date)
+    )
 
 
 @tool
@@ -74,4 +81,6 @@ def get_income_statement(
     Returns:
         str: A formatted report containing income statement data
     """
-    return route_to_vendor("get_income_statement", ticker, freq, curr_date)
+    return render_tool_output(
+        "get_income_statement", route_to_vendor("get_income_statement", ticker, freq, curr_date)
+    )
@@ -0,0 +1,135 @@
+"""
+In-process embedding providers, selected with `embedding_provider`:
+
+- "hashing": deterministic feature-hashing vectorizer (word unigrams and bigrams, CJK
+  character unigrams and bigrams, sublinear term frequency, signed buckets, L2-normalized).
+  No model, no network, identical vectors on every machine; retrieval quality is lexical.
+- "onnx": a small sentence-embedding model (e.g. all-MiniLM-L6-v2 exported to ONNX) run on
+  CPU with `onnxruntime` and `tokenizers` (optional dependencies). `local_embedding_model_path`
+  is a directory holding `model.onnx` and `tokenizer.json`.
+
+Both return unit-norm float32 vectors for any input length, so memory retrieval needs
+neither an embeddings endpoint nor LLM summarization of long situations.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import math
+import re
+import threading
+from collections import Counter
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, List
+
+import numpy as np
+
+LOCAL_PROVIDERS = ("hashing", "onnx")
+
+_WORD_RE = re.compile(r"[a-z0-9][a-z0-9.%$_-]*")
+_CJK_RE = re.compile(r"[㐀-䶿一-鿿豈-﫿]+")
+
+
+@lru_cache(maxsize=1 << 16)
+def _bucket(feature: str, dimensions: int) -> tuple[int, float]:
+    digest = int.from_bytes(hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest(), "little")
+    return digest % dimensions, 1.0 if (digest >> 63) & 1 else -1.0
+
+
+def _features(text: str) -> List[str]:
+    lowered = text.lower()
+    words = _WORD_RE.findall(lowered)
+    features = words + [f"{a} {b}" for a, b in zip(words, words[1:])]
+    for run in _CJK_RE.findall(lowered):
+        features.extend(run)
+        features.extend(run[i : i + 2] for i in range(len(run) - 1))
+    return features
+
+
+class HashingEmbedder:
+    """Deterministic sublinear-TF feature hashing into `dimensions` signed buckets."""
+
+    # Recomputing is cheaper than a cache lookup.
+    cacheable = False
+
+    def __init__(self, dimensions: int = 1024):
+        self.dimensions = int(dimensions)
+        self.model_name = f"local-hashing-{self.dimensions}"
+
+    def embed(self, texts: List[str]) -> List[list[float]]:
+        matrix = np.zeros((len(texts), self.dimensions), dtype=np.float32)
+        for row, text in enumerate(texts):
+            for feature, tf in Counter(_features(text or "")).items():
+                slot, sign = _bucket(feature, self.dimensions)
+                matrix[row, slot] += sign * (1.0 + math.log(tf))
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return (matrix / norms).tolist()
+
+
+class OnnxEmbedder:
+    """Mean-pooled sentence embeddings from an ONNX transformer on CPU."""
+
+    cacheable = True
+
+    def __init__(self, model_path: str, max_length: int = 256):
+        try:
+            import onnxruntime as ort
+            from tokenizers import Tokenizer
+        except ImportError as e:
+            raise ImportError(
+                "embedding_provider='onnx' requires the optional packages onnxruntime and tokenizers; "
+                "install the onnx extra with `pip install -e \".[onnx]\"`"
+            ) from e
+
+        directory = Path(model_path)
+        if not (directory / "model.onnx").exists() or not (directory / "tokenizer.json").exists():
+            raise FileNotFoundError(f"Expected model.onnx and tokenizer.json in {directory}")
+        self.model_name = f"local-onnx-{directory.name}"
+        self._tokenizer = Tokenizer.from_file(str(directory / "tokenizer.json"))
+        self._tokenizer.enable_truncation(max_length=int(max_length))
+        self._tokenizer.enable_padding()
+        self._session = ort.InferenceSession(str(directory / "model.onnx"), providers=["CPUExecutionProvider"])
+        self._input_names = {node.name for node in self._session.get_inputs()}
+
+    def embed(self, texts: List[str]) -> List[list[float]]:
+        encodings = self._tokenizer.encode_batch([text or " " for text in texts])
+        input_ids = np.array([e.ids for e in encodings], dtype=np.int64)
+        attention_mask = np.array([e.attention_mask for e in encodings], dtype=np.int64)
+        feeds = {"input_ids": input_ids, "attention_mask": attention_mask}
+        if "token_type_ids" in self._input_names:
+            feeds["token_type_ids"] = np.zeros_like(input_ids)
+        hidden = self._session.run(None, {k: v for k, v in feeds.items() if k in self._input_names})[0]
+
+        mask = attention_mask[:, :, None].astype(np.float32)
+        pooled = (hidden * mask).sum(axis=1) / np.maximum(mask.sum(axis=1), 1e-9)
+        norms = np.linalg.norm(pooled, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return (pooled / norms).astype(np.float32).tolist()
+
+
+_EMBEDDERS: Dict[tuple, Any] = {}
+_EMBEDDERS_LOCK = threading.Lock()
+
+
+def get_local_embedder(config: Dict[str, Any]):
+    """Process-wide embedder for `embedding_provider`, or None for the OpenAI-compatible endpoint."""
+    provider = str(config.get("embedding_provider", "openai")).lower()
+    if provider not in LOCAL_PROVIDERS:
+        return None
+    if provider == "hashing":
+        key: tuple = (provider, int(config.get("local_embedding_dimensions", 1024)))
+    else:
+        key = (
+            provider,
+            str(config.get("local_embedding_model_path", "")),
+            int(config.get("local_embedding_max_length", 256)),
+        )
+
+    with _EMBEDDERS_LOCK:
+        embedder = _EMBEDDERS.get(key)
+        if embedder is None:
+            embedder = HashingEmbedder(key[1]) if provider == "hashing" else OnnxEmbedder(key[1], key[2])
+            _EMBEDDERS[key] = embedder
+        return embedder
@@ -1,21 +1,43 @@
-import chromadb
-from chromadb.config import Settings
 from openai import OpenAI
-import hashlib
+import json
 import logging
-from typing import Any, Dict, Tuple
+import time
+import weakref
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+
+from tradingagents.utils.tokens import count_tokens, estimate_tokens, truncate_to_tokens
+
+from .local_embeddings import LOCAL_PROVIDERS, get_local_embedder
+from .memory_cache import get_embedding_cache, get_summary_cache
+from .memory_partitions import UNTAGGED, normalize_ticker, partition_filters, situation_tags, with_partition_tag
+from .memory_registry import get_memory_registry
+from .memory_retention import RetentionPolicy, compact_collection
+
+# Rows per Chroma write when importing snapshots (below Chroma's max batch size).
+_IMPORT_CHUNK_SIZE = 4096
+
+# Collections whose rows have all been given a `ticker` partition tag in this process.
+_TAGGED_COLLECTIONS: "weakref.WeakSet" = weakref.WeakSet()
 
 
 class FinancialSituationMemory:
     def __init__(self, name, config):
         self._log = logging.getLogger(__name__)
+        # Per-bank overrides, e.g. {"trader_memory": {"memory_quantization": "int8"}}.
+        bank_settings = (config.get("memory_bank_settings") or {}).get(name)
+        if bank_settings:
+            config = {**config, **bank_settings}
         self._config = config
+        self.name = name
         if config["backend_url"] == "http://localhost:11434/v1":
             default_embedding_model = "nomic-embed-text"
         else:
             default_embedding_model = "text-embedding-3-large"
         self.embedding = config.get("embedding_model", default_embedding_model)
-        self.client = OpenAI(base_url=config["backend_url"])
+        self._client = None
         self.quick_llm_model = config.get("quick_think_llm")
 
         default_embedding_ctx = 8000
@@ -34,13 +56,85 @@ class FinancialSituationMemory:
         self.embedding_summary_cache_max_items = int(
             config.get("embedding_summary_cache_max_items", 256)
         )
+        self.embedding_batch_size = max(1, int(config.get("embedding_batch_size", 64)))
+        self.embedding_batch_max_tokens = int(config.get("embedding_batch_max_tokens", 100000))
         self.embedding_log_summarization = self._coerce_bool(
             config.get("embedding_log_summarization", False), default=False
         )
 
-        self._summary_cache: Dict[str, str] = {}
-        self.chroma_client = chromadb.Client(Settings(allow_reset=True))
-        self.situation_collection = self.chroma_client.create_collection(name=name)
+        provider = str(config.get("embedding_provider", "openai")).lower()
+        if provider not in ("openai",) + LOCAL_PROVIDERS:
+            raise ValueError(f"Unsupported embedding_provider: {provider}")
+        # In-process embeddings: no endpoint, and long situations are embedded without summarization.
+        self._local_embedder = get_local_embedder(config)
+        if self._local_embedder is not None:
+            self.embedding = self._local_embedder.model_name
+            self.embedding_summarize_enabled = False
+
+        self.retention = RetentionPolicy.from_config(config)
+        # Queries for a ticker search these partitions in order (see memory_partitions).
+        self.partition_scopes = list(config.get("memory_partition_scopes", ["ticker", "sector", "market"]) or [])
+        self.partition_fallback_global = self._coerce_bool(
+            config.get("memory_partition_fallback_global", False), default=False
+        )
+        self._summary_cache = get_summary_cache(config)
+        self._embedding_cache = get_embedding_cache(config)
+        if self._local_embedder is not None and not self._local_embedder.cacheable:
+            self._embedding_cache = None
+        # Matryoshka-style truncation: keep the leading dimensions and re-normalize (0 = full width).
+        self.embedding_dimensions = int(config.get("memory_embedding_dimensions", 0) or 0)
+        collection_metadata: Dict[str, Any] = {"embedding_model": self.embedding}
+        if self.embedding_dimensions:
+            collection_metadata["embedding_dimensions"] = self.embedding_dimensions
+
+        # Banks are shared process-wide: every graph in this process sees the same memories.
+        self.situation_collection = get_memory_registry().get_collection(name, config, collection_metadata)
+        stored_metadata = self.situation_collection.metadata or {}
+        # The registry refuses banks built with another embedding model.
+        stored_model = stored_metadata.get("embedding_model")
+        stored_dimensions = int(stored_metadata.get("embedding_dimensions", 0) or 0)
+        if stored_model == self.embedding and stored_dimensions != self.embedding_dimensions:
+            self._log.warning(
+                "Memory bank '%s' stores %s-dim vectors but memory_embedding_dimensions is %s; "
+                "using the bank's width.",
+                name,
+                stored_dimensions or "full",
+                self.embedding_dimensions or "full",
+            )
+            self.embedding_dimensions = stored_dimensions
+        self._tag_untagged_rows()
+
+    @property
+    def client(self) -> OpenAI:
+        """OpenAI-compatible client, created on first use (never, with a local embedder and no summaries)."""
+        if self._client is None:
+            self._client = OpenAI(base_url=self._config["backend_url"])
+        return self._client
+
+    def _tag_untagged_rows(self) -> None:
+        """Give rows stored without a `ticker` tag (older banks) the untagged marker, once per process."""
+        collection = self.situation_collection
+        if collection in _TAGGED_COLLECTIONS:
+            return
+        stored = collection.get(include=["metadatas"])
+        untagged = [
+            row_id
+            for row_id, metadata in zip(stored["ids"], stored.get("metadatas") or [])
+            if "ticker" not in (metadata or {})
+        ]
+        for start in range(0, len(untagged), _IMPORT_CHUNK_SIZE):
+            rows = collection.get(
+                ids=untagged[start:start + _IMPORT_CHUNK_SIZE], include=["documents", "metadatas", "embeddings"]
+            )
+            collection.upsert(
+                ids=rows["ids"],
+                documents=rows["documents"],
+                metadatas=[with_partition_tag(metadata) for metadata in rows["metadatas"]],
+                embeddings=rows["embeddings"],
+            )
+        if untagged:
+            self._log.info("Tagged %s rows of memory bank '%s' that had no ticker", len(untagged), self.name)
+        _TAGGED_COLLECTIONS.add(collection)
 
     def _coerce_bool(self, value: Any, *, default: bool) -> bool:
         if value is None:
@@ -61,35 +155,11 @@ class FinancialSituationMemory:
         """
         Heuristic token estimator used as a fallback when exact tokenization is unavailable.
         """
-        ascii_chars = sum(1 for ch in text if ord(ch) < 128)
-        non_ascii_chars = len(text) - ascii_chars
-        return int(non_ascii_chars + (ascii_chars / 4))
+        return estimate_tokens(text)
 
     def _count_tokens(self, text: str, *, model: str | None = None) -> int:
-        """
-        Best-effort token counter.
-
-        - If `tiktoken` is available, use it for a closer-to-real count.
-        - Otherwise, fall back to a heuristic estimator.
-        """
-        cleaned = text or ""
-        if not cleaned:
-            return 0
-
-        try:
-            import tiktoken  # type: ignore
-
-            encoding = None
-            if model:
-                try:
-                    encoding = tiktoken.encoding_for_model(model)
-                except Exception:
-                    encoding = None
-            if encoding is None:
-                encoding = tiktoken.get_encoding("cl100k_base")
-            return len(encoding.encode(cleaned))
-        except Exception:
-            return self._estimate_tokens(cleaned)
+        """Token count via the shared, memoized counter (heuristic without `tiktoken`)."""
+        return count_tokens(text or "", model=model)
 
     def _truncate_middle(self, text: str, max_chars: int) -> str:
         if max_chars <= 0 or len(text) <= max_chars:
@@ -103,23 +173,8 @@ class FinancialSituationMemory:
     def _shrink_to_token_budget(
         self, text: str, token_budget: int, *, model: str | None = None
     ) -> str:
-        token_budget = max(64, int(token_budget))
-        current_tokens = self._count_tokens(text, model=model)
-        if current_tokens <= token_budget:
-            return text
-
-        candidate = text
-        for _ in range(10):
-            current_tokens = self._count_tokens(candidate, model=model)
-            if current_tokens <= token_budget:
-                return candidate
-
-            scale = token_budget / max(current_tokens, 1)
-            max_chars = int(len(candidate) * scale * 0.9)
-            candidate = self._truncate_middle(candidate, max_chars=max(200, max_chars))
-
-        # Defensive fallback
-        return self._truncate_middle(candidate, max_chars=max(200, len(candidate) // 2))
+        # Encodes once and cuts the middle out of the token array.
+        return truncate_to_tokens(text, max(64, int(token_budget)), model=model, keep="middle")
 
     def _ollama_extra_body(self) -> Dict[str, Any] | None:
         if self._config.get("backend_url") != "http://localhost:11434/v1":
@@ -141,37 +196,31 @@ class FinancialSituationMemory:
                 "final_tokens_est": source_tokens_est,
             }
 
-        cache_key = hashlib.sha256(cleaned.encode("utf-8")).hexdigest()
-        cached = self._summary_cache.get(cache_key)
-        if cached is not None:
-            return cached, {
-                "mode": "summarized_cached",
-                "source_tokens_est": source_tokens_est,
-                "final_tokens_est": self._count_tokens(cached, model=self.embedding),
-            }
-
-        prepared = self._summarize_for_embedding(cleaned)
-        prepared = self._shrink_to_token_budget(
-            prepared, token_budget=token_budget, model=self.embedding
-        )
-
-        if (
-            self.embedding_summary_cache_max_items > 0
-            and len(self._summary_cache) >= self.embedding_summary_cache_max_items
-        ):
-            self._summary_cache.clear()
-        self._summary_cache[cache_key] = prepared
-
-        if self.embedding_log_summarization:
-            self._log.info(
-                "Summarized embedding text (%s -> %s tokens est, model=%s)",
-                source_tokens_est,
-                self._count_tokens(prepared, model=self.embedding),
-                self.quick_llm_model,
+        def _summarize() -> str:
+            prepared = self._summarize_for_embedding(cleaned)
+            prepared = self._shrink_to_token_budget(
+                prepared, token_budget=token_budget, model=self.embedding
             )
+            if self.embedding_log_summarization:
+                self._log.info(
+                    "Summarized embedding text (%s -> %s tokens est, model=%s)",
+                    source_tokens_est,
+                    self._count_tokens(prepared, model=self.embedding),
+                    self.quick_llm_model,
+                )
+            computed.append(prepared)
+            return prepared
+
+        computed: list[str] = []
+        if self._summary_cache is None:
+            prepared = _summarize()
+        else:
+            # Summaries depend on the summarizer, the embedding tokenizer and the budget.
+            namespace = f"{self.quick_llm_model}-{self.embedding}-{token_budget}"
+            prepared = self._summary_cache.get_or_compute(namespace, cleaned, _summarize)
 
         return prepared, {
-            "mode": "summarized",
+            "mode": "summarized" if computed else "summarized_cached",
             "source_tokens_est": source_tokens_est,
             "final_tokens_est": self._count_tokens(prepared, model=self.embedding),
         }
@@ -244,6 +293,16 @@ class FinancialSituationMemory:
             return safe_text
 
     def _embed_prepared_text(self, prepared_text: str) -> list[float]:
+        if self._embedding_cache is None:
+            return self._request_embedding(prepared_text)
+        return self._embedding_cache.get_or_compute(
+            self.embedding, prepared_text, lambda: self._request_embedding(prepared_text)
+        )
+
+    def _request_embedding(self, prepared_text: str) -> list[float]:
+        if self._local_embedder is not None:
+            return self._local_embedder.embed([prepared_text])[0]
+
         kwargs: Dict[str, Any] = {}
         extra_body = self._ollama_extra_body()
         if extra_body:
@@ -276,71 +335,370 @@ class FinancialSituationMemory:
                     return response.data[0].embedding
             raise
 
+    def _request_embeddings(self, prepared_texts: List[str]) -> List[list[float]]:
+        """One embeddings call for a batch; falls back to per-text requests on context errors."""
+        if self._local_embedder is not None:
+            return self._local_embedder.embed(prepared_texts)
+
+        kwargs: Dict[str, Any] = {}
+        extra_body = self._ollama_extra_body()
+        if extra_body:
+            kwargs["extra_body"] = extra_body
+
+        try:
+            response = self.client.embeddings.create(
+                model=self.embedding,
+                input=prepared_texts,
+                encoding_format="float",
+                **kwargs,
+            )
+        except Exception as exc:
+            msg = str(exc).lower()
+            if len(prepared_texts) > 1 and ("maximum context length" in msg or "context length" in msg):
+                # Let the single-text path shrink whichever input is over the limit.
+                return [self._request_embedding(text) for text in prepared_texts]
+            raise
+        data = sorted(response.data, key=lambda item: getattr(item, "index", 0))
+        return [item.embedding for item in data]
+
+    def _chunk_for_embedding(self, prepared_texts: List[str]) -> List[List[str]]:
+        """Split texts into request batches bounded by item count and total tokens."""
+        batches: List[List[str]] = []
+        current: List[str] = []
+        current_tokens = 0
+        for text in prepared_texts:
+            tokens = self._count_tokens(text, model=self.embedding)
+            if current and (
+                len(current) >= self.embedding_batch_size
+                or current_tokens + tokens > self.embedding_batch_max_tokens
+            ):
+                batches.append(current)
+                current, current_tokens = [], 0
+            current.append(text)
+            current_tokens += tokens
+        if current:
+            batches.append(current)
+        return batches
+
+    def _embed_prepared_texts(self, prepared_texts: List[str]) -> List[list[float]]:
+        """Embed many prepared texts, serving repeats from the shared cache and batching the rest."""
+        embeddings: Dict[str, list[float]] = {}
+        missing: List[str] = []
+        for text in dict.fromkeys(prepared_texts):
+            cached = self._embedding_cache.get(self.embedding, text) if self._embedding_cache else None
+            if cached is not None:
+                embeddings[text] = cached
+            else:
+                missing.append(text)
+
+        for batch in self._chunk_for_embedding(missing):
+            for text, embedding in zip(batch, self._request_embeddings(batch)):
+                embeddings[text] = embedding
+                if self._embedding_cache is not None:
+                    self._embedding_cache.put(self.embedding, text, embedding)
+
+        return [embeddings[text] for text in prepared_texts]
+
+    def _index_vectors(self, embeddings: List[list[float]]) -> List[list[float]]:
+        """Vectors as stored and queried in the bank (truncated and re-normalized if configured)."""
+        if not self.embedding_dimensions:
+            return embeddings
+        matrix = np.asarray(embeddings, dtype=np.float32)[:, : self.embedding_dimensions]
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return (matrix / norms).tolist()
+
+    def cache_stats(self) -> Dict[str, Dict[str, float]]:
+        """Hit/miss counters of the shared embedding and summary caches."""
+        return {
+            "embedding": self._embedding_cache.stats() if self._embedding_cache else {},
+            "summary": self._summary_cache.stats() if self._summary_cache else {},
+        }
+
     def get_embedding(self, text):
         """Get embedding for a text (auto-summarizes when too long)."""
         prepared_text, _ = self.prepare_text_for_embedding(text)
         return self._embed_prepared_text(prepared_text)
 
-    def add_situations(self, situations_and_advice):
-        """Add financial situations and their corresponding advice. Parameter is a list of tuples (situation, rec)"""
+    def add_situations(
+        self,
+        situations_and_advice,
+        metadata: Dict[str, Any] | None = None,
+        embeddings: List[list[float]] | None = None,
+    ):
+        """
+        Add financial situations and their corresponding advice. Parameter is a list of tuples (situation, rec).
+
+        `metadata` (scalar values only) is stored on every added row, e.g.
+        `{"returns_losses": 0.042, "ticker": "NVDA", "date": "2024-05-10"}`; with a ticker the
+        `market` and `sector` partition tags are filled in. `embeddings` (from `embed_queries`
+        of the same situations) skips the embedding call when banks share an embedding setup.
+        """
 
         situations = []
-        ids = []
-        embeddings = []
+        prepared_texts = []
         metadatas = []
+        added_at = time.time()
+        extra = {
+            key: value
+            for key, value in (metadata or {}).items()
+            if isinstance(value, (str, int, float, bool))
+        }
+        if extra.get("ticker"):
+            extra = {
+                **situation_tags(extra["ticker"], extra.get("date"), self._config),
+                **extra,
+                "ticker": normalize_ticker(extra["ticker"]),
+            }
+        else:
+            extra["ticker"] = UNTAGGED
 
-        offset = self.situation_collection.count()
-
-        for i, (situation, recommendation) in enumerate(situations_and_advice):
+        for situation, recommendation in situations_and_advice:
             situations.append(situation)
-            ids.append(str(offset + i))
             prepared_text, info = self.prepare_text_for_embedding(situation)
-            embeddings.append(self._embed_prepared_text(prepared_text))
+            prepared_texts.append(prepared_text)
 
-            metadata: Dict[str, Any] = {"recommendation": recommendation}
+            row_metadata: Dict[str, Any] = {"recommendation": recommendation, "added_at": added_at, **extra}
             if info["mode"].startswith("summarized"):
-                metadata["embedding_summary"] = prepared_text
-                metadata["embedding_summary_source_tokens_est"] = info["source_tokens_est"]
-            metadatas.append(metadata)
+                row_metadata["embedding_summary"] = prepared_text
+                row_metadata["embedding_summary_source_tokens_est"] = info["source_tokens_est"]
+            metadatas.append(row_metadata)
 
+        if not situations:
+            return
+
+        if embeddings is None:
+            embeddings = self._embed_prepared_texts(prepared_texts)
+        embeddings = self._index_vectors(embeddings)
+        replaced_ids = self._find_near_duplicates(embeddings, metadatas)
+
+        # Ids are allocated by the shared collection under its write lock.
         self.situation_collection.add(
             documents=situations,
             metadatas=metadatas,
             embeddings=embeddings,
-            ids=ids,
         )
+        if replaced_ids:
+            self.situation_collection.delete(ids=replaced_ids)
+
+        if self.retention.needs_compaction(self.situation_collection.count()):
+            self.compact()
+
+    def _find_near_duplicates(self, embeddings, metadatas) -> List[str]:
+        """
+        Ids of stored rows that the new rows supersede (cosine >= `memory_dedupe_threshold`).
+        The new row inherits the replaced row's `merged_count`.
+        """
+        threshold = self.retention.dedupe_threshold
+        if threshold <= 0 or self.situation_collection.count() == 0:
+            return []
+
+        # Only rows of the same ticker (or untagged rows with untagged rows) are merged.
+        nearest = self.situation_collection.query(
+            query_embeddings=embeddings,
+            n_results=1,
+            include=["metadatas"],
+            where={"ticker": metadatas[0]["ticker"]},
+        )
+        candidate_ids = [row_ids[0] for row_ids in nearest["ids"] if row_ids]
+        if not candidate_ids:
+            return []
+        stored = self.situation_collection.get(ids=list(set(candidate_ids)), include=["embeddings", "metadatas"])
+        stored_vectors = {
+            row_id: (np.asarray(vector, dtype=np.float32), row_metadata or {})
+            for row_id, vector, row_metadata in zip(stored["ids"], stored["embeddings"], stored["metadatas"])
+        }
+
+        replaced: List[str] = []
+        for row, row_ids in enumerate(nearest["ids"]):
+            if not row_ids or row_ids[0] not in stored_vectors or row_ids[0] in replaced:
+                continue
+            vector, stored_metadata = stored_vectors[row_ids[0]]
+            new_vector = np.asarray(embeddings[row], dtype=np.float32)
+            denominator = float(np.linalg.norm(vector) * np.linalg.norm(new_vector)) or 1.0
+            if float(vector @ new_vector) / denominator >= threshold:
+                replaced.append(row_ids[0])
+                metadatas[row]["merged_count"] = int(stored_metadata.get("merged_count", 1)) + 1
+        return replaced
+
+    def compact(self) -> Dict[str, Any]:
+        """Merge near-duplicates and evict down to `memory_max_items`; returns before/after metrics."""
+        metrics = compact_collection(self.situation_collection, self.retention)
+        self._log.info(
+            "Compacted memory bank '%s': %s -> %s rows (%s merged, %s evicted), query %.2f -> %.2f ms",
+            self.name,
+            metrics["size_before"],
+            metrics["size_after"],
+            metrics["merged"],
+            metrics["evicted"],
+            metrics["latency_ms_before"],
+            metrics["latency_ms_after"],
+        )
+        return metrics
 
-    def get_memories(self, current_situation, n_matches=1):
+    def get_memories(self, current_situation, n_matches=1, ticker: str | None = None):
         """Find matching recommendations using OpenAI embeddings"""
-        prepared_text, _ = self.prepare_text_for_embedding(current_situation)
-        query_embedding = self._embed_prepared_text(prepared_text)
+        return self.get_memories_many([current_situation], n_matches=n_matches, ticker=ticker)[0]
+
+    def _partition_route(self, ticker: str | None) -> List[Dict[str, Any] | None]:
+        """Where-filters to try in order (None = the whole bank); untagged rows come last before the whole bank."""
+        if not ticker or not self.partition_scopes:
+            return [None]
+        route: List[Dict[str, Any] | None] = list(
+            partition_filters(situation_tags(ticker, None, self._config), self.partition_scopes)
+        )
+        if not route:
+            return [None]
+        route.append({"ticker": UNTAGGED})
+        if self.partition_fallback_global:
+            route.append(None)
+        return route
+
+    def get_memories_many(self, situations, n_matches=1, ticker: str | None = None):
+        """
+        Retrieve matches for several situations with one embedding batch and one query per partition.
 
-        results = self.situation_collection.query(
-            query_embeddings=[query_embedding],
-            n_results=n_matches,
-            include=["metadatas", "documents", "distances"],
+        With `ticker`, the search is pre-filtered to that ticker's partition and widened
+        (sector, market, ...) only for situations that still have fewer than `n_matches`.
+        Returns one list of matches (same shape as `get_memories`) per input situation.
+        """
+        situations = list(situations)
+        if not situations:
+            return []
+        return self.search_embeddings(self.embed_queries(situations), n_matches=n_matches, ticker=ticker)
+
+    def embedding_key(self) -> tuple:
+        """Banks with equal keys embed a given situation identically and can share `embed_queries`."""
+        return (
+            self.embedding,
+            self._config.get("backend_url"),
+            self.embedding_summarize_enabled,
+            self.embedding_context_length_tokens - self.embedding_summarize_margin_tokens,
+            self.quick_llm_model,
         )
 
-        matched_results = []
-        for i in range(len(results["documents"][0])):
-            metadata = (results.get("metadatas") or [[{}]])[0][i] or {}
-            matched_document = results["documents"][0][i]
-            matched_summary = metadata.get("embedding_summary")
-
-            # Prefer the embedding summary for readability; fall back to a truncated raw document.
-            display_situation = matched_summary or matched_document
-            if isinstance(display_situation, str) and len(display_situation) > 4000:
-                display_situation = self._truncate_middle(display_situation, max_chars=4000)
-
-            matched_results.append(
-                {
-                    "matched_situation": display_situation,
-                    "recommendation": metadata.get("recommendation", ""),
-                    "similarity_score": 1 - results["distances"][0][i],
-                }
+    def embed_queries(self, situations) -> List[list[float]]:
+        """Full-width embeddings of `situations` (prepared and summarized as for storage)."""
+        prepared_texts = [self.prepare_text_for_embedding(s)[0] for s in situations]
+        return self._embed_prepared_texts(prepared_texts)
+
+    def search_embeddings(self, query_embeddings, n_matches=1, ticker: str | None = None):
+        """`get_memories_many` for situations already embedded with `embed_queries`."""
+        if len(query_embeddings) == 0:
+            return []
+        query_embeddings = self._index_vectors(query_embeddings)
+
+        # Per situation: (id, document, metadata, distance), narrowest partition first.
+        found: List[List[Tuple[str, str, Dict[str, Any], float]]] = [[] for _ in query_embeddings]
+        pending = list(range(len(query_embeddings)))
+        for where in self._partition_route(ticker):
+            if not pending:
+                break
+            results = self.situation_collection.query(
+                query_embeddings=[query_embeddings[q] for q in pending],
+                # Wider partitions contain the rows already found; ask for enough to skip them.
+                n_results=n_matches + max(len(found[q]) for q in pending),
+                include=["metadatas", "documents", "distances"],
+                **({"where": where} if where else {}),
+            )
+            for j, q in enumerate(pending):
+                seen = {row[0] for row in found[q]}
+                metadatas = (results.get("metadatas") or [[]] * len(pending))[j] or []
+                for i, row_id in enumerate(results["ids"][j]):
+                    if len(found[q]) >= n_matches:
+                        break
+                    if row_id in seen:
+                        continue
+                    metadata = (metadatas[i] if i < len(metadatas) else None) or {}
+                    found[q].append((row_id, results["documents"][j][i], metadata, results["distances"][j][i]))
+            pending = [q for q in pending if len(found[q]) < n_matches]
+
+        all_matches = []
+        for rows in found:
+            matched_results = []
+            for _, matched_document, metadata, distance in rows:
+                matched_summary = metadata.get("embedding_summary")
+
+                # Prefer the embedding summary for readability; fall back to a truncated raw document.
+                display_situation = matched_summary or matched_document
+                if isinstance(display_situation, str) and len(display_situation) > 4000:
+                    display_situation = self._truncate_middle(display_situation, max_chars=4000)
+
+                matched_results.append(
+                    {
+                        "matched_situation": display_situation,
+                        "recommendation": metadata.get("recommendation", ""),
+                        "similarity_score": 1 - distance,
+                        "ticker": metadata.get("ticker"),
+                        "date": metadata.get("date"),
+                    }
+                )
+            all_matches.append(matched_results)
+
+        return all_matches
+
+    def export_snapshot(self, path) -> int:
+        """
+        Write every stored situation (documents, metadata and vectors) to a single `.npz` file.
+
+        Returns the number of exported rows.
+        """
+        data = self.situation_collection.get(include=["documents", "metadatas", "embeddings"])
+        ids = list(data.get("ids") or [])
+        embeddings = data.get("embeddings")
+        if embeddings is None or len(ids) == 0:
+            embeddings = np.zeros((0, 0), dtype=np.float32)
+
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "wb") as f:
+            np.savez(
+                f,
+                ids=np.asarray(ids, dtype=str),
+                documents=np.asarray(data.get("documents") or [], dtype=str),
+                metadatas=np.asarray(
+                    [json.dumps(m or {}, ensure_ascii=False) for m in (data.get("metadatas") or [])],
+                    dtype=str,
+                ),
+                embeddings=np.asarray(embeddings, dtype=np.float32),
+                embedding_model=np.asarray(self.embedding),
+                name=np.asarray(self.name),
             )
+        return len(ids)
 
-        return matched_results
+    def import_snapshot(self, path, replace: bool = True) -> int:
+        """
+        Load a snapshot written by `export_snapshot` without re-embedding anything.
+
+        With `replace`, the bank's existing rows are removed first. Raises ValueError when
+        the snapshot was built with a different embedding model.
+        """
+        with np.load(Path(path), allow_pickle=False) as snapshot:
+            snapshot_model = str(snapshot["embedding_model"])
+            if snapshot_model != self.embedding:
+                raise ValueError(
+                    f"Snapshot {path} uses embedding model {snapshot_model}, "
+                    f"but memory '{self.name}' is configured for {self.embedding}"
+                )
+            ids = snapshot["ids"].tolist()
+            documents = snapshot["documents"].tolist()
+            metadatas = [with_partition_tag(json.loads(m)) for m in snapshot["metadatas"].tolist()]
+            embeddings = snapshot["embeddings"]
+
+        if replace:
+            existing = self.situation_collection.get(include=[])["ids"]
+            for start in range(0, len(existing), _IMPORT_CHUNK_SIZE):
+                self.situation_collection.delete(ids=existing[start:start + _IMPORT_CHUNK_SIZE])
+
+        for start in range(0, len(ids), _IMPORT_CHUNK_SIZE):
+            end = start + _IMPORT_CHUNK_SIZE
+            self.situation_collection.upsert(
+                ids=ids[start:end],
+                documents=documents[start:end],
+                metadatas=metadatas[start:end],
+                embeddings=embeddings[start:end],
+            )
+        return len(ids)
 
 
 if __name__ == "__main__":
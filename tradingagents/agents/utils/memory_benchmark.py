@@ -0,0 +1,133 @@
+"""
+Recall@k benchmark for compressed memory banks.
+
+Compares each (dimensions, quantization) setting of the numpy vector backend with exact
+full-width float32 search and reports recall@k, resident vector bytes and query time:
+
+    python -m tradingagents.agents.utils.memory_benchmark --snapshot bull_memory.npz
+    python -m tradingagents.agents.utils.memory_benchmark --rows 20000 --dim 3072
+
+`--snapshot` takes a bank exported with `FinancialSituationMemory.export_snapshot` and
+uses a held-out slice of its vectors as queries. Without it, synthetic vectors with
+variance concentrated in the leading dimensions (as in Matryoshka-trained models) are used;
+recall from real embeddings is the number to trust.
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from typing import Dict, List, Sequence
+
+import numpy as np
+
+from .numpy_store import NumpyCollection
+
+
+def _normalize(matrix: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return (matrix / norms).astype(np.float32)
+
+
+def _truncate(matrix: np.ndarray, dimensions: int) -> np.ndarray:
+    return _normalize(matrix[:, :dimensions]) if dimensions else matrix
+
+
+def synthetic_vectors(rows: int, dim: int, seed: int = 0) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    scale = 1.0 / np.sqrt(1.0 + np.arange(dim) / 32.0)
+    return _normalize(rng.normal(size=(rows, dim)).astype(np.float32) * scale)
+
+
+def _top_ids(collection: NumpyCollection, queries: np.ndarray, k: int) -> List[List[str]]:
+    return collection.query(query_embeddings=queries, n_results=k)["ids"]
+
+
+def run_benchmark(
+    vectors: np.ndarray,
+    queries: np.ndarray,
+    k: int = 5,
+    dimensions: Sequence[int] = (0, 1024, 512, 256),
+    quantizations: Sequence[str] = ("none", "float16", "int8"),
+    rescore_factor: int = 4,
+) -> List[Dict[str, float]]:
+    """Recall@k of every setting against exact full-width float32 search."""
+    ids = [str(i) for i in range(len(vectors))]
+    empty = [None] * len(vectors)
+
+    baseline = NumpyCollection("baseline")
+    baseline.upsert(ids=ids, documents=ids, metadatas=empty, embeddings=vectors)
+    truth = _top_ids(baseline, queries, k)
+
+    rows = []
+    for dims in dimensions:
+        if dims and dims >= vectors.shape[1]:
+            continue
+        bank_vectors = _truncate(vectors, dims)
+        bank_queries = _truncate(queries, dims)
+        for quantization in quantizations:
+            # Quantized banks are measured without rescoring (smallest RAM) and with it.
+            factors = [0] if quantization == "none" else sorted({0, rescore_factor})
+            for factor in factors:
+                collection = NumpyCollection("bench", quantization=quantization, rescore_factor=factor)
+                collection.upsert(ids=ids, documents=ids, metadatas=empty, embeddings=bank_vectors)
+
+                start = time.perf_counter()
+                found = _top_ids(collection, bank_queries, k)
+                elapsed_ms = (time.perf_counter() - start) * 1000 / max(1, len(queries))
+
+                hits = sum(len(set(a) & set(b)) for a, b in zip(found, truth))
+                rows.append(
+                    {
+                        "dimensions": dims or vectors.shape[1],
+                        "quantization": quantization,
+                        "rescore_factor": factor if factor > 1 else 0,
+                        "recall_at_k": hits / (k * len(queries)),
+                        "vector_mb": collection.memory_bytes() / 1e6,
+                        "query_ms": elapsed_ms,
+                    }
+                )
+    return rows
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--snapshot", help="bank snapshot (.npz) from export_snapshot")
+    parser.add_argument("--rows", type=int, default=10000, help="synthetic bank size")
+    parser.add_argument("--dim", type=int, default=3072, help="synthetic embedding width")
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--k", type=int, default=5)
+    parser.add_argument("--dimensions", default="0,1024,512,256", help="comma-separated; 0 = full width")
+    parser.add_argument("--rescore-factor", type=int, default=4, help="0 or 1 disables rescoring")
+    args = parser.parse_args(argv)
+
+    if args.snapshot:
+        with np.load(args.snapshot, allow_pickle=False) as snapshot:
+            data = _normalize(np.asarray(snapshot["embeddings"], dtype=np.float32))
+        n_queries = min(args.queries, max(1, len(data) // 10))
+        vectors, queries = data[:-n_queries], data[-n_queries:]
+    else:
+        data = synthetic_vectors(args.rows + args.queries, args.dim)
+        vectors, queries = data[: args.rows], data[args.rows :]
+
+    rows = run_benchmark(
+        vectors,
+        queries,
+        k=args.k,
+        dimensions=[int(d) for d in args.dimensions.split(",") if d.strip()],
+        rescore_factor=args.rescore_factor,
+    )
+
+    print(f"{len(vectors)} vectors x {vectors.shape[1]} dims, {len(queries)} queries, k={args.k}")
+    print(f"{'dims':>6} {'quant':>8} {'rescore':>8} {'recall@k':>9} {'vector MB':>10} {'ms/query':>9}")
+    for row in rows:
+        rescore = f"x{row['rescore_factor']}" if row["rescore_factor"] else "-"
+        print(
+            f"{row['dimensions']:>6} {row['quantization']:>8} {rescore:>8} {row['recall_at_k']:>9.3f} "
+            f"{row['vector_mb']:>10.1f} {row['query_ms']:>9.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
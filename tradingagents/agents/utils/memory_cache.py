@@ -0,0 +1,224 @@
+"""
+Process-wide caches shared by every `FinancialSituationMemory` instance.
+
+A single run queries five memories with (nearly) the same situation text and then
+reflects the same situation into all five again; these caches make each distinct
+text cost one embedding (and at most one summarization) call per process, and, when
+persisted, per cache directory.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import io
+import re
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, Tuple
+
+import numpy as np
+
+from tradingagents.dataflows.cache_utils import atomic_write_bytes
+
+
+def text_digest(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def _safe_dirname(name: str) -> str:
+    return re.sub(r"[^A-Za-z0-9._-]+", "_", name) or "default"
+
+
+class _PersistentLRU:
+    """
+    Thread-safe LRU keyed by (namespace, sha256(text)), optionally mirrored to one
+    file per entry under `cache_dir/<namespace>/`. Concurrent misses on the same key
+    are single-flighted through `get_or_compute`.
+    """
+
+    suffix = ".bin"
+
+    def __init__(self, max_items: int, cache_dir: str | Path | None = None):
+        self.max_items = int(max_items)
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self._entries: "OrderedDict[Tuple[str, str], Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._key_locks: Dict[Tuple[str, str], threading.Lock] = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _encode(self, value: Any) -> bytes:
+        raise NotImplementedError
+
+    def _decode(self, payload: bytes) -> Any:
+        raise NotImplementedError
+
+    def _path(self, key: Tuple[str, str]) -> Path | None:
+        if self.cache_dir is None:
+            return None
+        namespace, digest = key
+        return self.cache_dir / _safe_dirname(namespace) / digest[:2] / f"{digest}{self.suffix}"
+
+    def _remember(self, key: Tuple[str, str], value: Any) -> None:
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while self.max_items > 0 and len(self._entries) > self.max_items:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def _lookup(self, key: Tuple[str, str]) -> Any | None:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+                return value
+
+        path = self._path(key)
+        if path is not None and path.exists():
+            try:
+                value = self._decode(path.read_bytes())
+            except Exception:
+                return None
+            self._remember(key, value)
+            return value
+        return None
+
+    def _count(self, hit: bool) -> None:
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def get(self, namespace: str, text: str) -> Any | None:
+        value = self._lookup((namespace, text_digest(text)))
+        self._count(value is not None)
+        return value
+
+    def put(self, namespace: str, text: str, value: Any) -> None:
+        key = (namespace, text_digest(text))
+        self._remember(key, value)
+        path = self._path(key)
+        if path is not None:
+            try:
+                atomic_write_bytes(path, self._encode(value))
+            except Exception:
+                pass
+
+    def get_or_compute(self, namespace: str, text: str, compute: Callable[[], Any]) -> Any:
+        key = (namespace, text_digest(text))
+        value = self._lookup(key)
+        if value is None:
+            with self._lock:
+                key_lock = self._key_locks.setdefault(key, threading.Lock())
+            with key_lock:
+                # Another thread may have computed it while we waited.
+                value = self._lookup(key)
+                if value is None:
+                    value = compute()
+                    self.put(namespace, text, value)
+                    with self._lock:
+                        self._key_locks.pop(key, None)
+                    self._count(False)
+                    return value
+        self._count(True)
+        return value
+
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "items": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": (self.hits / total) if total else 0.0,
+            }
+
+    def clear(self) -> None:
+        """Drop in-memory entries and reset stats (persisted files are kept)."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+
+class EmbeddingCache(_PersistentLRU):
+    """Embeddings keyed by (model, sha256(prepared_text)); persisted as float32 `.npy` files."""
+
+    suffix = ".npy"
+
+    def __init__(self, max_items: int = 4096, cache_dir: str | Path | None = None):
+        super().__init__(max_items=max_items, cache_dir=cache_dir)
+
+    def _encode(self, value: list[float]) -> bytes:
+        buffer = io.BytesIO()
+        np.save(buffer, np.asarray(value, dtype=np.float32))
+        return buffer.getvalue()
+
+    def _decode(self, payload: bytes) -> list[float]:
+        return np.load(io.BytesIO(payload)).tolist()
+
+
+class SummaryCache(_PersistentLRU):
+    """
+    Embedding summaries keyed by (summarizer model + token budget, sha256(source text));
+    persisted as UTF-8 text files.
+    """
+
+    suffix = ".txt"
+
+    def __init__(self, max_items: int = 256, cache_dir: str | Path | None = None):
+        super().__init__(max_items=max_items, cache_dir=cache_dir)
+
+    def _encode(self, value: str) -> bytes:
+        return value.encode("utf-8")
+
+    def _decode(self, payload: bytes) -> str:
+        return payload.decode("utf-8")
+
+
+_EMBEDDING_CACHES: Dict[Tuple[int, str | None], EmbeddingCache] = {}
+_EMBEDDING_CACHES_LOCK = threading.Lock()
+
+
+def get_embedding_cache(config: dict) -> EmbeddingCache | None:
+    """Shared cache for the given config, or None when `embedding_cache_enabled` is off."""
+    if not config.get("embedding_cache_enabled", True):
+        return None
+    max_items = int(config.get("embedding_cache_max_items", 4096))
+    cache_dir = None
+    if config.get("embedding_cache_persist", True) and config.get("data_cache_dir"):
+        cache_dir = str(Path(config["data_cache_dir"]) / "embeddings")
+    key = (max_items, cache_dir)
+    with _EMBEDDING_CACHES_LOCK:
+        cache = _EMBEDDING_CACHES.get(key)
+        if cache is None:
+            cache = EmbeddingCache(max_items=max_items, cache_dir=cache_dir)
+            _EMBEDDING_CACHES[key] = cache
+        return cache
+
+
+_SUMMARY_CACHES: Dict[Tuple[int, str | None], SummaryCache] = {}
+_SUMMARY_CACHES_LOCK = threading.Lock()
+
+
+def get_summary_cache(config: dict) -> SummaryCache | None:
+    """Shared summary cache for the given config, or None when `embedding_summary_cache_max_items` is 0."""
+    max_items = int(config.get("embedding_summary_cache_max_items", 256))
+    if max_items <= 0:
+        return None
+    cache_dir = None
+    if config.get("embedding_summary_cache_persist", True) and config.get("data_cache_dir"):
+        cache_dir = str(Path(config["data_cache_dir"]) / "embedding_summaries")
+    key = (max_items, cache_dir)
+    with _SUMMARY_CACHES_LOCK:
+        cache = _SUMMARY_CACHES.get(key)
+        if cache is None:
+            cache = SummaryCache(max_items=max_items, cache_dir=cache_dir)
+            _SUMMARY_CACHES[key] = cache
+        return cache
@@ -0,0 +1,144 @@
+"""
+Partition tags for memory banks.
+
+Every stored situation is tagged with `ticker`, `date`, `market` and (when known) `sector`,
+and a query for a ticker is routed through progressively wider partitions
+(`memory_partition_scopes`, default ticker -> sector -> market) until it has `n_matches`
+results. Each step is a metadata pre-filter applied before the vector search, so the
+search cost depends on the partition size rather than on the whole bank. Rows stored
+without a ticker (general lessons, and banks written before partitioning) carry an empty
+`ticker` tag and form a last partition; lessons from other names are not returned unless
+`memory_partition_fallback_global` allows it.
+
+Sectors come from `memory_sector_map`. With `memory_sector_lookup` on, unmapped tickers are
+looked up on yfinance once per run (`resolve_sector`, called before the graph starts);
+tagging and routing only read the map and the remembered lookups, never the network.
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+import threading
+from typing import Any, Dict, List
+
+PARTITION_FIELDS = ("ticker", "sector", "market")
+
+# `ticker` tag of rows not tied to a ticker.
+UNTAGGED = ""
+
+# Exchange suffixes (Yahoo style) mapped to a market code.
+_MARKET_SUFFIXES = {
+    "SS": "CN",
+    "SH": "CN",
+    "SZ": "CN",
+    "BJ": "CN",
+    "HK": "HK",
+    "T": "JP",
+    "L": "UK",
+    "TO": "CA",
+    "V": "CA",
+    "AX": "AU",
+    "DE": "DE",
+    "PA": "FR",
+    "KS": "KR",
+    "KQ": "KR",
+    "TW": "TW",
+    "NS": "IN",
+    "BO": "IN",
+}
+
+
+def normalize_ticker(ticker: str) -> str:
+    return str(ticker or "").strip().upper()
+
+
+def infer_market(ticker: str) -> str:
+    """Market code from the ticker's format: A-share codes and exchange suffixes, else "US"."""
+    ticker = normalize_ticker(ticker)
+    if re.fullmatch(r"(SH|SZ|BJ)?\d{6}", ticker):
+        return "CN"
+    if "." in ticker:
+        return _MARKET_SUFFIXES.get(ticker.rsplit(".", 1)[1], "OTHER")
+    return "US"
+
+
+def _yahoo_symbol(ticker: str) -> str:
+    """Bare A-share codes need an exchange suffix for Yahoo lookups."""
+    match = re.fullmatch(r"(?:SH|SZ|BJ)?(\d{6})", ticker)
+    if not match:
+        return ticker
+    code = match.group(1)
+    return f"{code}.SS" if code.startswith(("5", "6", "9")) else f"{code}.SZ"
+
+
+# Sectors found by yfinance lookups; failed lookups are not remembered, so a later run retries.
+_LOOKED_UP_SECTORS: Dict[str, str] = {}
+_LOOKED_UP_SECTORS_MAX_ITEMS = 4096
+_LOOKUP_LOCK = threading.Lock()
+
+
+def _yfinance_sector(ticker: str) -> str:
+    try:
+        import yfinance as yf
+
+        return str(yf.Ticker(_yahoo_symbol(ticker)).info.get("sector") or "")
+    except Exception as e:
+        logging.getLogger(__name__).debug("Sector lookup failed for %s: %s", ticker, e)
+        return ""
+
+
+def lookup_sector(ticker: str, config: Dict[str, Any]) -> str:
+    """Sector from `memory_sector_map`, else from an earlier `resolve_sector`; "" when unknown."""
+    ticker = normalize_ticker(ticker)
+    sector_map = {normalize_ticker(k): v for k, v in (config.get("memory_sector_map") or {}).items()}
+    if ticker in sector_map:
+        return str(sector_map[ticker])
+    return _LOOKED_UP_SECTORS.get(ticker, "")
+
+
+def resolve_sector(ticker: str, config: Dict[str, Any]) -> str:
+    """`lookup_sector`, looking an unknown ticker up on yfinance if `memory_sector_lookup` is on."""
+    ticker = normalize_ticker(ticker)
+    sector = lookup_sector(ticker, config)
+    if sector or not ticker or not config.get("memory_sector_lookup", False):
+        return sector
+    sector = _yfinance_sector(ticker)
+    if sector:
+        with _LOOKUP_LOCK:
+            if len(_LOOKED_UP_SECTORS) >= _LOOKED_UP_SECTORS_MAX_ITEMS:
+                _LOOKED_UP_SECTORS.clear()
+            _LOOKED_UP_SECTORS[ticker] = sector
+    return sector
+
+
+def situation_tags(ticker: str, trade_date: str | None, config: Dict[str, Any]) -> Dict[str, str]:
+    """Partition tags stored with a situation; empty values are omitted."""
+    ticker = normalize_ticker(ticker)
+    if not ticker:
+        return {}
+    tags = {"ticker": ticker, "market": infer_market(ticker)}
+    sector = lookup_sector(ticker, config)
+    if sector:
+        tags["sector"] = sector
+    if trade_date:
+        tags["date"] = str(trade_date)
+    return tags
+
+
+def with_partition_tag(metadata: Dict[str, Any] | None) -> Dict[str, Any]:
+    """`metadata` with the untagged marker when it has no ticker."""
+    metadata = dict(metadata or {})
+    metadata.setdefault("ticker", UNTAGGED)
+    return metadata
+
+
+def partition_filters(tags: Dict[str, str], scopes) -> List[Dict[str, Any]]:
+    """Where-filters from narrowest to widest scope; scopes whose tag is unknown are skipped."""
+    filters = []
+    for scope in scopes:
+        if scope not in PARTITION_FIELDS:
+            raise ValueError(f"Unsupported memory partition scope '{scope}'; choose from {PARTITION_FIELDS}")
+        if tags.get(scope):
+            filters.append({scope: tags[scope]})
+    return filters
@@ -0,0 +1,64 @@
+"""
+Memory recall stage.
+
+Researchers, managers and the trader all consult their memory bank with the same situation
+(the four analyst reports). Instead of each node embedding and querying it again, and the
+bull/bear nodes doing so on every debate round, one "Memory Recall" node runs after the
+analysts: it embeds the situation once per distinct embedding setup, queries every role
+bank in parallel and stores the matches in `AgentState["past_memories"]`, keyed by bank name.
+
+Behaviour change: the risk manager used to query with the news report in place of the
+fundamentals report. It now uses `build_situation` like every other role. Reflection has
+always stored lessons under this text, so existing banks need no rebuild.
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List
+
+DEFAULT_MATCHES = 2
+
+
+def build_situation(state) -> str:
+    """The situation text memories are stored and recalled with."""
+    return (
+        f"{state['market_report']}\n\n{state['sentiment_report']}\n\n"
+        f"{state['news_report']}\n\n{state['fundamentals_report']}"
+    )
+
+
+def create_memory_recall(memories, n_matches: int = DEFAULT_MATCHES):
+    """Graph node recalling `n_matches` past lessons from every bank in `memories`."""
+    memories = list(memories)
+
+    def memory_recall_node(state) -> dict:
+        situation = build_situation(state)
+        ticker = state.get("company_of_interest")
+
+        # Banks sharing an embedding setup share one embedding call.
+        query_embeddings: Dict[tuple, List[list[float]]] = {}
+        for memory in memories:
+            key = memory.embedding_key()
+            if key not in query_embeddings:
+                query_embeddings[key] = memory.embed_queries([situation])
+
+        def _search(memory) -> List[Dict[str, Any]]:
+            return memory.search_embeddings(
+                query_embeddings[memory.embedding_key()], n_matches=n_matches, ticker=ticker
+            )[0]
+
+        with ThreadPoolExecutor(max_workers=max(1, len(memories))) as pool:
+            results = list(pool.map(_search, memories))
+
+        return {"past_memories": {memory.name: matches for memory, matches in zip(memories, results)}}
+
+    return memory_recall_node
+
+
+def recall_memories(state, memory, n_matches: int = DEFAULT_MATCHES) -> List[Dict[str, Any]]:
+    """Matches stored by the recall stage, or a direct query when the graph has no such stage."""
+    recalled = (state.get("past_memories") or {}).get(memory.name)
+    if recalled is not None:
+        return recalled[:n_matches]
+    return memory.get_memories(build_situation(state), n_matches=n_matches, ticker=state.get("company_of_interest"))
@@ -0,0 +1,266 @@
+"""
+Process-level registry of memory collections.
+
+`TradingAgentsGraph` is constructed once per run (the API server builds one per request),
+and every graph asks for the same role banks ("bull_memory", ...). The registry hands
+all graphs with the same embedding setup the same thread-safe `SharedCollection` for a
+given bank, so concurrent runs read and extend one set of learned memories instead of
+colliding on collection names.
+
+Two vector backends implement the same handle interface (`count`, `add`, `query`, `get`,
+`upsert`, `delete`, `rewrite`, `name`, `metadata`), selected by `memory_vector_backend`:
+
+- "chroma": `SharedCollection` wrapping a Chroma collection.
+- "numpy": `numpy_store.NumpyCollection`, an exact in-process index (no Chroma import).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+
+class _ReadWriteLock:
+    """Many concurrent readers or one writer; waiting writers block new readers."""
+
+    def __init__(self):
+        self._cond = threading.Condition(threading.Lock())
+        self._readers = 0
+        self._writer = False
+        self._writers_waiting = 0
+
+    @contextmanager
+    def read(self):
+        with self._cond:
+            while self._writer or self._writers_waiting:
+                self._cond.wait()
+            self._readers += 1
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._readers -= 1
+                if self._readers == 0:
+                    self._cond.notify_all()
+
+    @contextmanager
+    def write(self):
+        with self._cond:
+            self._writers_waiting += 1
+            while self._writer or self._readers:
+                self._cond.wait()
+            self._writers_waiting -= 1
+            self._writer = True
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._writer = False
+                self._cond.notify_all()
+
+
+def next_row_id(ids) -> int:
+    """Next free sequential id; rows may have been deleted, so the count is not enough."""
+    numeric = [int(i) for i in ids if str(i).isdigit()]
+    return max(numeric) + 1 if numeric else 0
+
+
+class SharedCollection:
+    """
+    Thread-safe handle to one Chroma collection.
+
+    Queries run concurrently; writes are exclusive, and `add` allocates ids under the
+    write lock so concurrent writers never reuse an id.
+    """
+
+    def __init__(self, collection):
+        self._collection = collection
+        self._lock = _ReadWriteLock()
+        self._next_id: int | None = None
+
+    @property
+    def name(self) -> str:
+        return self._collection.name
+
+    @property
+    def metadata(self) -> Dict[str, Any] | None:
+        return self._collection.metadata
+
+    def count(self) -> int:
+        with self._lock.read():
+            return self._collection.count()
+
+    def query(self, **kwargs):
+        with self._lock.read():
+            return self._collection.query(**kwargs)
+
+    def get(self, **kwargs):
+        with self._lock.read():
+            return self._collection.get(**kwargs)
+
+    def add(self, documents: List[str], metadatas: List[Dict[str, Any]], embeddings) -> List[str]:
+        """Append rows with sequential string ids; returns the ids assigned."""
+        with self._lock.write():
+            if self._next_id is None:
+                self._next_id = next_row_id(self._collection.get(include=[])["ids"])
+            ids = [str(self._next_id + i) for i in range(len(documents))]
+            self._next_id += len(ids)
+            self._collection.add(
+                documents=documents,
+                metadatas=metadatas,
+                embeddings=embeddings,
+                ids=ids,
+            )
+            return ids
+
+    def upsert(self, **kwargs) -> None:
+        with self._lock.write():
+            self._collection.upsert(**kwargs)
+            self._next_id = None
+
+    def delete(self, **kwargs) -> None:
+        with self._lock.write():
+            self._collection.delete(**kwargs)
+
+    def rewrite(self, documents: List[str], metadatas: List[Dict[str, Any]], embeddings, chunk_size: int = 4096) -> None:
+        """Replace every row with the given ones (re-numbered from 0) under one write lock."""
+        with self._lock.write():
+            existing = self._collection.get(include=[])["ids"]
+            for start in range(0, len(existing), chunk_size):
+                self._collection.delete(ids=existing[start:start + chunk_size])
+            for start in range(0, len(documents), chunk_size):
+                end = min(start + chunk_size, len(documents))
+                self._collection.add(
+                    ids=[str(i) for i in range(start, end)],
+                    documents=documents[start:end],
+                    metadatas=metadatas[start:end],
+                    embeddings=embeddings[start:end],
+                )
+            self._next_id = len(documents)
+
+
+def _check_embedding_model(shared, name: str, location: str, metadata: Dict[str, Any]) -> None:
+    stored_model = (shared.metadata or {}).get("embedding_model")
+    configured_model = metadata.get("embedding_model")
+    if stored_model and configured_model and stored_model != configured_model:
+        raise ValueError(
+            f"Memory bank '{name}' in {location} was built with embedding model {stored_model}, "
+            f"but {configured_model} is configured. Point memory_bank or memory_dir at a bank for "
+            f"this embedding setup, or rebuild the bank."
+        )
+
+
+class MemoryRegistry:
+    """
+    Get-or-create access to shared collections, keyed by backend, bank and role name.
+
+    In-process banks are also keyed by embedding model and width, so graphs with different
+    embedders never share vectors. A persistent bank is built with one embedder; opening it
+    with another raises instead of failing on the first query.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._ephemeral_client = None
+        self._persistent_clients: Dict[str, Any] = {}
+        self._collections: Dict[Tuple[Any, ...], Any] = {}
+
+    def _get_ephemeral_client(self):
+        if self._ephemeral_client is None:
+            import chromadb
+            from chromadb.config import Settings
+
+            self._ephemeral_client = chromadb.Client(Settings(allow_reset=True))
+        return self._ephemeral_client
+
+    def _get_persistent_client(self, path: str):
+        client = self._persistent_clients.get(path)
+        if client is None:
+            import chromadb
+            from chromadb.config import Settings
+
+            os.makedirs(path, exist_ok=True)
+            client = chromadb.PersistentClient(path=path, settings=Settings(allow_reset=True))
+            self._persistent_clients[path] = client
+        return client
+
+    def get_collection(self, name: str, config: Dict[str, Any], metadata: Dict[str, Any]):
+        """
+        Shared handle for bank `name`. `metadata` (embedding model, dimensions) is recorded
+        when the collection is created; an existing bank keeps the metadata it was built with.
+        Raises ValueError when a persistent bank was built with a different embedding model.
+        """
+        vector_backend = str(config.get("memory_vector_backend", "chroma")).lower()
+        if vector_backend not in ("chroma", "numpy"):
+            raise ValueError(f"Unsupported memory_vector_backend: {vector_backend}")
+        bank = str(config.get("memory_bank", "default"))
+        persistent = str(config.get("memory_backend", "ephemeral")).lower() == "persistent"
+        embedding = (metadata.get("embedding_model"), int(metadata.get("embedding_dimensions", 0) or 0))
+        if persistent:
+            location = os.path.abspath(Path(config.get("memory_dir", "./memory")) / bank)
+            collection_name = name
+            key: Tuple[Any, ...] = (vector_backend, "persistent", location, name)
+        else:
+            location = bank
+            # One in-process client holds every bank, so bank names and the embedding setup are
+            # folded into the collection name.
+            digest = hashlib.sha256(json.dumps(embedding).encode("utf-8")).hexdigest()[:8]
+            collection_name = f"{name}-{digest}" if bank == "default" else f"{bank}-{name}-{digest}"
+            key = (vector_backend, "ephemeral", location, name, embedding)
+
+        with self._lock:
+            shared = self._collections.get(key)
+            if shared is not None:
+                _check_embedding_model(shared, name, location, metadata)
+                return shared
+
+            if vector_backend == "numpy":
+                from .numpy_store import NumpyCollection
+
+                shared = NumpyCollection(
+                    collection_name,
+                    metadata=metadata,
+                    # Kept apart from Chroma's files in the same bank directory.
+                    path=Path(location) / "numpy" / name if persistent else None,
+                    mmap=bool(config.get("memory_numpy_mmap", False)),
+                    quantization=str(config.get("memory_quantization", "none")).lower(),
+                    rescore_factor=int(config.get("memory_rescore_factor", 4)),
+                )
+            else:
+                client = (
+                    self._get_persistent_client(location)
+                    if persistent
+                    else self._get_ephemeral_client()
+                )
+                if str(config.get("memory_quantization", "none")).lower() != "none":
+                    logging.getLogger(__name__).warning(
+                        "memory_quantization is only supported by the numpy vector backend; "
+                        "bank '%s' stores float32 vectors in Chroma.",
+                        name,
+                    )
+                collection = client.get_or_create_collection(name=collection_name, metadata=metadata)
+                shared = SharedCollection(collection)
+            _check_embedding_model(shared, name, location, metadata)
+            self._collections[key] = shared
+            return shared
+
+    def reset(self) -> None:
+        """Forget all handles and wipe in-process (ephemeral) banks; persistent banks stay on disk."""
+        with self._lock:
+            if self._ephemeral_client is not None:
+                self._ephemeral_client.reset()
+            self._ephemeral_client = None
+            self._collections.clear()
+
+
+_REGISTRY = MemoryRegistry()
+
+
+def get_memory_registry() -> MemoryRegistry:
+    return _REGISTRY
@@ -0,0 +1,166 @@
+"""
+Retention for memory banks: near-duplicate merging, bounded size and compaction.
+
+Reflection adds one situation per bank per run, so a long backtest fills banks with
+near-identical days that crowd out `n_matches=2` results and slow every query. A
+`RetentionPolicy` (configured per bank through `memory_bank_settings`) bounds that:
+
+- `dedupe_threshold`: rows of the same ticker whose cosine similarity is at least this are
+  merged into the newest one (its `merged_count` accumulates the merged rows).
+- `max_items`: beyond this, the lowest-value rows are evicted. With `eviction="oldest"` value
+  is recency; with `"weighted"` it is recency (half-life decay) times `1 + |returns_losses|`,
+  so lessons from large wins or losses outlive routine days.
+"""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List
+
+import numpy as np
+
+_SIMILARITY_BLOCK_ROWS = 1024
+_LATENCY_SAMPLE_QUERIES = 20
+
+
+@dataclass
+class RetentionPolicy:
+    max_items: int = 0
+    dedupe_threshold: float = 0.0
+    eviction: str = "weighted"
+    half_life_days: float = 180.0
+    # Compaction runs automatically once the bank exceeds max_items by this fraction.
+    compaction_slack: float = 0.1
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> "RetentionPolicy":
+        return cls(
+            max_items=int(config.get("memory_max_items", 0) or 0),
+            dedupe_threshold=float(config.get("memory_dedupe_threshold", 0.0) or 0.0),
+            eviction=str(config.get("memory_eviction", "weighted")).lower(),
+            half_life_days=float(config.get("memory_eviction_half_life_days", 180.0)),
+            compaction_slack=float(config.get("memory_compaction_slack", 0.1)),
+        )
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_items > 0 or self.dedupe_threshold > 0
+
+    def needs_compaction(self, count: int) -> bool:
+        return self.max_items > 0 and count > self.max_items * (1 + self.compaction_slack)
+
+
+def _unit_rows(embeddings) -> np.ndarray:
+    matrix = np.asarray(embeddings, dtype=np.float32)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
+
+def _added_at(metadata: Dict[str, Any] | None) -> float:
+    return float((metadata or {}).get("added_at", 0.0) or 0.0)
+
+
+def retention_scores(metadatas: List[Dict[str, Any] | None], policy: RetentionPolicy, now: float | None = None) -> np.ndarray:
+    """Higher is more worth keeping."""
+    added = np.array([_added_at(m) for m in metadatas], dtype=np.float64)
+    if policy.eviction == "oldest":
+        return added
+    now = time.time() if now is None else now
+    age_days = np.maximum(0.0, now - added) / 86400.0
+    recency = 0.5 ** (age_days / max(policy.half_life_days, 1e-9))
+    outcome = np.array(
+        [abs(float((m or {}).get("returns_losses", 0.0) or 0.0)) for m in metadatas], dtype=np.float64
+    )
+    return recency * (1.0 + outcome)
+
+
+def find_duplicates(embeddings, order: np.ndarray, threshold: float) -> Dict[int, List[int]]:
+    """
+    Greedy near-duplicate grouping. Rows are visited in `order` (most preferred first);
+    each surviving row absorbs every later row with cosine similarity >= `threshold`.
+
+    Returns {survivor_row: [merged_rows...]} for survivors that absorbed anything.
+    """
+    unit = _unit_rows(np.asarray(embeddings, dtype=np.float32)[order])
+    n = len(order)
+    alive = np.ones(n, dtype=bool)
+    groups: Dict[int, List[int]] = {}
+    positions = np.arange(n)
+    for start in range(0, n, _SIMILARITY_BLOCK_ROWS):
+        end = min(start + _SIMILARITY_BLOCK_ROWS, n)
+        similarities = unit[start:end] @ unit.T
+        for offset in range(end - start):
+            i = start + offset
+            if not alive[i]:
+                continue
+            dups = np.nonzero((similarities[offset] >= threshold) & alive & (positions > i))[0]
+            if len(dups):
+                alive[dups] = False
+                groups[int(order[i])] = [int(order[j]) for j in dups]
+    return groups
+
+
+def _query_latency_ms(collection, sample) -> float:
+    if sample is None or not len(sample):
+        return 0.0
+    start = time.perf_counter()
+    collection.query(query_embeddings=sample, n_results=2, include=["metadatas", "documents", "distances"])
+    return (time.perf_counter() - start) * 1000 / len(sample)
+
+
+def compact_collection(collection, policy: RetentionPolicy) -> Dict[str, Any]:
+    """
+    Rewrite `collection` after merging near-duplicates and evicting down to `max_items`.
+
+    Returns metrics: sizes and per-query latency before and after, merged and evicted counts.
+    """
+    data = collection.get(include=["documents", "metadatas", "embeddings"])
+    ids = list(data.get("ids") or [])
+    n = len(ids)
+    metrics: Dict[str, Any] = {"size_before": n, "size_after": n, "merged": 0, "evicted": 0}
+    if n == 0:
+        metrics.update(latency_ms_before=0.0, latency_ms_after=0.0)
+        return metrics
+
+    documents = list(data["documents"])
+    metadatas = [dict(m or {}) for m in data["metadatas"]]
+    embeddings = np.asarray(data["embeddings"], dtype=np.float32)
+
+    rng = np.random.default_rng(0)
+    sample = embeddings[rng.choice(n, size=min(n, _LATENCY_SAMPLE_QUERIES), replace=False)]
+    metrics["latency_ms_before"] = _query_latency_ms(collection, sample)
+
+    keep = np.ones(n, dtype=bool)
+    if policy.dedupe_threshold > 0:
+        # Newest first, so merged groups keep the most recent lesson; tickers are never merged together.
+        order = np.argsort(-np.array([_added_at(m) for m in metadatas]), kind="stable")
+        partitions: Dict[Any, List[int]] = {}
+        for i in order:
+            partitions.setdefault(metadatas[i].get("ticker"), []).append(int(i))
+        for partition in partitions.values():
+            duplicates = find_duplicates(embeddings, np.asarray(partition), policy.dedupe_threshold)
+            for survivor, merged in duplicates.items():
+                keep[merged] = False
+                metadatas[survivor]["merged_count"] = int(metadatas[survivor].get("merged_count", 1)) + sum(
+                    int(metadatas[j].get("merged_count", 1)) for j in merged
+                )
+                metrics["merged"] += len(merged)
+
+    rows = np.nonzero(keep)[0]
+    if policy.max_items > 0 and len(rows) > policy.max_items:
+        scores = retention_scores([metadatas[i] for i in rows], policy)
+        ranked = rows[np.argsort(-scores, kind="stable")]
+        metrics["evicted"] = len(rows) - policy.max_items
+        rows = np.sort(ranked[: policy.max_items])
+
+    if len(rows) < n:
+        collection.rewrite(
+            documents=[documents[i] for i in rows],
+            metadatas=[metadatas[i] for i in rows],
+            embeddings=embeddings[rows],
+        )
+    metrics["size_after"] = len(rows)
+    metrics["latency_ms_after"] = _query_latency_ms(collection, sample)
+    return metrics
@@ -1,6 +1,7 @@
 from langchain_core.tools import tool
 from typing import Annotated
 from tradingagents.dataflows.interface import route_to_vendor
+from tradingagents.dataflows.rendering import render_tool_output
 
 @tool
 def get_news(
@@ -18,7 +19,9 @@ def get_news(
     Returns:
         str: A formatted string containing news data
     """
-    return route_to_vendor("get_news", ticker, start_date, end_date)
+    return render_tool_output(
+        "get_news", route_to_vendor("get_news", ticker, start_date, end_date)
+    )
 
 @tool
 def get_global_news(
@@ -36,7 +39,9 @@ def get_global_news(
     Returns:
         str: A formatted string containing global news data
     """
-    return route_to_vendor("get_global_news", curr_date, look_back_days, limit)
+    return render_tool_output(
+        "get_global_news", route_to_vendor("get_global_news", curr_date, look_back_days, limit)
+    )
 
 @tool
 def get_insider_sentiment(
@@ -52,7 +57,9 @@ def get_insider_sentiment(
     Returns:
         str: A report of insider sentiment data
     """
-    return route_to_vendor("get_insider_sentiment", ticker, curr_date)
+    return render_tool_output(
+        "get_insider_sentiment", route_to_vendor("get_insider_sentiment", ticker, curr_date)
+    )
 
 @tool
 def get_insider_transactions(
@@ -68,4 +75,6 @@ def get_insider_transactions(
     Returns:
         str: A report of insider transaction data
     """
-    return route_to_vendor("get_insider_transactions", ticker, curr_date)
+    return render_tool_output(
+        "get_insider_transactions", route_to_vendor("get_insider_transactions", ticker, curr_date)
+    )
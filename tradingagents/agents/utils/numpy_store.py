@@ -0,0 +1,474 @@
+"""
+In-process NumPy vector store, a drop-in alternative to a Chroma collection.
+
+Memory banks hold thousands of situations, so an exact scan is cheap: vectors live in one
+contiguous float32 matrix and a query is a single matrix-vector product followed by
+`argpartition`. Distances are squared L2, the metric Chroma collections use by default,
+so `1 - distance` similarity scores match the Chroma backend (for unit-norm embeddings
+the ranking is the cosine ranking).
+
+Optionally the searched matrix is quantized (`float16`, or `int8` with a per-row scale).
+Candidates are then picked from the quantized scores and, with `rescore_factor` > 1,
+re-ranked exactly (`rescore_factor` × k candidates). Only the codes stay in RAM: the
+full-precision rows used for re-ranking are memory-mapped from the bank's vector file, or
+from a temporary file for banks that are not persisted.
+
+`where` filters (equality, `$in` and `$and`, as in Chroma) select rows through a per-field
+index before scoring, so a query restricted to one partition only scans that partition.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import tempfile
+import weakref
+from pathlib import Path
+from typing import Any, Dict, List, Sequence
+
+import numpy as np
+
+from tradingagents.dataflows.cache_utils import atomic_write_bytes, atomic_write_text
+
+from .memory_registry import _ReadWriteLock, next_row_id
+
+QUANTIZATIONS = ("none", "float16", "int8")
+
+# Rows dequantized per block while scoring, bounding temporary float32 memory.
+_SCORE_BLOCK_ROWS = 8192
+
+# Appended rows are logged here and folded into rows.json once the log holds more than
+# max(_LOG_COMPACT_MIN_ROWS, half the bank) rows, so an insert costs O(1) amortized.
+_ROWS_LOG = "rows.log.jsonl"
+_LOG_COMPACT_MIN_ROWS = 1024
+
+
+def quantize(matrix: np.ndarray, quantization: str) -> tuple[np.ndarray | None, np.ndarray | None]:
+    """Return (codes, per-row scales) for `matrix`; scales are only used by int8."""
+    if quantization == "float16":
+        return matrix.astype(np.float16), None
+    if quantization == "int8":
+        scales = np.abs(matrix).max(axis=1).astype(np.float32) / 127.0
+        scales[scales == 0] = 1.0
+        codes = np.clip(np.rint(matrix / scales[:, None]), -127, 127).astype(np.int8)
+        return codes, scales
+    return None, None
+
+
+class NumpyCollection:
+    """
+    Collection with the subset of the Chroma API used by `FinancialSituationMemory`.
+
+    When `path` is given, rows are stored in `path/rows.json` plus an append log, and
+    full-precision vectors as raw float32 rows in `path/vectors.f32`. Adds append to both
+    files; deletes, upserts of existing ids and rewrites (compaction) rewrite them. With
+    `mmap` (always, when quantized) the vectors are memory-mapped, so only the quantized
+    matrix and rescored rows occupy RAM.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        metadata: Dict[str, Any] | None = None,
+        path: str | Path | None = None,
+        mmap: bool = False,
+        quantization: str = "none",
+        rescore_factor: int = 4,
+    ):
+        if quantization not in QUANTIZATIONS:
+            raise ValueError(f"Unsupported quantization '{quantization}'; choose from {QUANTIZATIONS}")
+        self.name = name
+        self.path = Path(path) if path else None
+        self.quantization = quantization
+        self.rescore_factor = max(0, int(rescore_factor))
+        self._mmap = mmap or (quantization != "none" and self.path is not None)
+        self._vector_file: Path | None = self.path / "vectors.f32" if self.path else None
+        if self._vector_file is None and quantization != "none" and self.rescore_factor > 1:
+            # Rescoring rows of an unpersisted quantized bank live on disk, not next to the codes.
+            self._vector_file = self._spill_file()
+            self._mmap = True
+        self._dim = 0
+        self._log_rows = 0
+        # Next sequential id for `add`; recomputed after rows are replaced.
+        self._next_id: int | None = None
+        self._lock = _ReadWriteLock()
+        self.metadata: Dict[str, Any] = dict(metadata or {})
+        self._ids: List[str] = []
+        self._documents: List[str] = []
+        self._metadatas: List[Dict[str, Any] | None] = []
+        self._matrix: np.ndarray | None = np.zeros((0, 0), dtype=np.float32)
+        self._codes: np.ndarray | None = None
+        self._scales: np.ndarray | None = None
+        self._sq_norms = np.zeros((0,), dtype=np.float32)
+        # field -> value -> row positions; rebuilt lazily after writes.
+        self._field_index: Dict[str, Dict[Any, np.ndarray]] = {}
+        self._load()
+
+    # --- persistence -------------------------------------------------------
+
+    def _spill_file(self) -> Path:
+        fd, name = tempfile.mkstemp(prefix=f"ta-{self.name}-", suffix=".f32")
+        os.close(fd)
+        path = Path(name)
+        weakref.finalize(self, path.unlink, missing_ok=True)
+        return path
+
+    def _load(self) -> None:
+        if self.path is None:
+            return
+        rows_path = self.path / "rows.json"
+        if rows_path.exists():
+            rows = json.loads(rows_path.read_text(encoding="utf-8"))
+            # Keep the bank's original metadata (e.g. the embedding model it was built with).
+            self.metadata = rows.get("metadata") or self.metadata
+            self._ids = list(rows["ids"])
+            self._documents = list(rows["documents"])
+            self._metadatas = list(rows["metadatas"])
+            self._dim = int(rows.get("dimension") or 0)
+
+        torn_log = False
+        log_path = self.path / _ROWS_LOG
+        if log_path.exists():
+            for line in log_path.read_text(encoding="utf-8").splitlines():
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    # Interrupted append; everything before it is intact.
+                    torn_log = True
+                    break
+                self._ids.extend(record["ids"])
+                self._documents.extend(record["documents"])
+                self._metadatas.extend(record["metadatas"])
+                self._dim = self._dim or int(record.get("dimension") or 0)
+                self._log_rows += len(record["ids"])
+
+        legacy_path = self.path / "vectors.npy"
+        if legacy_path.exists() and not self._vector_file.exists():
+            # Banks written before the append-only layout: convert once.
+            matrix = np.load(legacy_path)
+            self._replace_rows(self._ids, self._documents, self._metadatas, matrix)
+            legacy_path.unlink()
+            return
+
+        if self._ids and self._vector_file.exists():
+            stored_rows = self._vector_file.stat().st_size // (4 * self._dim) if self._dim else 0
+            if stored_rows < len(self._ids):
+                logging.getLogger(__name__).warning(
+                    "Collection '%s' has %d rows but only %d vectors; dropping the rows without vectors.",
+                    self.name, len(self._ids), stored_rows,
+                )
+                del self._ids[stored_rows:], self._documents[stored_rows:], self._metadatas[stored_rows:]
+                torn_log = True
+            self._set_matrix(self._map_vectors())
+        if torn_log:
+            self._persist_rows()
+
+    def _map_vectors(self) -> np.ndarray:
+        """The first len(ids) rows of the vector file (memory-mapped when `_mmap`)."""
+        n = len(self._ids)
+        if not n:
+            return np.zeros((0, 0), dtype=np.float32)
+        if self._mmap:
+            return np.memmap(self._vector_file, dtype=np.float32, mode="r", shape=(n, self._dim))
+        return np.fromfile(self._vector_file, dtype=np.float32, count=n * self._dim).reshape(n, self._dim)
+
+    def _append_vectors(self, vectors: np.ndarray) -> None:
+        stored_bytes = len(self._ids) * self._dim * 4
+        if self._vector_file.exists():
+            # Drop vectors of an append that never reached the rows log.
+            os.truncate(self._vector_file, stored_bytes)
+        self._vector_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(self._vector_file, "ab") as handle:
+            handle.write(np.ascontiguousarray(vectors, dtype=np.float32).tobytes())
+
+    def _persist_rows(self) -> None:
+        """Write every row to rows.json and clear the append log."""
+        if self.path is None:
+            return
+        atomic_write_text(
+            self.path / "rows.json",
+            json.dumps(
+                {
+                    "metadata": self.metadata,
+                    "dimension": self._dim,
+                    "ids": self._ids,
+                    "documents": self._documents,
+                    "metadatas": self._metadatas,
+                },
+                ensure_ascii=False,
+            ),
+        )
+        (self.path / _ROWS_LOG).unlink(missing_ok=True)
+        self._log_rows = 0
+
+    def _log_appended_rows(self, ids, documents, metadatas) -> None:
+        """Record appended rows in the log; fold the log into rows.json once it is large."""
+        if self.path is None:
+            return
+        self._log_rows += len(ids)
+        if self._log_rows > max(_LOG_COMPACT_MIN_ROWS, len(self._ids) // 2):
+            self._persist_rows()
+            return
+        record = {"dimension": self._dim, "ids": ids, "documents": documents, "metadatas": metadatas}
+        with open(self.path / _ROWS_LOG, "a", encoding="utf-8") as handle:
+            handle.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+    def _set_matrix(self, matrix: np.ndarray) -> None:
+        self._field_index = {}
+        if not len(matrix):
+            self._matrix = np.zeros((0, 0), dtype=np.float32)
+            self._codes, self._scales = None, None
+            self._sq_norms = np.zeros((0,), dtype=np.float32)
+            return
+        self._sq_norms = np.einsum("ij,ij->i", matrix, matrix, dtype=np.float32)
+        self._codes, self._scales = quantize(np.asarray(matrix, dtype=np.float32), self.quantization)
+        # Quantized banks only keep full-precision rows when they are memory-mapped.
+        keep_full = self._codes is None or self._vector_file is not None
+        self._matrix = matrix if keep_full else None
+
+    def _full_matrix(self) -> np.ndarray:
+        """Full-precision rows, or the dequantized codes when they were not kept."""
+        if self._matrix is not None:
+            return self._matrix
+        if self._codes is None:
+            return np.zeros((0, 0), dtype=np.float32)
+        dequantized = self._codes.astype(np.float32)
+        if self._scales is not None:
+            dequantized *= self._scales[:, None]
+        return dequantized
+
+    def memory_bytes(self) -> int:
+        """Bytes of vector data resident in RAM (memory-mapped rows are not counted)."""
+        total = self._sq_norms.nbytes
+        for array in (self._codes, self._scales):
+            if array is not None:
+                total += array.nbytes
+        if self._matrix is not None and not isinstance(self._matrix, np.memmap):
+            total += self._matrix.nbytes
+        return total
+
+    # --- writes --------------------------------------------------------------
+
+    def _replace_rows(self, ids, documents, metadatas, matrix: np.ndarray) -> None:
+        """Set every row at once, rewriting the stored vectors and rows (O(N))."""
+        self._ids, self._documents, self._metadatas = list(ids), list(documents), list(metadatas)
+        self._next_id = None
+        matrix = np.ascontiguousarray(matrix, dtype=np.float32) if len(matrix) else np.zeros((0, 0), dtype=np.float32)
+        self._dim = matrix.shape[1] if len(matrix) else 0
+        if self._vector_file is not None:
+            atomic_write_bytes(self._vector_file, matrix.tobytes())
+            if self._mmap:
+                matrix = self._map_vectors()
+        self._set_matrix(matrix)
+        self._persist_rows()
+
+    def _append_rows(self, ids, documents, metadatas, embeddings) -> None:
+        """Append rows in O(new rows) on disk: vectors to the vector file, rows to the log."""
+        vectors = np.asarray(embeddings, dtype=np.float32)
+        if vectors.ndim == 1:
+            vectors = vectors.reshape(1, -1)
+        if len(self._ids) and vectors.shape[1] != self._dim:
+            raise ValueError(
+                f"Embedding dimension {vectors.shape[1]} does not match collection "
+                f"'{self.name}' dimension {self._dim}"
+            )
+        if not len(self._ids):
+            self._dim = vectors.shape[1]
+        metadatas = list(metadatas) if metadatas is not None else [None] * len(ids)
+        if self._vector_file is not None:
+            self._append_vectors(vectors)
+
+        current = None if self._mmap else self._full_matrix()
+        had_rows = bool(self._ids)
+        self._ids.extend(ids)
+        self._documents.extend(documents)
+        self._metadatas.extend(metadatas)
+
+        codes, scales = quantize(vectors, self.quantization)
+        sq_norms = np.einsum("ij,ij->i", vectors, vectors, dtype=np.float32)
+        if had_rows:
+            self._sq_norms = np.concatenate([self._sq_norms, sq_norms])
+            if codes is not None:
+                self._codes = np.concatenate([self._codes, codes])
+            if scales is not None:
+                self._scales = np.concatenate([self._scales, scales])
+        else:
+            self._sq_norms, self._codes, self._scales = sq_norms, codes, scales
+        if self._mmap:
+            self._matrix = self._map_vectors()
+        elif self._codes is None or self._vector_file is not None:
+            self._matrix = np.concatenate([current, vectors]) if had_rows else vectors
+        else:
+            self._matrix = None
+        self._field_index = {}
+        self._log_appended_rows(list(ids), list(documents), metadatas)
+
+    def _delete_rows(self, ids: Sequence[str]) -> bool:
+        drop = set(ids)
+        keep = [i for i, row_id in enumerate(self._ids) if row_id not in drop]
+        if len(keep) == len(self._ids):
+            return False
+        matrix = np.array(self._full_matrix()[keep]) if keep else np.zeros((0, 0), dtype=np.float32)
+        self._replace_rows(
+            [self._ids[i] for i in keep],
+            [self._documents[i] for i in keep],
+            [self._metadatas[i] for i in keep],
+            matrix,
+        )
+        return True
+
+    def add(self, documents: List[str], metadatas: List[Dict[str, Any]], embeddings) -> List[str]:
+        """Append rows with sequential string ids; returns the ids assigned."""
+        with self._lock.write():
+            offset = self._next_id if self._next_id is not None else next_row_id(self._ids)
+            ids = [str(offset + i) for i in range(len(documents))]
+            self._append_rows(ids, list(documents), metadatas, embeddings)
+            self._next_id = offset + len(ids)
+            return ids
+
+    def upsert(self, ids, documents, metadatas, embeddings) -> None:
+        with self._lock.write():
+            self._delete_rows(ids)
+            self._append_rows(list(ids), list(documents), list(metadatas), embeddings)
+            self._next_id = None
+
+    def delete(self, ids) -> None:
+        with self._lock.write():
+            self._delete_rows(ids)
+
+    def rewrite(self, documents: List[str], metadatas: List[Dict[str, Any]], embeddings) -> None:
+        """Replace every row with the given ones (re-numbered from 0) under one write lock."""
+        with self._lock.write():
+            matrix = np.asarray(embeddings, dtype=np.float32) if len(documents) else np.zeros((0, 0), dtype=np.float32)
+            if matrix.ndim == 1:
+                matrix = matrix.reshape(1, -1)
+            self._replace_rows([str(i) for i in range(len(documents))], documents, metadatas, matrix)
+
+    # --- reads ---------------------------------------------------------------
+
+    def _rows_for_field(self, field: str) -> Dict[Any, np.ndarray]:
+        index = self._field_index.get(field)
+        if index is None:
+            positions: Dict[Any, List[int]] = {}
+            for i, metadata in enumerate(self._metadatas):
+                value = (metadata or {}).get(field)
+                if value is not None:
+                    positions.setdefault(value, []).append(i)
+            index = {value: np.asarray(rows, dtype=np.int64) for value, rows in positions.items()}
+            self._field_index[field] = index
+        return index
+
+    def _where_rows(self, where: Dict[str, Any] | None) -> np.ndarray | None:
+        """Sorted row positions matching `where`, or None for all rows."""
+        if not where:
+            return None
+        clauses = where["$and"] if "$and" in where else [{key: value} for key, value in where.items()]
+        rows: np.ndarray | None = None
+        for clause in clauses:
+            if "$and" in clause:
+                matched = self._where_rows(clause)
+            else:
+                ((field, condition),) = clause.items()
+                operator, operand = next(iter(condition.items())) if isinstance(condition, dict) else ("$eq", condition)
+                if operator == "$eq":
+                    values = [operand]
+                elif operator == "$in":
+                    values = list(operand)
+                else:
+                    raise ValueError(f"Unsupported where operator '{operator}' in collection '{self.name}'")
+                index = self._rows_for_field(field)
+                parts = [index[value] for value in values if value in index]
+                matched = np.unique(np.concatenate(parts)) if parts else np.zeros((0,), dtype=np.int64)
+            rows = matched if rows is None else np.intersect1d(rows, matched, assume_unique=True)
+        return rows
+
+    def count(self) -> int:
+        with self._lock.read():
+            return len(self._ids)
+
+    def get(self, ids=None, where=None, include=("documents", "metadatas")) -> Dict[str, Any]:
+        with self._lock.read():
+            matched = self._where_rows(where)
+            rows = list(range(len(self._ids))) if matched is None else matched.tolist()
+            if ids is not None:
+                wanted = set(ids)
+                rows = [i for i in rows if self._ids[i] in wanted]
+            result: Dict[str, Any] = {"ids": [self._ids[i] for i in rows]}
+            if "documents" in include:
+                result["documents"] = [self._documents[i] for i in rows]
+            if "metadatas" in include:
+                result["metadatas"] = [self._metadatas[i] for i in rows]
+            if "embeddings" in include:
+                result["embeddings"] = (
+                    np.array(self._full_matrix()[rows]) if rows else np.zeros((0, 0), dtype=np.float32)
+                )
+            return result
+
+    def _dot_products(self, queries: np.ndarray, rows: np.ndarray | None = None) -> np.ndarray:
+        if self._codes is None:
+            matrix = self._matrix if rows is None else self._matrix[rows]
+            return queries @ np.asarray(matrix, dtype=np.float32).T
+        codes = self._codes if rows is None else self._codes[rows]
+        scales = self._scales if rows is None or self._scales is None else self._scales[rows]
+        n = len(codes)
+        dots = np.empty((len(queries), n), dtype=np.float32)
+        for start in range(0, n, _SCORE_BLOCK_ROWS):
+            end = min(start + _SCORE_BLOCK_ROWS, n)
+            block = queries @ codes[start:end].astype(np.float32).T
+            if scales is not None:
+                block *= scales[start:end]
+            dots[:, start:end] = block
+        return dots
+
+    def query(
+        self,
+        query_embeddings,
+        n_results: int = 1,
+        where: Dict[str, Any] | None = None,
+        include=("metadatas", "documents", "distances"),
+    ) -> Dict[str, Any]:
+        """Top-k by squared L2 distance for each query vector (Chroma result layout)."""
+        queries = np.asarray(query_embeddings, dtype=np.float32)
+        if queries.ndim == 1:
+            queries = queries.reshape(1, -1)
+
+        with self._lock.read():
+            result: Dict[str, Any] = {"ids": [], "documents": [], "metadatas": [], "distances": []}
+            candidates = self._where_rows(where)
+            n = len(self._ids) if candidates is None else len(candidates)
+            k = min(int(n_results), n)
+            if k <= 0:
+                for key in result:
+                    result[key] = [[] for _ in range(len(queries))]
+                return result
+
+            # ||x - q||^2 = ||x||^2 - 2 x.q + ||q||^2, one matrix product for all queries.
+            query_sq_norms = np.einsum("ij,ij->i", queries, queries)
+            sq_norms = self._sq_norms if candidates is None else self._sq_norms[candidates]
+            distances = sq_norms[None, :] - 2.0 * self._dot_products(queries, candidates) + query_sq_norms[:, None]
+            np.maximum(distances, 0.0, out=distances)
+
+            rescore = self._codes is not None and self._matrix is not None and self.rescore_factor > 1
+            n_candidates = min(n, k * self.rescore_factor) if rescore else k
+
+            for q, row in enumerate(distances):
+                top = np.argpartition(row, n_candidates - 1)[:n_candidates] if n_candidates < n else np.arange(n)
+                if rescore:
+                    # Exact distances for the shortlisted rows only.
+                    top = np.sort(top)
+                    full_rows = np.asarray(self._matrix[top if candidates is None else candidates[top]], dtype=np.float32)
+                    diffs = full_rows - queries[q]
+                    row_distances = np.einsum("ij,ij->i", diffs, diffs)
+                    order = np.argsort(row_distances, kind="stable")[:k]
+                    top, top_distances = top[order], row_distances[order]
+                else:
+                    top = top[np.argsort(row[top], kind="stable")][:k]
+                    top_distances = row[top]
+                if candidates is not None:
+                    top = candidates[top]
+                result["ids"].append([self._ids[i] for i in top])
+                result["documents"].append([self._documents[i] for i in top])
+                result["metadatas"].append([self._metadatas[i] for i in top])
+                result["distances"].append([float(d) for d in top_distances])
+            return result
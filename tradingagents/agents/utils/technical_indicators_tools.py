@@ -1,6 +1,7 @@
 from langchain_core.tools import tool
 from typing import Annotated
 from tradingagents.dataflows.interface import route_to_vendor
+from tradingagents.dataflows.rendering import render_tool_output
 
 @tool
 def get_indicators(
@@ -20,4 +21,6 @@ def get_indicators(
     Returns:
         str: A formatted dataframe containing the technical indicators for the specified ticker symbol and indicator.
     """
-    return route_to_vendor("get_indicators", symbol, indicator, curr_date, look_back_days)
+    return render_tool_output(
+        "get_indicators", route_to_vendor("get_indicators", symbol, indicator, curr_date, look_back_days)
+    )
@@ -1,27 +1,240 @@
-from typing import Annotated
+from typing import Annotated, Iterable
 from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+import threading
+import time
 import akshare as ak
+import pandas as pd
+from .cache_utils import cache_as_of, cache_is_fresh, read_frame, write_frame
+from .config import get_config
+from .results import ToolResult
+
+# Statement name -> East Money report endpoint in akshare.
+_STATEMENT_FUNCTIONS = {
+    "balance_sheet": "stock_balance_sheet_by_report_em",
+    "cashflow": "stock_cash_flow_sheet_by_report_em",
+    "income_statement": "stock_profit_sheet_by_report_em",
+}
+
+# Identifier/bookkeeping columns in East Money report tables that carry no financial data.
+_STATEMENT_ID_COLUMNS = [
+    "SECUCODE",
+    "SECURITY_CODE",
+    "SECURITY_NAME_ABBR",
+    "ORG_CODE",
+    "ORG_TYPE",
+    "REPORT_TYPE",
+    "REPORT_DATE_NAME",
+    "SECURITY_TYPE_CODE",
+    "NOTICE_DATE",
+    "UPDATE_DATE",
+    "CURRENCY",
+    "OPINION_TYPE",
+    "OSOPINION_TYPE",
+    "LISTING_STATE",
+]
+
+_AKSHARE_RATE_LIMIT_LOCK = threading.Lock()
+_AKSHARE_NEXT_REQUEST_TS = 0.0
+
+
+def _rate_limit_wait() -> None:
+    """
+    Space East Money requests by `akshare_min_interval_seconds`, shared across threads.
+
+    Only the start times are serialized; requests themselves may overlap, so batch
+    workers stay concurrent while the aggregate request rate stays bounded.
+    """
+    global _AKSHARE_NEXT_REQUEST_TS
+    min_interval = float(get_config().get("akshare_min_interval_seconds", 0.5))
+    if min_interval <= 0:
+        return
+    with _AKSHARE_RATE_LIMIT_LOCK:
+        now = time.monotonic()
+        slot = max(now, _AKSHARE_NEXT_REQUEST_TS)
+        _AKSHARE_NEXT_REQUEST_TS = slot + min_interval
+    if slot > now:
+        time.sleep(slot - now)
+
+
+def _akshare_call(function_name: str, **kwargs) -> pd.DataFrame:
+    _rate_limit_wait()
+    return getattr(ak, function_name)(**kwargs)
+
+
+def _get_akshare_cache_dir() -> Path:
+    config = get_config()
+    return Path(config.get("data_cache_dir", "dataflows/data_cache")) / "akshare"
+
+
+def _get_akshare_cache_ttl_seconds() -> int:
+    return int(get_config().get("akshare_cache_ttl_seconds", 60 * 60 * 24))
+
+
+def _normalize_code(ticker: str) -> str:
+    """Normalize symbol (remove any prefix like 'sh' or 'sz')."""
+    return ticker.lower().replace("sh", "").replace("sz", "").replace(".", "").strip()
+
+
+def _em_symbol(code: str) -> str:
+    # Add market prefix for the East Money report APIs
+    prefix = "SH" if code.startswith("6") else "SZ"
+    return f"{prefix}{code}"
+
+
+def _cached_frame(cache_path: Path, fetch) -> tuple[pd.DataFrame, bool]:
+    """Return (frame, cached) using a TTL'd pickle cache; stale cache is used if fetching fails."""
+    if cache_is_fresh(cache_path, _get_akshare_cache_ttl_seconds()):
+        return read_frame(cache_path), True
+    try:
+        df = fetch()
+    except Exception as exc:
+        if cache_path.exists():
+            print(f"WARNING: akshare fetch failed, using stale cache {cache_path.name}: {exc}")
+            return read_frame(cache_path), True
+        raise
+    if df is not None and not df.empty:
+        write_frame(cache_path, df)
+    return (df if df is not None else pd.DataFrame()), False
+
+
+def load_statement(code: str, statement: str) -> tuple[pd.DataFrame, bool]:
+    """Full report history for one statement of an A-share code (cached per symbol)."""
+    code = _normalize_code(code)
+    cache_path = _get_akshare_cache_dir() / "statements" / f"{code}-{statement}.pkl"
+    return _cached_frame(
+        cache_path,
+        lambda: _akshare_call(_STATEMENT_FUNCTIONS[statement], symbol=_em_symbol(code)),
+    )
+
+
+def _slice_statement(
+    df: pd.DataFrame, freq: str, curr_date: str | None, max_periods: int
+) -> pd.DataFrame:
+    """As-of slice of a report history: published by `curr_date`, matching `freq`, newest first."""
+    if "REPORT_DATE" not in df.columns:
+        return df
+
+    report_dates = pd.to_datetime(df["REPORT_DATE"], errors="coerce")
+    mask = report_dates.notna()
+    if curr_date:
+        cutoff = pd.to_datetime(curr_date)
+        # Prefer the announcement date so reports are only visible once published.
+        published = (
+            pd.to_datetime(df["NOTICE_DATE"], errors="coerce")
+            if "NOTICE_DATE" in df.columns
+            else report_dates
+        )
+        mask &= published.fillna(report_dates) <= cutoff
+    if (freq or "quarterly").lower() == "annual":
+        mask &= (report_dates.dt.month == 12) & (report_dates.dt.day == 31)
+
+    sliced = df[mask].assign(REPORT_DATE=report_dates[mask].dt.strftime("%Y-%m-%d"))
+    sliced = sliced.sort_values("REPORT_DATE", ascending=False).head(max_periods)
+
+    # Statement layout: line items as rows, report periods as columns.
+    table = sliced.drop(columns=[c for c in _STATEMENT_ID_COLUMNS if c in sliced.columns])
+    table = table.set_index("REPORT_DATE").T
+    table.columns.name = None
+    return table
+
+
+def _statement_result(ticker: str, statement: str, label: str, freq: str, curr_date: str | None):
+    code = _normalize_code(ticker)
+    try:
+        df, cached = load_statement(code, statement)
+        if df is None or df.empty:
+            return f"No {label.lower()} data found for symbol '{code}'"
+
+        max_periods = int(get_config().get("akshare_statement_max_periods", 8))
+        table = _slice_statement(df, freq, curr_date, max_periods)
+        if table.empty:
+            return f"No {label.lower()} data found for symbol '{code}' as of {curr_date}"
+
+        return ToolResult(
+            kind="table",
+            data=table,
+            title=f"{label} for {code} ({freq})",
+            source="akshare",
+            as_of=cache_as_of(_get_akshare_cache_dir() / "statements" / f"{code}-{statement}.pkl")
+            if cached
+            else datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            cached=cached,
+        )
+
+    except Exception as e:
+        return f"Error retrieving {label.lower()} for {code}: {str(e)}"
+
+
+def fetch_statements_batch(
+    codes: Iterable[str],
+    statements: Iterable[str] = tuple(_STATEMENT_FUNCTIONS),
+    max_workers: int | None = None,
+) -> tuple[dict[str, dict[str, pd.DataFrame]], dict[str, dict[str, str]]]:
+    """
+    Pull statement tables for many A-share codes concurrently and warm the disk cache.
+
+    All workers share the module-level East Money rate limit, so `max_workers` controls
+    overlap of in-flight requests, not the request rate.
+
+    Returns:
+        (results, errors): `results[code][statement]` is the full report history;
+        `errors[code][statement]` holds the error message for failed fetches.
+    """
+    statements = list(statements)
+    unknown = [s for s in statements if s not in _STATEMENT_FUNCTIONS]
+    if unknown:
+        raise ValueError(f"Unknown statement(s) {unknown}; choose from {list(_STATEMENT_FUNCTIONS)}")
+
+    if max_workers is None:
+        max_workers = int(get_config().get("akshare_batch_max_workers", 8))
+
+    codes = list(dict.fromkeys(_normalize_code(c) for c in codes))
+    results: dict[str, dict[str, pd.DataFrame]] = {code: {} for code in codes}
+    errors: dict[str, dict[str, str]] = {}
+
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        futures = {
+            executor.submit(load_statement, code, statement): (code, statement)
+            for code in codes
+            for statement in statements
+        }
+        for future in as_completed(futures):
+            code, statement = futures[future]
+            try:
+                results[code][statement] = future.result()[0]
+            except Exception as exc:
+                errors.setdefault(code, {})[statement] = str(exc)
+
+    if errors:
+        print(f"WARNING: akshare batch fetch failed for {len(errors)}/{len(codes)} code(s)")
+    return results, errors
 
 
 def get_stock(
     symbol: Annotated[str, "ticker symbol (6-digit A-share code, e.g., 600519)"],
     start_date: Annotated[str, "Start date in yyyy-mm-dd format"],
     end_date: Annotated[str, "End date in yyyy-mm-dd format"],
-) -> str:
+) -> ToolResult | str:
     try:
-        # Normalize symbol (remove any prefix like 'sh' or 'sz')
-        symbol = symbol.replace("sh", "").replace("sz", "").replace(".", "").strip()
+        symbol = _normalize_code(symbol)
 
         # Convert date format for akshare (YYYYMMDD)
         start_fmt = start_date.replace("-", "")
         end_fmt = end_date.replace("-", "")
 
-        df = ak.stock_zh_a_hist(
-            symbol=symbol,
-            period="daily",
-            start_date=start_fmt,
-            end_date=end_fmt,
-            adjust="qfq"  # Forward adjusted
+        cache_path = _get_akshare_cache_dir() / "history" / f"{symbol}-{start_date}-{end_date}-qfq.pkl"
+        df, cached = _cached_frame(
+            cache_path,
+            lambda: _akshare_call(
+                "stock_zh_a_hist",
+                symbol=symbol,
+                period="daily",
+                start_date=start_fmt,
+                end_date=end_fmt,
+                adjust="qfq",  # Forward adjusted
+            ),
         )
 
         if df.empty:
@@ -41,12 +254,15 @@ def get_stock(
         cols = ["Date", "Open", "High", "Low", "Close", "Volume"]
         df = df[[c for c in cols if c in df.columns]]
 
-        csv_string = df.to_csv(index=False)
-        header = f"# Stock data for {symbol} from {start_date} to {end_date}\n"
-        header += f"# Total records: {len(df)}\n"
-        header += f"# Data retrieved on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
-
-        return header + csv_string
+        return ToolResult(
+            kind="table",
+            data=df.reset_index(drop=True),
+            title=f"Stock data for {symbol} from {start_date} to {end_date}",
+            source="akshare",
+            notes=[f"Total records: {len(df)}"],
+            as_of=cache_as_of(cache_path) if cached else datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            cached=cached,
+        )
 
     except Exception as e:
         return f"Error retrieving stock data for {symbol}: {str(e)}"
@@ -55,107 +271,55 @@ def get_stock(
 def get_balance_sheet(
     ticker: Annotated[str, "ticker symbol (6-digit A-share code)"],
     freq: Annotated[str, "frequency: 'annual' or 'quarterly'"] = "quarterly",
-    curr_date: Annotated[str, "current date (optional)"] = None
-) -> str:
-    try:
-        ticker = ticker.replace("sh", "").replace("sz", "").replace(".", "").strip()
-
-        # Add market prefix for the API
-        prefix = "SH" if ticker.startswith("6") else "SZ"
-        full_symbol = f"{prefix}{ticker}"
-
-        df = ak.stock_balance_sheet_by_report_em(symbol=full_symbol)
-
-        if df is None or df.empty:
-            return f"No balance sheet data found for symbol '{ticker}'"
-
-        csv_string = df.to_csv(index=False)
-        header = f"# Balance Sheet for {ticker} ({freq})\n"
-        header += f"# Data retrieved on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
-
-        return header + csv_string
-
-    except Exception as e:
-        return f"Error retrieving balance sheet for {ticker}: {str(e)}"
+    curr_date: Annotated[str, "current date; reports published later are omitted"] = None
+) -> ToolResult | str:
+    return _statement_result(ticker, "balance_sheet", "Balance Sheet", freq, curr_date)
 
 
 def get_cashflow(
     ticker: Annotated[str, "ticker symbol (6-digit A-share code)"],
     freq: Annotated[str, "frequency: 'annual' or 'quarterly'"] = "quarterly",
-    curr_date: Annotated[str, "current date (optional)"] = None
-) -> str:
-    try:
-        ticker = ticker.replace("sh", "").replace("sz", "").replace(".", "").strip()
-
-        prefix = "SH" if ticker.startswith("6") else "SZ"
-        full_symbol = f"{prefix}{ticker}"
-
-        df = ak.stock_cash_flow_sheet_by_report_em(symbol=full_symbol)
-
-        if df is None or df.empty:
-            return f"No cash flow data found for symbol '{ticker}'"
-
-        csv_string = df.to_csv(index=False)
-        header = f"# Cash Flow for {ticker} ({freq})\n"
-        header += f"# Data retrieved on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
-
-        return header + csv_string
-
-    except Exception as e:
-        return f"Error retrieving cash flow for {ticker}: {str(e)}"
+    curr_date: Annotated[str, "current date; reports published later are omitted"] = None
+) -> ToolResult | str:
+    return _statement_result(ticker, "cashflow", "Cash Flow", freq, curr_date)
 
 
 def get_income_statement(
     ticker: Annotated[str, "ticker symbol (6-digit A-share code)"],
     freq: Annotated[str, "frequency: 'annual' or 'quarterly'"] = "quarterly",
-    curr_date: Annotated[str, "current date (optional)"] = None
-) -> str:
-    try:
-        ticker = ticker.replace("sh", "").replace("sz", "").replace(".", "").strip()
-
-        prefix = "SH" if ticker.startswith("6") else "SZ"
-        full_symbol = f"{prefix}{ticker}"
-
-        df = ak.stock_profit_sheet_by_report_em(symbol=full_symbol)
-
-        if df is None or df.empty:
-            return f"No income statement data found for symbol '{ticker}'"
-
-        csv_string = df.to_csv(index=False)
-        header = f"# Income Statement for {ticker} ({freq})\n"
-        header += f"# Data retrieved on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
-
-        return header + csv_string
-
-    except Exception as e:
-        return f"Error retrieving income statement for {ticker}: {str(e)}"
+    curr_date: Annotated[str, "current date; reports published later are omitted"] = None
+) -> ToolResult | str:
+    return _statement_result(ticker, "income_statement", "Income Statement", freq, curr_date)
 
 
 def get_news(
     ticker: Annotated[str, "ticker symbol (6-digit A-share code)"],
     start_date: Annotated[str, "Start date in yyyy-mm-dd format"],
     end_date: Annotated[str, "End date in yyyy-mm-dd format"],
-) -> str:
+) -> ToolResult | str:
     try:
-        ticker = ticker.replace("sh", "").replace("sz", "").replace(".", "").strip()
+        ticker = _normalize_code(ticker)
 
         # Use stock individual info which is more reliable
-        df = ak.stock_individual_info_em(symbol=ticker)
+        cache_path = _get_akshare_cache_dir() / "info" / f"{ticker}-info.pkl"
+        df, cached = _cached_frame(
+            cache_path, lambda: _akshare_call("stock_individual_info_em", symbol=ticker)
+        )
 
         if df is None or df.empty:
             return f"No info found for symbol '{ticker}'"
 
         # Format as news-like output with company info
-        info_items = []
-        for _, row in df.iterrows():
-            item = row.get("item", "")
-            value = row.get("value", "")
-            info_items.append(f"{item}: {value}")
-
-        header = f"# Company Info for {ticker}\n"
-        header += f"# Data retrieved on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
-
-        return header + "\n".join(info_items)
+        info = dict(zip(df["item"].astype(str), df["value"]))
+
+        return ToolResult(
+            kind="json",
+            data=info,
+            title=f"Company Info for {ticker}",
+            source="akshare",
+            as_of=cache_as_of(cache_path) if cached else datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            cached=cached,
+        )
 
     except Exception as e:
         return f"Error retrieving news for {ticker}: {str(e)}"
@@ -105,40 +105,50 @@ def _make_api_request(function_name: str, params: dict) -> dict | str:
     return response_text
 
 
+def _make_api_request_json(function_name: str, params: dict) -> dict:
+    """Like `_make_api_request`, but parse the JSON payload once and surface API errors.
 
-def _filter_csv_by_date_range(csv_data: str, start_date: str, end_date: str) -> str:
+    Raises:
+        AlphaVantageRateLimitError: When API rate limit is exceeded
+        ValueError: When Alpha Vantage returns an error, information or note message instead of data
+    """
+    payload = json.loads(_make_api_request(function_name, params))
+    if isinstance(payload, dict):
+        # Error, premium-endpoint and throttling notices come back as HTTP 200 with one of these keys.
+        message = payload.get("Error Message") or payload.get("Information") or payload.get("Note")
+        if message:
+            if "call frequency" in str(message).lower():
+                raise AlphaVantageRateLimitError(f"Alpha Vantage rate limit exceeded: {message}")
+            raise ValueError(f"Alpha Vantage {function_name} error: {message}")
+    return payload
+
+
+def _read_csv_response(function_name: str, response_text: str) -> pd.DataFrame:
+    """Parse a `datatype=csv` response into a DataFrame (JSON bodies are API errors)."""
+    stripped = response_text.strip()
+    if stripped.startswith("{"):
+        payload = json.loads(stripped)
+        message = payload.get("Error Message") or payload.get("Information") or payload.get("Note")
+        raise ValueError(f"Alpha Vantage {function_name} error: {message or stripped[:300]}")
+    return pd.read_csv(StringIO(response_text))
+
+
+def _filter_frame_by_date_range(df: pd.DataFrame, start_date: str, end_date: str) -> pd.DataFrame:
     """
-    Filter CSV data to include only rows within the specified date range.
+    Filter rows to the specified date range, assuming the first column holds the dates.
 
     Args:
-        csv_data: CSV string from Alpha Vantage API
+        df: DataFrame parsed from an Alpha Vantage CSV response
         start_date: Start date in yyyy-mm-dd format
         end_date: End date in yyyy-mm-dd format
 
     Returns:
-        Filtered CSV string
+        Filtered DataFrame
     """
-    if not csv_data or csv_data.strip() == "":
-        return csv_data
-
-    try:
-        # Parse CSV data
-        df = pd.read_csv(StringIO(csv_data))
-
-        # Assume the first column is the date column (timestamp)
-        date_col = df.columns[0]
-        df[date_col] = pd.to_datetime(df[date_col])
-
-        # Filter by date range
-        start_dt = pd.to_datetime(start_date)
-        end_dt = pd.to_datetime(end_date)
-
-        filtered_df = df[(df[date_col] >= start_dt) & (df[date_col] <= end_dt)]
-
-        # Convert back to CSV string
-        return filtered_df.to_csv(index=False)
+    if df.empty:
+        return df
 
-    except Exception as e:
-        # If filtering fails, return original data with a warning
-        print(f"Warning: Failed to filter CSV data by date range: {e}")
-        return csv_data
+    date_col = df.columns[0]
+    dates = pd.to_datetime(df[date_col])
+    mask = (dates >= pd.to_datetime(start_date)) & (dates <= pd.to_datetime(end_date))
+    return df[mask].reset_index(drop=True)
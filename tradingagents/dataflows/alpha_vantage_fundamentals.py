@@ -1,7 +1,19 @@
-from .alpha_vantage_common import _make_api_request
+from datetime import datetime
+from .alpha_vantage_common import _make_api_request_json
+from .results import ToolResult
 
 
-def get_fundamentals(ticker: str, curr_date: str = None) -> str:
+def _statement_result(function_name: str, title: str, ticker: str) -> ToolResult:
+    return ToolResult(
+        kind="json",
+        data=_make_api_request_json(function_name, {"symbol": ticker}),
+        title=f"{title} for {ticker.upper()}",
+        source="alpha_vantage",
+        as_of=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+    )
+
+
+def get_fundamentals(ticker: str, curr_date: str = None) -> ToolResult:
     """
     Retrieve comprehensive fundamental data for a given ticker symbol using Alpha Vantage.
 
@@ -10,16 +22,12 @@ def get_fundamentals(ticker: str, curr_date: str = None) -> str:
         curr_date (str): Current date you are trading at, yyyy-mm-dd (not used for Alpha Vantage)
 
     Returns:
-        str: Company overview data including financial ratios and key metrics
+        ToolResult: Company overview data including financial ratios and key metrics
     """
-    params = {
-        "symbol": ticker,
-    }
-
-    return _make_api_request("OVERVIEW", params)
+    return _statement_result("OVERVIEW", "Company overview", ticker)
 
 
-def get_balance_sheet(ticker: str, freq: str = "quarterly", curr_date: str = None) -> str:
+def get_balance_sheet(ticker: str, freq: str = "quarterly", curr_date: str = None) -> ToolResult:
     """
     Retrieve balance sheet data for a given ticker symbol using Alpha Vantage.
 
@@ -29,16 +37,12 @@ def get_balance_sheet(ticker: str, freq: str = "quarterly", curr_date: str = Non
         curr_date (str): Current date you are trading at, yyyy-mm-dd (not used for Alpha Vantage)
 
     Returns:
-        str: Balance sheet data with normalized fields
+        ToolResult: Balance sheet data with normalized fields
     """
-    params = {
-        "symbol": ticker,
-    }
+    return _statement_result("BALANCE_SHEET", "Balance Sheet data", ticker)
 
-    return _make_api_request("BALANCE_SHEET", params)
 
-
-def get_cashflow(ticker: str, freq: str = "quarterly", curr_date: str = None) -> str:
+def get_cashflow(ticker: str, freq: str = "quarterly", curr_date: str = None) -> ToolResult:
     """
     Retrieve cash flow statement data for a given ticker symbol using Alpha Vantage.
 
@@ -48,16 +52,12 @@ def get_cashflow(ticker: str, freq: str = "quarterly", curr_date: str = None) ->
         curr_date (str): Current date you are trading at, yyyy-mm-dd (not used for Alpha Vantage)
 
     Returns:
-        str: Cash flow statement data with normalized fields
+        ToolResult: Cash flow statement data with normalized fields
     """
-    params = {
-        "symbol": ticker,
-    }
-
-    return _make_api_request("CASH_FLOW", params)
+    return _statement_result("CASH_FLOW", "Cash Flow data", ticker)
 
 
-def get_income_statement(ticker: str, freq: str = "quarterly", curr_date: str = None) -> str:
+def get_income_statement(ticker: str, freq: str = "quarterly", curr_date: str = None) -> ToolResult:
     """
     Retrieve income statement data for a given ticker symbol using Alpha Vantage.
 
@@ -67,11 +67,7 @@ def get_income_statement(ticker: str, freq: str = "quarterly", curr_date: str =
         curr_date (str): Current date you are trading at, yyyy-mm-dd (not used for Alpha Vantage)
 
     Returns:
-        str: Income statement data with normalized fields
+        ToolResult: Income statement data with normalized fields
     """
-    params = {
-        "symbol": ticker,
-    }
-
-    return _make_api_request("INCOME_STATEMENT", params)
+    return _statement_result("INCOME_STATEMENT", "Income Statement data", ticker)
 
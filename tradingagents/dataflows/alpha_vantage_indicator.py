@@ -1,4 +1,5 @@
-from .alpha_vantage_common import _make_api_request
+from .alpha_vantage_common import _make_api_request, _read_csv_response
+from .results import ToolResult
 
 def get_indicator(
     symbol: str,
@@ -8,7 +9,7 @@ def get_indicator(
     interval: str = "daily",
     time_period: int = 14,
     series_type: str = "close"
-) -> str:
+) -> ToolResult | str:
     """
     Returns Alpha Vantage technical indicator values over a time window.
 
@@ -22,10 +23,11 @@ def get_indicator(
         series_type: The desired price type (close, open, high, low)
 
     Returns:
-        String containing indicator values and description
+        Table of indicator values over the window, with the description as a note
     """
     from datetime import datetime
     from dateutil.relativedelta import relativedelta
+    import pandas as pd
 
     supported_indicators = {
         "close_50_sma": ("50 SMA", "close"),
@@ -149,17 +151,12 @@ def get_indicator(
         else:
             return f"Error: Indicator {indicator} not implemented yet."
 
-        # Parse CSV data and extract values for the date range
-        lines = data.strip().split('\n')
-        if len(lines) < 2:
+        # Parse CSV data once and extract values for the date range
+        df = _read_csv_response(indicator, data)
+        if df.empty:
             return f"Error: No data returned for {indicator}"
-
-        # Parse header and data
-        header = [col.strip() for col in lines[0].split(',')]
-        try:
-            date_col_idx = header.index('time')
-        except ValueError:
-            return f"Error: 'time' column not found in data for {indicator}. Available columns: {header}"
+        if "time" not in df.columns:
+            return f"Error: 'time' column not found in data for {indicator}. Available columns: {list(df.columns)}"
 
         # Map internal indicator names to expected CSV column names from Alpha Vantage
         col_name_map = {
@@ -169,53 +166,30 @@ def get_indicator(
             "close_50_sma": "SMA", "close_200_sma": "SMA"
         }
 
-        target_col_name = col_name_map.get(indicator)
-
-        if not target_col_name:
-            # Default to the second column if no specific mapping exists
-            value_col_idx = 1
-        else:
-            try:
-                value_col_idx = header.index(target_col_name)
-            except ValueError:
-                return f"Error: Column '{target_col_name}' not found for indicator '{indicator}'. Available columns: {header}"
-
-        result_data = []
-        for line in lines[1:]:
-            if not line.strip():
-                continue
-            values = line.split(',')
-            if len(values) > value_col_idx:
-                try:
-                    date_str = values[date_col_idx].strip()
-                    # Parse the date
-                    date_dt = datetime.strptime(date_str, "%Y-%m-%d")
-
-                    # Check if date is in our range
-                    if before <= date_dt <= curr_date_dt:
-                        value = values[value_col_idx].strip()
-                        result_data.append((date_dt, value))
-                except (ValueError, IndexError):
-                    continue
-
-        # Sort by date and format output
-        result_data.sort(key=lambda x: x[0])
-
-        ind_string = ""
-        for date_dt, value in result_data:
-            ind_string += f"{date_dt.strftime('%Y-%m-%d')}: {value}\n"
-
-        if not ind_string:
-            ind_string = "No data available for the specified date range.\n"
-
-        result_str = (
-            f"## {indicator.upper()} values from {before.strftime('%Y-%m-%d')} to {curr_date}:\n\n"
-            + ind_string
-            + "\n\n"
-            + indicator_descriptions.get(indicator, "No description available.")
+        # Default to the second column if no specific mapping exists
+        target_col_name = col_name_map.get(indicator, df.columns[1])
+        if target_col_name not in df.columns:
+            return f"Error: Column '{target_col_name}' not found for indicator '{indicator}'. Available columns: {list(df.columns)}"
+
+        dates = pd.to_datetime(df["time"], errors="coerce")
+        window = df[(dates >= before) & (dates <= curr_date_dt)]
+        table = (
+            pd.DataFrame({"Date": window["time"].astype(str), indicator: window[target_col_name]})
+            .sort_values("Date")
+            .reset_index(drop=True)
         )
 
-        return result_str
+        notes = [indicator_descriptions.get(indicator, "No description available.")]
+        if table.empty:
+            notes.insert(0, "No data available for the specified date range.")
+
+        return ToolResult(
+            kind="table",
+            data=table,
+            title=f"{indicator.upper()} values from {before.strftime('%Y-%m-%d')} to {curr_date}",
+            source="alpha_vantage",
+            notes=notes,
+        )
 
     except Exception as e:
         print(f"Error getting Alpha Vantage indicator data for {indicator}: {e}")
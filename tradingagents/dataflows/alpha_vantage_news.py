@@ -1,7 +1,8 @@
 from datetime import datetime, timedelta
-from .alpha_vantage_common import _make_api_request, format_datetime_for_api
+from .alpha_vantage_common import _make_api_request_json, format_datetime_for_api
+from .results import ToolResult
 
-def get_global_news(curr_date, look_back_days=7, limit=50) -> str:
+def get_global_news(curr_date, look_back_days=7, limit=50) -> ToolResult:
     """Returns global/macroeconomic news from Alpha Vantage.
 
     Args:
@@ -10,7 +11,7 @@ def get_global_news(curr_date, look_back_days=7, limit=50) -> str:
         limit: Maximum number of articles to return.
 
     Returns:
-        String containing global news data.
+        Parsed NEWS_SENTIMENT payload.
     """
     end_date = datetime.strptime(curr_date, "%Y-%m-%d")
     start_date = end_date - timedelta(days=look_back_days)
@@ -23,9 +24,14 @@ def get_global_news(curr_date, look_back_days=7, limit=50) -> str:
         "limit": str(limit),
     }
 
-    return _make_api_request("NEWS_SENTIMENT", params)
+    return ToolResult(
+        kind="json",
+        data=_make_api_request_json("NEWS_SENTIMENT", params),
+        title=f"Global news from {start_date.strftime('%Y-%m-%d')} to {curr_date}",
+        source="alpha_vantage",
+    )
 
-def get_news(ticker, start_date, end_date) -> dict[str, str] | str:
+def get_news(ticker, start_date, end_date) -> ToolResult:
     """Returns live and historical market news & sentiment data from premier news outlets worldwide.
 
     Covers stocks, cryptocurrencies, forex, and topics like fiscal policy, mergers & acquisitions, IPOs.
@@ -36,7 +42,7 @@ def get_news(ticker, start_date, end_date) -> dict[str, str] | str:
         end_date: End date for news search.
 
     Returns:
-        Dictionary containing news sentiment data or JSON string.
+        Parsed NEWS_SENTIMENT payload.
     """
 
     params = {
@@ -47,9 +53,14 @@ def get_news(ticker, start_date, end_date) -> dict[str, str] | str:
         "limit": "50",
     }
     
-    return _make_api_request("NEWS_SENTIMENT", params)
-
-def get_insider_transactions(symbol: str) -> dict[str, str] | str:
+    return ToolResult(
+        kind="json",
+        data=_make_api_request_json("NEWS_SENTIMENT", params),
+        title=f"News for {ticker} from {start_date} to {end_date}",
+        source="alpha_vantage",
+    )
+
+def get_insider_transactions(symbol: str) -> ToolResult:
     """Returns latest and historical insider transactions by key stakeholders.
 
     Covers transactions by founders, executives, board members, etc.
@@ -58,11 +69,16 @@ def get_insider_transactions(symbol: str) -> dict[str, str] | str:
         symbol: Ticker symbol. Example: "IBM".
 
     Returns:
-        Dictionary containing insider transaction data or JSON string.
+        Parsed INSIDER_TRANSACTIONS payload.
     """
 
     params = {
         "symbol": symbol,
     }
 
-    return _make_api_request("INSIDER_TRANSACTIONS", params)
\ No newline at end of file
+    return ToolResult(
+        kind="json",
+        data=_make_api_request_json("INSIDER_TRANSACTIONS", params),
+        title=f"Insider Transactions data for {symbol.upper()}",
+        source="alpha_vantage",
+    )
\ No newline at end of file
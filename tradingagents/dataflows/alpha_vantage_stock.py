@@ -1,11 +1,12 @@
 from datetime import datetime
-from .alpha_vantage_common import _make_api_request, _filter_csv_by_date_range
+from .alpha_vantage_common import _make_api_request, _read_csv_response, _filter_frame_by_date_range
+from .results import ToolResult
 
 def get_stock(
     symbol: str,
     start_date: str,
     end_date: str
-) -> str:
+) -> ToolResult:
     """
     Returns raw daily OHLCV values, adjusted close values, and historical split/dividend events
     filtered to the specified date range.
@@ -16,7 +17,7 @@ def get_stock(
         end_date: End date in yyyy-mm-dd format
 
     Returns:
-        CSV string containing the daily adjusted time series data filtered to the date range.
+        Table of the daily adjusted time series data filtered to the date range.
     """
     # Parse dates to determine the range
     start_dt = datetime.strptime(start_date, "%Y-%m-%d")
@@ -34,5 +35,17 @@ def get_stock(
     }
 
     response = _make_api_request("TIME_SERIES_DAILY_ADJUSTED", params)
+    data = _filter_frame_by_date_range(
+        _read_csv_response("TIME_SERIES_DAILY_ADJUSTED", response), start_date, end_date
+    )
+    if data.empty:
+        return f"No data found for symbol '{symbol}' between {start_date} and {end_date}"
 
-    return _filter_csv_by_date_range(response, start_date, end_date)
\ No newline at end of file
+    return ToolResult(
+        kind="table",
+        data=data,
+        title=f"Stock data for {symbol.upper()} from {start_date} to {end_date}",
+        source="alpha_vantage",
+        notes=[f"Total records: {len(data)}"],
+        as_of=today.strftime("%Y-%m-%d %H:%M:%S"),
+    )
@@ -0,0 +1,95 @@
+"""Shared on-disk cache helpers for dataflow vendors."""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+
+import pandas as pd
+
+
+def _tmp_path(path: Path) -> Path:
+    # Unique per process/thread so concurrent writers never clobber each other's temp file.
+    return path.with_suffix(path.suffix + f".{os.getpid()}.{threading.get_ident()}.tmp")
+
+
+def atomic_write_text(path: Path, text: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = _tmp_path(path)
+    tmp_path.write_text(text, encoding="utf-8")
+    tmp_path.replace(path)
+
+
+def atomic_write_bytes(path: Path, payload: bytes) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = _tmp_path(path)
+    tmp_path.write_bytes(payload)
+    tmp_path.replace(path)
+
+
+def cache_is_fresh(path: Path, ttl_seconds: int | None) -> bool:
+    if not path.exists():
+        return False
+    if ttl_seconds is None:
+        return True
+    try:
+        age_seconds = time.time() - path.stat().st_mtime
+    except OSError:
+        return False
+    return age_seconds <= ttl_seconds
+
+
+def cache_as_of(path: Path) -> str | None:
+    """Modification time of a cache file, formatted like vendor `retrieved on` stamps."""
+    try:
+        return datetime.fromtimestamp(path.stat().st_mtime).strftime("%Y-%m-%d %H:%M:%S")
+    except OSError:
+        return None
+
+
+def write_frame(path: Path, df: pd.DataFrame) -> None:
+    """Persist a DataFrame in binary (pickle) form, preserving dtypes and index."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = _tmp_path(path)
+    df.to_pickle(tmp_path)
+    tmp_path.replace(path)
+
+
+def read_frame(path: Path) -> pd.DataFrame:
+    return pd.read_pickle(path)
+
+
+class KeyedLocks:
+    """Per-key locks that exist only while some caller holds or waits on them.
+
+    `with locks.hold(key):` serializes callers of the same key (single-flight fetches)
+    without keeping a lock per key for the life of the process.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._entries: dict = {}
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    @contextmanager
+    def hold(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                entry = self._entries[key] = [threading.Lock(), 0]
+            entry[1] += 1
+        try:
+            with entry[0]:
+                yield
+        finally:
+            with self._lock:
+                entry[1] -= 1
+                if entry[1] == 0:
+                    del self._entries[key]
@@ -35,6 +35,9 @@ from .akshare_data import (
 
 # Configuration and routing logic
 from .config import get_config
+from .results import ToolResult
+from .shared_cache import cache_key, get_or_fetch
+from .tool_results import get_or_route, memo_enabled
 
 # Tools organized by category
 TOOLS_CATEGORIES = {
@@ -174,6 +177,11 @@ def _result_failure_reason(method: str, result) -> str | None:
     if result is None:
         return "returned None"
 
+    if isinstance(result, ToolResult):
+        if result.is_empty() and method not in _ALLOW_EMPTY_RESULTS_METHODS:
+            return f"returned empty {result.kind} result"
+        return None
+
     if isinstance(result, str):
         stripped = result.strip()
         if stripped == "":
@@ -193,8 +201,45 @@ def _result_failure_reason(method: str, result) -> str | None:
     return None
 
 
+# Methods whose output depends only on the date window, not the ticker. Their results are
+# shared across runs (see shared_cache) under a key that excludes any ticker.
+_DATE_SCOPED_METHODS = {"get_global_news"}
+
+
 def route_to_vendor(method: str, *args, **kwargs):
     """Route method calls to appropriate vendor implementation with fallback support."""
+    if memo_enabled():
+        config = get_config()
+        key = cache_key(
+            method,
+            get_vendor(get_category_for_method(method), method),
+            config.get("disable_vendor_fallback", False),
+            list(args),
+            kwargs,
+        )
+        # Identical calls (e.g. a prefetched one) within the memo TTL are served from memory.
+        return get_or_route(key, lambda: _route_shared(method, *args, **kwargs))
+    return _route_shared(method, *args, **kwargs)
+
+
+def _route_shared(method: str, *args, **kwargs):
+    config = get_config()
+    if method in _DATE_SCOPED_METHODS and config.get("shared_cache_enabled", True):
+        curr_date = kwargs.get("curr_date", args[0] if args else None)
+        if curr_date:
+            vendor_config = get_vendor(get_category_for_method(method), method)
+            key = cache_key(
+                method,
+                vendor_config,
+                config.get("disable_vendor_fallback", False),
+                list(args),
+                kwargs,
+            )
+            return get_or_fetch(key, curr_date, lambda: _route_to_vendor(method, *args, **kwargs))
+    return _route_to_vendor(method, *args, **kwargs)
+
+
+def _route_to_vendor(method: str, *args, **kwargs):
     category = get_category_for_method(method)
     vendor_config = get_vendor(category, method)
     config = get_config()
@@ -368,9 +413,8 @@ def route_to_vendor(method: str, *args, **kwargs):
     else:
         print(f"FINAL: Method '{method}' completed with {len(results)} result(s) from {vendor_attempt_count} vendor attempt(s)")
 
-    # Return single result if only one, otherwise concatenate as string
+    # Return single result if only one, otherwise the list of results.
+    # Stringification happens once, at the tool boundary (see rendering.render_tool_output).
     if len(results) == 1:
         return results[0]
-    else:
-        # Convert all results to strings and concatenate
-        return '\n'.join(str(result) for result in results)
+    return results
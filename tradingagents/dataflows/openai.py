@@ -1,55 +1,72 @@
+import hashlib
+import json
+import threading
+from datetime import datetime, timedelta
+from pathlib import Path
+
 from openai import OpenAI
+from .cache_utils import KeyedLocks, atomic_write_text, cache_is_fresh
 from .config import get_config
+from .results import ToolResult
 
+_CLIENTS: dict[str, OpenAI] = {}
+_CLIENTS_LOCK = threading.Lock()
 
-def get_stock_news_openai(query, start_date, end_date):
-    config = get_config()
-    client = OpenAI(base_url=config["backend_url"])
+# Per-key locks: concurrent callers asking for the same search wait for the first one
+# and then read its cached result instead of issuing their own request.
+_SEARCH_KEY_LOCKS = KeyedLocks()
 
-    response = client.responses.create(
-        model=config["quick_think_llm"],
-        input=[
-            {
-                "role": "system",
-                "content": [
-                    {
-                        "type": "input_text",
-                        "text": f"Can you search Social Media for {query} from {start_date} to {end_date}? Make sure you only get the data posted during that period.",
-                    }
-                ],
-            }
-        ],
-        text={"format": {"type": "text"}},
-        reasoning={},
-        tools=[
-            {
-                "type": "web_search_preview",
-                "user_location": {"type": "approximate"},
-                "search_context_size": "low",
-            }
-        ],
-        temperature=1,
-        max_output_tokens=4096,
-        top_p=1,
-        store=True,
-    )
 
-    return response.output[1].content[0].text
+def _get_client() -> OpenAI:
+    """Process-wide client per backend URL (keeps the HTTP connection pool warm)."""
+    backend_url = get_config()["backend_url"]
+    with _CLIENTS_LOCK:
+        client = _CLIENTS.get(backend_url)
+        if client is None:
+            client = OpenAI(base_url=backend_url)
+            _CLIENTS[backend_url] = client
+        return client
 
 
-def get_global_news_openai(curr_date, look_back_days=7, limit=5):
+def _get_openai_cache_dir() -> Path:
     config = get_config()
-    client = OpenAI(base_url=config["backend_url"])
+    return Path(config.get("data_cache_dir", "dataflows/data_cache")) / "openai"
 
-    response = client.responses.create(
-        model=config["quick_think_llm"],
+
+def _window_is_closed(end_date: str) -> bool:
+    """A search window that ended before today will not gain new posts; cache it indefinitely."""
+    try:
+        return datetime.strptime(end_date, "%Y-%m-%d").date() < datetime.now().date()
+    except ValueError:
+        return False
+
+
+def _cache_path(function_name: str, model: str, query: str, start_date: str, end_date: str) -> Path:
+    key = json.dumps([function_name, model, query, start_date, end_date], ensure_ascii=False)
+    digest = hashlib.sha256(key.encode("utf-8")).hexdigest()[:32]
+    return _get_openai_cache_dir() / function_name / f"{end_date}-{digest}.json"
+
+
+def _read_cached_search(path: Path, end_date: str) -> dict | None:
+    ttl = None if _window_is_closed(end_date) else int(get_config().get("openai_cache_ttl_seconds", 60 * 60 * 6))
+    if not cache_is_fresh(path, ttl):
+        return None
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+
+def _web_search(prompt: str, model: str) -> str:
+    response = _get_client().responses.create(
+        model=model,
         input=[
             {
                 "role": "system",
                 "content": [
                     {
                         "type": "input_text",
-                        "text": f"Can you search global or macroeconomics news from {look_back_days} days before {curr_date} to {curr_date} that would be informative for trading purposes? Make sure you only get the data posted during that period. Limit the results to {limit} articles.",
+                        "text": prompt,
                     }
                 ],
             }
@@ -68,40 +85,102 @@ def get_global_news_openai(curr_date, look_back_days=7, limit=5):
         top_p=1,
         store=True,
     )
-
     return response.output[1].content[0].text
 
 
-def get_fundamentals_openai(ticker, curr_date):
+def _cached_web_search(
+    function_name: str,
+    query: str,
+    start_date: str,
+    end_date: str,
+    prompt: str,
+    title: str,
+) -> ToolResult:
+    """
+    Run a web-search prompt through a persistent cache keyed by
+    (function, model, query, date window).
+
+    Results for windows that closed before today never expire; open windows use
+    `openai_cache_ttl_seconds`. Identical in-flight searches are coalesced.
+    """
     config = get_config()
-    client = OpenAI(base_url=config["backend_url"])
+    model = config["quick_think_llm"]
+    use_cache = config.get("openai_cache_enabled", True)
+    path = _cache_path(function_name, model, query, start_date, end_date)
 
-    response = client.responses.create(
-        model=config["quick_think_llm"],
-        input=[
-            {
-                "role": "system",
-                "content": [
+    def _from_cache(entry: dict) -> ToolResult:
+        return ToolResult(
+            kind="text",
+            data=entry["text"],
+            title=title,
+            source="openai",
+            as_of=entry.get("retrieved_at"),
+            cached=True,
+        )
+
+    if not use_cache:
+        return ToolResult(kind="text", data=_web_search(prompt, model), title=title, source="openai")
+
+    entry = _read_cached_search(path, end_date)
+    if entry is not None:
+        return _from_cache(entry)
+
+    with _SEARCH_KEY_LOCKS.hold(str(path)):
+        # Another thread may have finished the same search while we waited.
+        entry = _read_cached_search(path, end_date)
+        if entry is not None:
+            return _from_cache(entry)
+
+        text = _web_search(prompt, model)
+        retrieved_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        if text and text.strip():
+            atomic_write_text(
+                path,
+                json.dumps(
                     {
-                        "type": "input_text",
-                        "text": f"Can you search Fundamental for discussions on {ticker} during of the month before {curr_date} to the month of {curr_date}. Make sure you only get the data posted during that period. List as a table, with PE/PS/Cash flow/ etc",
-                    }
-                ],
-            }
-        ],
-        text={"format": {"type": "text"}},
-        reasoning={},
-        tools=[
-            {
-                "type": "web_search_preview",
-                "user_location": {"type": "approximate"},
-                "search_context_size": "low",
-            }
-        ],
-        temperature=1,
-        max_output_tokens=4096,
-        top_p=1,
-        store=True,
+                        "function": function_name,
+                        "model": model,
+                        "query": query,
+                        "start_date": start_date,
+                        "end_date": end_date,
+                        "retrieved_at": retrieved_at,
+                        "text": text,
+                    },
+                    ensure_ascii=False,
+                ),
+            )
+        return ToolResult(kind="text", data=text, title=title, source="openai", as_of=retrieved_at)
+
+
+def get_stock_news_openai(query, start_date, end_date):
+    return _cached_web_search(
+        "get_stock_news_openai",
+        query,
+        start_date,
+        end_date,
+        prompt=f"Can you search Social Media for {query} from {start_date} to {end_date}? Make sure you only get the data posted during that period.",
+        title=f"Social media and news for {query} from {start_date} to {end_date}",
     )
 
-    return response.output[1].content[0].text
\ No newline at end of file
+
+def get_global_news_openai(curr_date, look_back_days=7, limit=5):
+    start_date = (datetime.strptime(curr_date, "%Y-%m-%d") - timedelta(days=look_back_days)).strftime("%Y-%m-%d")
+    return _cached_web_search(
+        "get_global_news_openai",
+        f"limit={limit}",
+        start_date,
+        curr_date,
+        prompt=f"Can you search global or macroeconomics news from {look_back_days} days before {curr_date} to {curr_date} that would be informative for trading purposes? Make sure you only get the data posted during that period. Limit the results to {limit} articles.",
+        title=f"Global news for the {look_back_days} days before {curr_date}",
+    )
+
+
+def get_fundamentals_openai(ticker, curr_date):
+    return _cached_web_search(
+        "get_fundamentals_openai",
+        ticker,
+        curr_date,
+        curr_date,
+        prompt=f"Can you search Fundamental for discussions on {ticker} during of the month before {curr_date} to the month of {curr_date}. Make sure you only get the data posted during that period. List as a table, with PE/PS/Cash flow/ etc",
+        title=f"Fundamentals discussion for {ticker} up to {curr_date}",
+    )
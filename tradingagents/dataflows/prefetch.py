@@ -0,0 +1,92 @@
+"""
+Deterministic data prefetch for a (ticker, trade date).
+
+For a given run the analysts' first tool calls are predictable: the market analyst pulls a
+price window and a handful of indicators, the fundamentals analyst the three statements,
+the news analysts the past week of news. `prefetch_plan` lists those `route_to_vendor`
+calls and `start_prefetch` issues them concurrently. Their results land in the tool-result
+memo (`tool_results`) and in the vendors' own disk caches (full price history, statement
+bundles), so the LLM's later calls return from memory or join the fetch already in flight.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, List, Tuple
+
+from .interface import route_to_vendor
+
+PrefetchCall = Tuple[str, Tuple[Any, ...]]
+
+DEFAULT_INDICATORS = ("close_50_sma", "close_200_sma", "close_10_ema", "macd", "rsi", "boll", "atr")
+
+_POOLS: Dict[int, ThreadPoolExecutor] = {}
+_POOLS_LOCK = threading.Lock()
+
+
+def _days_before(date: str, days: int) -> str:
+    return (datetime.strptime(date, "%Y-%m-%d") - timedelta(days=days)).strftime("%Y-%m-%d")
+
+
+def prefetch_plan(analysts: Iterable[str], ticker: str, trade_date: str, config: Dict[str, Any]) -> List[PrefetchCall]:
+    """The predictable tool calls of `analysts`, with the tools' default arguments.
+
+    Only tools the analyst is bound to are planned; a prefetch nobody reads is a wasted vendor call.
+    """
+    price_days = int(config.get("prefetch_price_lookback_days", 90))
+    news_days = int(config.get("prefetch_news_lookback_days", 7))
+    week_ago = _days_before(trade_date, news_days)
+
+    plans: Dict[str, List[PrefetchCall]] = {
+        "market": [("get_stock_data", (ticker, _days_before(trade_date, price_days), trade_date))]
+        + [
+            ("get_indicators", (ticker, indicator, trade_date, 30))
+            for indicator in config.get("prefetch_indicators", DEFAULT_INDICATORS)
+        ],
+        "social": [("get_news", (ticker, week_ago, trade_date))],
+        "news": [
+            ("get_news", (ticker, week_ago, trade_date)),
+            ("get_global_news", (trade_date, 7, 5)),
+        ],
+        "fundamentals": [
+            ("get_fundamentals", (ticker, trade_date)),
+            ("get_balance_sheet", (ticker, "quarterly", trade_date)),
+            ("get_cashflow", (ticker, "quarterly", trade_date)),
+            ("get_income_statement", (ticker, "quarterly", trade_date)),
+        ],
+    }
+    calls: List[PrefetchCall] = []
+    for analyst in analysts:
+        for call in plans.get(analyst, []):
+            if call not in calls:
+                calls.append(call)
+    return calls
+
+
+def _get_pool(max_workers: int) -> ThreadPoolExecutor:
+    """Process-wide prefetch pool of a given size, shared by every run configured with it."""
+    with _POOLS_LOCK:
+        pool = _POOLS.get(max_workers)
+        if pool is None:
+            pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="ta-prefetch")
+            _POOLS[max_workers] = pool
+        return pool
+
+
+def _fetch(method: str, args: Tuple[Any, ...]) -> bool:
+    try:
+        route_to_vendor(method, *args)
+        return True
+    except Exception as e:
+        # The analyst's own call will surface the error; prefetch is best-effort.
+        logging.getLogger(__name__).info("Prefetch of %s%s failed: %s", method, args, e)
+        return False
+
+
+def start_prefetch(calls: List[PrefetchCall], max_workers: int = 8) -> List[Future]:
+    """Submit `calls` to the shared prefetch pool; each future resolves to True on success."""
+    pool = _get_pool(max(1, int(max_workers)))
+    return [pool.submit(_fetch, method, args) for method, args in calls]
@@ -0,0 +1,513 @@
+"""
+Compact rendering of vendor results at the `@tool` boundary.
+
+Vendor functions return verbose payloads (full-precision CSV dumps, raw Alpha Vantage JSON,
+long web-search answers). Tool output is re-sent to the LLM on every subsequent turn of an
+analyst loop, so this module normalizes each result into a `ToolResult` and renders it in a
+compact form: rounded numbers, dropped empty/redundant columns, and a per-tool token budget.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+import threading
+from io import StringIO
+from typing import Any, Dict
+
+import pandas as pd
+
+from tradingagents.utils.tokens import count_tokens, truncate_to_tokens
+
+from .config import get_config
+from .results import ToolResult
+
+# Header lines that carry no information for the LLM.
+_NOISE_HEADER_PREFIXES = ("data retrieved on:", "cache file:")
+
+_DEFAULT_TOKEN_BUDGETS: Dict[str, int] = {
+    "get_stock_data": 2500,
+    "get_indicators": 1200,
+    "get_fundamentals": 1500,
+    "get_balance_sheet": 2500,
+    "get_cashflow": 2500,
+    "get_income_statement": 2500,
+    "get_news": 2500,
+    "get_global_news": 2000,
+    "get_insider_sentiment": 1200,
+    "get_insider_transactions": 1500,
+}
+
+_NEWS_SUMMARY_MAX_CHARS = 400
+
+
+class RenderStats:
+    """Thread-safe counters for tool output rendering."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._per_method: Dict[str, Dict[str, int]] = {}
+
+    def record(self, method: str, raw_tokens: int, rendered_tokens: int) -> None:
+        with self._lock:
+            entry = self._per_method.setdefault(
+                method, {"calls": 0, "raw_tokens": 0, "rendered_tokens": 0, "tokens_saved": 0}
+            )
+            entry["calls"] += 1
+            entry["raw_tokens"] += raw_tokens
+            entry["rendered_tokens"] += rendered_tokens
+            entry["tokens_saved"] += max(0, raw_tokens - rendered_tokens)
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            per_method = {k: dict(v) for k, v in self._per_method.items()}
+        totals = {"calls": 0, "raw_tokens": 0, "rendered_tokens": 0, "tokens_saved": 0}
+        for entry in per_method.values():
+            for key in totals:
+                totals[key] += entry[key]
+        return {"totals": totals, "per_method": per_method}
+
+    def reset(self) -> None:
+        with self._lock:
+            self._per_method.clear()
+
+
+_STATS = RenderStats()
+
+
+def get_render_stats() -> Dict[str, Any]:
+    """Return token counters (raw vs rendered) for all tool outputs rendered in this process."""
+    return _STATS.snapshot()
+
+
+def reset_render_stats() -> None:
+    _STATS.reset()
+
+
+def _get_token_budget(method: str, config: Dict[str, Any]) -> int:
+    budgets = dict(_DEFAULT_TOKEN_BUDGETS)
+    budgets.update(config.get("tool_output_token_budgets") or {})
+    return int(budgets.get(method, config.get("tool_output_default_token_budget", 2000)))
+
+
+# ---------------------------------------------------------------------------
+# Normalization
+# ---------------------------------------------------------------------------
+
+
+def _split_header(text: str) -> tuple[list[str], str]:
+    """Split leading `# ...` header lines (vendor convention) from the body."""
+    lines = text.splitlines()
+    header: list[str] = []
+    idx = 0
+    while idx < len(lines):
+        line = lines[idx]
+        if line.startswith("# "):
+            header.append(line[2:].strip())
+        elif line.strip():
+            break
+        idx += 1
+    return header, "\n".join(lines[idx:])
+
+
+def _try_parse_csv(body: str) -> pd.DataFrame | None:
+    lines = [line for line in body.splitlines() if line.strip()]
+    if len(lines) < 2 or "," not in lines[0]:
+        return None
+    try:
+        df = pd.read_csv(StringIO(body))
+    except Exception:
+        return None
+    if df.shape[1] < 2:
+        return None
+    first_col = str(df.columns[0])
+    if first_col == "" or first_col.startswith("Unnamed: 0"):
+        df = df.set_index(df.columns[0])
+        df.index.name = None
+    return df
+
+
+def normalize_result(raw: Any, *, source: str = "") -> ToolResult:
+    """Convert whatever a vendor returned into a `ToolResult`."""
+    if isinstance(raw, ToolResult):
+        return raw
+    if isinstance(raw, pd.DataFrame):
+        return ToolResult(kind="table", data=raw, source=source)
+    if isinstance(raw, (dict, list)):
+        return ToolResult(kind="json", data=raw, source=source)
+
+    text = "" if raw is None else str(raw)
+    header, body = _split_header(text)
+    title = header[0] if header else ""
+    notes = [
+        line for line in header[1:] if not line.lower().startswith(_NOISE_HEADER_PREFIXES)
+    ]
+
+    stripped = body.strip()
+    if stripped.startswith(("{", "[")):
+        try:
+            return ToolResult(
+                kind="json", data=json.loads(stripped), title=title, source=source, notes=notes
+            )
+        except ValueError:
+            pass
+
+    df = _try_parse_csv(stripped)
+    if df is not None:
+        return ToolResult(kind="table", data=df, title=title, source=source, notes=notes)
+
+    if header:
+        return ToolResult(kind="text", data=stripped, title=title, source=source, notes=notes)
+    return ToolResult(kind="text", data=text, source=source)
+
+
+# ---------------------------------------------------------------------------
+# Plain (lossless) rendering
+# ---------------------------------------------------------------------------
+
+
+def _has_default_index(df: pd.DataFrame) -> bool:
+    return isinstance(df.index, pd.RangeIndex)
+
+
+def _header_block(result: ToolResult) -> str:
+    lines = []
+    if result.title:
+        lines.append(f"# {result.title}" + (" (cached)" if result.cached else ""))
+    lines.extend(f"# {note}" for note in result.notes)
+    if result.as_of:
+        lines.append(f"# Data retrieved on: {result.as_of}")
+    return ("\n".join(lines) + "\n\n") if lines else ""
+
+
+def render_plain(result: ToolResult) -> str:
+    """Lossless rendering, equivalent to what vendors used to return as strings."""
+    if result.kind == "table":
+        body = result.data.to_csv(index=not _has_default_index(result.data))
+    elif result.kind == "json":
+        body = json.dumps(result.data, ensure_ascii=False, indent=2, default=str)
+    else:
+        body = str(result.data)
+    return _header_block(result) + body
+
+
+# ---------------------------------------------------------------------------
+# Compact rendering
+# ---------------------------------------------------------------------------
+
+
+def _format_float_factory(decimals: int):
+    def _format(value: float) -> str:
+        if abs(value) >= 1000:
+            return f"{value:.0f}"
+        if 0 < abs(value) < 1:
+            # Keep significant digits for small values (oscillators, ratios).
+            return f"{value:.{max(decimals, 3)}g}"
+        text = f"{value:.{decimals}f}"
+        if "." in text:
+            text = text.rstrip("0").rstrip(".")
+        return text or "0"
+
+    return _format
+
+
+def _is_empty_value(value: Any) -> bool:
+    if value is None:
+        return True
+    if isinstance(value, float) and pd.isna(value):
+        return True
+    if isinstance(value, str) and value.strip() in ("", "None", "nan", "NaN", "-"):
+        return True
+    if isinstance(value, (list, dict)) and not value:
+        return True
+    return False
+
+
+def _format_label(label: Any) -> Any:
+    if isinstance(label, pd.Timestamp):
+        if label.tzinfo is not None:
+            label = label.tz_localize(None)
+        if label == label.normalize():
+            return label.strftime("%Y-%m-%d")
+        return label.strftime("%Y-%m-%d %H:%M")
+    return label
+
+
+def _compact_table(df: pd.DataFrame) -> pd.DataFrame:
+    df = df.copy()
+    df = df.replace({"None": pd.NA, "": pd.NA})
+    df = df.dropna(axis=1, how="all").dropna(axis=0, how="all")
+
+    for col in df.columns:
+        series = df[col]
+        if pd.api.types.is_object_dtype(series):
+            try:
+                df[col] = pd.to_numeric(series)
+            except (ValueError, TypeError):
+                pass
+        elif pd.api.types.is_datetime64_any_dtype(series):
+            df[col] = series.map(_format_label)
+
+    if len(df) > 1:
+        # Drop constant-zero columns (e.g. Dividends / Stock Splits in price history).
+        numeric_cols = [c for c in df.columns if pd.api.types.is_numeric_dtype(df[c])]
+        zero_cols = [c for c in numeric_cols if (df[c].fillna(0) == 0).all()]
+        if zero_cols and len(zero_cols) < df.shape[1]:
+            df = df.drop(columns=zero_cols)
+
+    if df.shape[1] > 1:
+        # Drop columns that duplicate an earlier column (e.g. Adj Close == Close).
+        df = df.loc[:, ~df.T.duplicated()]
+
+    if isinstance(df.index, pd.DatetimeIndex):
+        df.index = [_format_label(v) for v in df.index]
+    df.columns = [_format_label(c) for c in df.columns]
+    return df
+
+
+def _date_order(values) -> str | None:
+    """Return 'asc'/'desc' when `values` look like dates, else None."""
+    values = list(values)
+    if len(values) < 2:
+        return None
+    parsed = pd.to_datetime(pd.Series([str(v) for v in values]), errors="coerce", format="mixed")
+    if parsed.notna().mean() < 0.8:
+        return None
+    valid = parsed.dropna()
+    if len(valid) < 2:
+        return None
+    return "asc" if valid.iloc[0] <= valid.iloc[-1] else "desc"
+
+
+def _table_to_text(df: pd.DataFrame, decimals: int) -> str:
+    return df.to_csv(
+        index=not _has_default_index(df), float_format=_format_float_factory(decimals)
+    )
+
+
+def _fit_table(df: pd.DataFrame, budget: int, decimals: int) -> tuple[str, str | None]:
+    text = _table_to_text(df, decimals)
+    tokens = count_tokens(text)
+    if tokens <= budget:
+        return text, None
+
+    # Statement layout (dates as columns): drop the oldest periods first.
+    col_order = _date_order(df.columns)
+    dropped_cols = 0
+    while col_order and tokens > budget and df.shape[1] > 1:
+        keep = max(1, int(df.shape[1] * budget / tokens))
+        keep = min(keep, df.shape[1] - 1)
+        dropped_cols += df.shape[1] - keep
+        df = df.iloc[:, :keep] if col_order == "desc" else df.iloc[:, -keep:]
+        text = _table_to_text(df, decimals)
+        tokens = count_tokens(text)
+
+    # Row-wise trimming: keep the most recent rows of a time series.
+    if _has_default_index(df) and df.shape[1] > 0:
+        row_order = _date_order(df.iloc[:, 0])
+    else:
+        row_order = _date_order(df.index)
+    dropped_rows = 0
+    while tokens > budget and len(df) > 1:
+        keep = max(1, int(len(df) * budget / tokens * 0.95))
+        keep = min(keep, len(df) - 1)
+        dropped_rows += len(df) - keep
+        df = df.iloc[-keep:] if row_order == "asc" else df.iloc[:keep]
+        text = _table_to_text(df, decimals)
+        tokens = count_tokens(text)
+
+    omitted = []
+    if dropped_cols:
+        omitted.append(f"{dropped_cols} older period column(s)")
+    if dropped_rows:
+        which = "older " if row_order else ""
+        omitted.append(f"{dropped_rows} {which}row(s)")
+    note = f"Omitted {' and '.join(omitted)} to fit the output budget" if omitted else None
+    return text, note
+
+
+def _truncate_text_to_budget(text: str, budget: int) -> tuple[str, str | None]:
+    tokens = count_tokens(text)
+    if tokens <= budget:
+        return text, None
+    truncated = truncate_to_tokens(text, budget, marker="")
+    return truncated.rstrip() + "\n...", f"Truncated {tokens - budget} token(s) to fit the output budget"
+
+
+def _compact_text(text: str) -> str:
+    lines = [line.rstrip() for line in str(text).splitlines()]
+    return re.sub(r"\n{3,}", "\n\n", "\n".join(lines)).strip()
+
+
+def _drop_empty(value: Any) -> Any:
+    if isinstance(value, dict):
+        cleaned = {k: _drop_empty(v) for k, v in value.items()}
+        return {k: v for k, v in cleaned.items() if not _is_empty_value(v)}
+    if isinstance(value, list):
+        cleaned = [_drop_empty(v) for v in value]
+        return [v for v in cleaned if not _is_empty_value(v)]
+    return value
+
+
+def _format_av_time(value: str) -> str:
+    # Alpha Vantage timestamps look like 20240510T133000.
+    try:
+        return pd.to_datetime(value, format="%Y%m%dT%H%M%S").strftime("%Y-%m-%d %H:%M")
+    except (ValueError, TypeError):
+        return str(value)
+
+
+def _render_news_feed(feed: list[dict]) -> list[str]:
+    blocks = []
+    for article in feed:
+        title = article.get("title", "").strip()
+        published = _format_av_time(article.get("time_published", ""))
+        source = article.get("source", "")
+        lines = [f"### {title} ({published}, {source})"]
+
+        sentiment = article.get("overall_sentiment_label")
+        if sentiment:
+            score = article.get("overall_sentiment_score")
+            lines.append(f"Sentiment: {sentiment}" + (f" ({score})" if score is not None else ""))
+
+        tickers = sorted(
+            article.get("ticker_sentiment") or [],
+            key=lambda t: float(t.get("relevance_score") or 0),
+            reverse=True,
+        )[:3]
+        if tickers:
+            lines.append(
+                "Tickers: "
+                + ", ".join(
+                    f"{t.get('ticker')} {t.get('ticker_sentiment_label', '')}".strip()
+                    for t in tickers
+                )
+            )
+
+        summary = (article.get("summary") or "").strip()
+        if len(summary) > _NEWS_SUMMARY_MAX_CHARS:
+            summary = summary[:_NEWS_SUMMARY_MAX_CHARS].rstrip() + "…"
+        if summary:
+            lines.append(summary)
+        blocks.append("\n".join(lines))
+    return blocks
+
+
+def _reports_to_table(reports: list[dict]) -> pd.DataFrame:
+    """Alpha Vantage statement reports -> line items as rows, periods as columns."""
+    df = pd.DataFrame(reports)
+    if "fiscalDateEnding" in df.columns:
+        df = df.set_index("fiscalDateEnding")
+        df.index.name = None
+    df = df.drop(columns=["reportedCurrency"], errors="ignore")
+    return df.T
+
+
+def _render_json(
+    data: Any, budget: int, decimals: int
+) -> tuple[str, str | None]:
+    data = _drop_empty(data)
+
+    if isinstance(data, dict) and isinstance(data.get("feed"), list):
+        blocks = _render_news_feed(data["feed"])
+        text = "\n\n".join(blocks)
+        dropped = 0
+        while count_tokens(text) > budget and len(blocks) > 1:
+            blocks = blocks[:-1]
+            dropped += 1
+            text = "\n\n".join(blocks)
+        note = f"Omitted {dropped} older article(s) to fit the output budget" if dropped else None
+        if count_tokens(text) > budget:
+            text, note = _truncate_text_to_budget(text, budget)
+        return text, note
+
+    if isinstance(data, dict):
+        report_keys = [
+            k for k, v in data.items()
+            if isinstance(v, list) and v and all(isinstance(r, dict) for r in v)
+        ]
+        scalars = {k: v for k, v in data.items() if not isinstance(v, (list, dict))}
+        if report_keys:
+            parts = [f"{k}: {v}" for k, v in scalars.items()]
+            notes = []
+            per_table_budget = max(200, budget // len(report_keys))
+            for key in report_keys:
+                if key.endswith("Reports"):
+                    table = _compact_table(_reports_to_table(data[key]))
+                else:
+                    table = _compact_table(pd.DataFrame(data[key]))
+                table_text, table_note = _fit_table(table, per_table_budget, decimals)
+                parts.append(f"## {key}\n{table_text.strip()}")
+                if table_note:
+                    notes.append(f"{key}: {table_note}")
+            return "\n\n".join(parts), "; ".join(notes) or None
+
+        if all(not isinstance(v, (list, dict)) for v in data.values()):
+            return _truncate_text_to_budget(
+                "\n".join(f"{k}: {v}" for k, v in data.items()), budget
+            )
+
+    return _truncate_text_to_budget(
+        json.dumps(data, ensure_ascii=False, separators=(",", ":"), default=str), budget
+    )
+
+
+def render_compact(
+    result: ToolResult,
+    method: str,
+    config: Dict[str, Any] | None = None,
+    *,
+    budget: int | None = None,
+) -> str:
+    """Compact, token-budgeted rendering of a `ToolResult` for the LLM."""
+    config = config or get_config()
+    if budget is None:
+        budget = _get_token_budget(method, config)
+    decimals = int(config.get("tool_output_float_decimals", 2))
+
+    if result.kind == "table":
+        body, note = _fit_table(_compact_table(result.data), budget, decimals)
+    elif result.kind == "json":
+        body, note = _render_json(result.data, budget, decimals)
+    else:
+        body, note = _truncate_text_to_budget(_compact_text(result.data), budget)
+
+    header_lines = []
+    if result.title:
+        header_lines.append(f"# {result.title}")
+    header_lines.extend(f"# {n}" for n in result.notes)
+    if note:
+        header_lines.append(f"# NOTE: {note}")
+    header = ("\n".join(header_lines) + "\n") if header_lines else ""
+    return header + body.strip()
+
+
+def render_tool_output(method: str, raw: Any) -> str:
+    """
+    Render a vendor result for the LLM at the tool boundary.
+
+    `raw` is whatever `route_to_vendor` returned: a `ToolResult`, a legacy string/DataFrame,
+    or a list of those when several vendors contributed. Falls back to the lossless rendering
+    when compaction is disabled via `tool_output_compact` or fails for an unexpected payload.
+    """
+    config = get_config()
+    raws = raw if isinstance(raw, list) else [raw]
+    results = [normalize_result(r) for r in raws]
+    plain = "\n".join(
+        r if isinstance(r, str) else render_plain(res) for r, res in zip(raws, results)
+    )
+
+    if not config.get("tool_output_compact", True):
+        return plain
+
+    budget = max(200, _get_token_budget(method, config) // len(results))
+    try:
+        rendered = "\n\n".join(
+            render_compact(res, method, config, budget=budget) for res in results
+        )
+    except Exception as exc:
+        print(f"WARNING: compact rendering failed for {method}, using raw output: {exc}")
+        return plain
+
+    _STATS.record(method, count_tokens(plain), count_tokens(rendered))
+    return rendered
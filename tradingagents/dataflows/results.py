@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Literal
+
+ResultKind = Literal["table", "json", "text"]
+
+
+@dataclass
+class ToolResult:
+    """
+    Typed vendor output, held between the vendor layer and the `@tool` boundary.
+
+    Vendors return one of these instead of a pre-formatted string; stringification happens
+    once, in `rendering.render_tool_output`.
+
+    - `table`: `data` is a pandas DataFrame (index is preserved when rendering).
+    - `json`: `data` is a parsed JSON value (dict/list).
+    - `text`: `data` is a plain string.
+    """
+
+    kind: ResultKind
+    data: Any
+    title: str = ""
+    source: str = ""
+    notes: list[str] = field(default_factory=list)
+    as_of: str | None = None
+    cached: bool = False
+
+    def is_empty(self) -> bool:
+        if self.data is None:
+            return True
+        if self.kind == "table":
+            return bool(getattr(self.data, "empty", False))
+        if self.kind == "text":
+            return not str(self.data).strip()
+        return not self.data
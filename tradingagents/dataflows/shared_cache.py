@@ -0,0 +1,148 @@
+"""
+Date-scoped shared cache for ticker-independent data (e.g. global/macro news).
+
+Entries live in memory for the process and on disk under `data_cache_dir/shared/`, so
+every run in a process, and every process on a node sharing the cache dir, reuses one
+fetch per (method, vendor config, arguments). Concurrent identical requests are
+single-flighted: per-key thread locks within a process, plus an advisory file lock
+across processes where `fcntl` is available.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import copy
+import hashlib
+import json
+import pickle
+import threading
+from collections import OrderedDict
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable
+
+from .cache_utils import KeyedLocks, atomic_write_bytes, cache_is_fresh
+from .config import get_config
+from .results import ToolResult
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX platforms
+    fcntl = None
+
+# In-process layer, least recently used first; the disk layer keeps evicted entries.
+_MEMORY: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+_MEMORY_MAX_ITEMS = 512
+_MEMORY_LOCK = threading.Lock()
+_KEY_LOCKS = KeyedLocks()
+
+
+def _get_shared_cache_dir() -> Path:
+    config = get_config()
+    return Path(config.get("data_cache_dir", "dataflows/data_cache")) / "shared"
+
+
+def _parse_date(as_of_date: Any) -> datetime | None:
+    try:
+        return datetime.strptime(str(as_of_date), "%Y-%m-%d")
+    except ValueError:
+        return None
+
+
+def _ttl_for(as_of: datetime) -> int | None:
+    """Past dates are immutable (no expiry); today's data is refreshed after the TTL."""
+    if as_of.date() < datetime.now().date():
+        return None
+    return int(get_config().get("shared_cache_ttl_seconds", 60 * 60))
+
+
+def _remember(key: str, stored_at: float, value: Any) -> None:
+    with _MEMORY_LOCK:
+        _MEMORY[key] = (stored_at, value)
+        _MEMORY.move_to_end(key)
+        while len(_MEMORY) > _MEMORY_MAX_ITEMS:
+            _MEMORY.popitem(last=False)
+
+
+def _mark_cached(value: Any) -> Any:
+    if isinstance(value, ToolResult):
+        hit = copy.copy(value)
+        hit.cached = True
+        return hit
+    if isinstance(value, list):
+        return [_mark_cached(v) for v in value]
+    return value
+
+
+@contextlib.contextmanager
+def _file_lock(path: Path):
+    if fcntl is None:
+        yield
+        return
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "a+b") as handle:
+        fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+
+
+def cache_key(method: str, *parts: Any) -> str:
+    payload = json.dumps([method, *parts], sort_keys=True, default=str)
+    return f"{method}-{hashlib.sha256(payload.encode('utf-8')).hexdigest()[:32]}"
+
+
+def get_or_fetch(key: str, as_of_date: str, fetch: Callable[[], Any]) -> Any:
+    """
+    Return the shared value for `key`, calling `fetch()` at most once per key across
+    concurrent callers. Exceptions from `fetch` propagate and are not cached.
+
+    `as_of_date` comes from the LLM's tool call; anything but a YYYY-MM-DD date bypasses
+    the cache (it names the cache directory).
+    """
+    as_of = _parse_date(as_of_date)
+    if as_of is None:
+        return fetch()
+    ttl = _ttl_for(as_of)
+    path = _get_shared_cache_dir() / as_of.strftime("%Y-%m-%d") / f"{key}.pkl"
+
+    def _lookup() -> tuple[bool, Any]:
+        with _MEMORY_LOCK:
+            entry = _MEMORY.get(key)
+            if entry is not None:
+                _MEMORY.move_to_end(key)
+        if entry is not None and (ttl is None or datetime.now().timestamp() - entry[0] <= ttl):
+            return True, entry[1]
+        if cache_is_fresh(path, ttl):
+            try:
+                value = pickle.loads(path.read_bytes())
+            except Exception:
+                return False, None
+            _remember(key, path.stat().st_mtime, value)
+            return True, value
+        return False, None
+
+    found, value = _lookup()
+    if found:
+        return _mark_cached(value)
+
+    with _KEY_LOCKS.hold(key), _file_lock(path.with_suffix(".lock")):
+        # Another thread or process may have filled the entry while we waited.
+        found, value = _lookup()
+        if found:
+            return _mark_cached(value)
+
+        value = fetch()
+        _remember(key, datetime.now().timestamp(), value)
+        try:
+            atomic_write_bytes(path, pickle.dumps(value))
+        except Exception as exc:
+            print(f"WARNING: Failed to persist shared cache entry {key}: {exc}")
+        return value
+
+
+def clear_memory_cache() -> None:
+    """Drop in-process entries (the on-disk cache is kept)."""
+    with _MEMORY_LOCK:
+        _MEMORY.clear()
@@ -0,0 +1,77 @@
+"""
+Short-lived in-process memo of `route_to_vendor` results.
+
+Keyed by method, vendor configuration and exact arguments. It lets a prefetch (see
+`prefetch`) hand its results to the analysts' later tool calls: a call matching a finished
+fetch returns immediately, and one matching a fetch still in flight waits for it instead
+of issuing a duplicate request. It is only active with `data_prefetch`, so runs without a
+prefetch always fetch fresh data. Entries expire after `tool_result_cache_ttl_seconds`
+(0 disables the memo).
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable
+
+from .config import get_config
+from .shared_cache import _mark_cached
+
+_MAX_ITEMS = 1024
+
+_RESULTS: dict[str, tuple[float, Any]] = {}
+_IN_FLIGHT: dict[str, Future] = {}
+_LOCK = threading.Lock()
+
+
+def _ttl_seconds() -> float:
+    return float(get_config().get("tool_result_cache_ttl_seconds", 15 * 60) or 0)
+
+
+def memo_enabled() -> bool:
+    return bool(get_config().get("data_prefetch", False)) and _ttl_seconds() > 0
+
+
+def get_or_route(key: str, fetch: Callable[[], Any]) -> Any:
+    """Memoized `fetch()`; concurrent callers with the same key share one fetch."""
+    now = time.monotonic()
+    with _LOCK:
+        entry = _RESULTS.get(key)
+        if entry is not None and entry[0] > now:
+            return _mark_cached(entry[1])
+        future = _IN_FLIGHT.get(key)
+        owner = future is None
+        if owner:
+            future = Future()
+            _IN_FLIGHT[key] = future
+
+    if not owner:
+        return _mark_cached(future.result())
+
+    try:
+        value = fetch()
+    except BaseException as e:
+        with _LOCK:
+            _IN_FLIGHT.pop(key, None)
+        future.set_exception(e)
+        raise
+
+    with _LOCK:
+        _IN_FLIGHT.pop(key, None)
+        _RESULTS[key] = (time.monotonic() + _ttl_seconds(), value)
+        if len(_RESULTS) > _MAX_ITEMS:
+            # Drop expired entries first, then the oldest.
+            now = time.monotonic()
+            for stale in [k for k, (expires, _) in _RESULTS.items() if expires <= now]:
+                del _RESULTS[stale]
+            while len(_RESULTS) > _MAX_ITEMS:
+                del _RESULTS[next(iter(_RESULTS))]
+    future.set_result(value)
+    return value
+
+
+def clear_tool_results() -> None:
+    with _LOCK:
+        _RESULTS.clear()
@@ -5,8 +5,14 @@ import yfinance as yf
 import os
 import time
 import random
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+import pandas as pd
 from .stockstats_utils import StockstatsUtils
+from .cache_utils import KeyedLocks, atomic_write_text, cache_as_of, cache_is_fresh, read_frame, write_frame
+from .results import ToolResult
 
 def _is_rate_limit_error(exc: Exception) -> bool:
     message = str(exc).lower()
@@ -20,25 +26,6 @@ def _is_rate_limit_error(exc: Exception) -> bool:
     )
 
 
-def _atomic_write_text(path: Path, text: str) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    tmp_path = path.with_suffix(path.suffix + ".tmp")
-    tmp_path.write_text(text, encoding="utf-8")
-    tmp_path.replace(path)
-
-
-def _cache_is_fresh(path: Path, ttl_seconds: int | None) -> bool:
-    if not path.exists():
-        return False
-    if ttl_seconds is None:
-        return True
-    try:
-        age_seconds = time.time() - path.stat().st_mtime
-    except OSError:
-        return False
-    return age_seconds <= ttl_seconds
-
-
 def _get_yfinance_cache_dir() -> Path:
     from .config import get_config
 
@@ -68,13 +55,14 @@ def _get_yfinance_cache_ttl_seconds() -> int:
     return int(config.get("yfinance_cache_ttl_seconds", 60 * 60 * 24))
 
 
-def _yfinance_download_with_retries(**download_kwargs):
+def _yfinance_call_with_retries(fn, *args, **kwargs):
+    """Call a yfinance function, retrying rate-limit errors with exponential backoff."""
     max_attempts, backoff_base_seconds, backoff_jitter_seconds = _get_yfinance_retry_config()
 
     last_exc: Exception | None = None
     for attempt in range(1, max_attempts + 1):
         try:
-            return yf.download(**download_kwargs)
+            return fn(*args, **kwargs)
         except Exception as exc:
             last_exc = exc
             if not _is_rate_limit_error(exc) or attempt == max_attempts:
@@ -86,7 +74,11 @@ def _yfinance_download_with_retries(**download_kwargs):
             time.sleep(delay)
 
     # Defensive: should never reach here
-    raise last_exc if last_exc else RuntimeError("yfinance download failed unexpectedly")
+    raise last_exc if last_exc else RuntimeError("yfinance call failed unexpectedly")
+
+
+def _yfinance_download_with_retries(**download_kwargs):
+    return _yfinance_call_with_retries(yf.download, **download_kwargs)
 
 
 def get_YFin_data_online(
@@ -99,17 +91,21 @@ def get_YFin_data_online(
     datetime.strptime(end_date, "%Y-%m-%d")
 
     cache_dir = _get_yfinance_cache_dir() / "yfinance" / "history"
-    cache_path = cache_dir / f"{symbol.upper()}-history-{start_date}-{end_date}.csv"
+    cache_path = cache_dir / f"{symbol.upper()}-history-{start_date}-{end_date}.pkl"
+    title = f"Stock data for {symbol.upper()} from {start_date} to {end_date}"
 
     ttl_seconds = _get_yfinance_cache_ttl_seconds()
-    if _cache_is_fresh(cache_path, ttl_seconds):
-        csv_string = cache_path.read_text(encoding="utf-8")
-        non_empty_lines = [line for line in csv_string.splitlines() if line.strip()]
-        total_records = max(0, len(non_empty_lines) - 1)
-        header = f"# Stock data for {symbol.upper()} from {start_date} to {end_date}\n"
-        header += f"# Total records: {total_records} (cached)\n"
-        header += f"# Cache file: {cache_path}\n\n"
-        return header + csv_string
+    if cache_is_fresh(cache_path, ttl_seconds):
+        data = read_frame(cache_path)
+        return ToolResult(
+            kind="table",
+            data=data,
+            title=title,
+            source="yfinance",
+            notes=[f"Total records: {len(data)}"],
+            as_of=cache_as_of(cache_path),
+            cached=True,
+        )
 
     # Fetch historical data for the specified date range
     # Prefer yf.download over Ticker().history() to reduce request fan-out.
@@ -128,14 +124,19 @@ def get_YFin_data_online(
     except Exception as exc:
         # If we're rate-limited, try to fall back to whatever cache exists (even if stale).
         if _is_rate_limit_error(exc) and cache_path.exists():
-            csv_string = cache_path.read_text(encoding="utf-8")
-            non_empty_lines = [line for line in csv_string.splitlines() if line.strip()]
-            total_records = max(0, len(non_empty_lines) - 1)
-            header = f"# Stock data for {symbol.upper()} from {start_date} to {end_date}\n"
-            header += f"# Total records: {total_records} (cached)\n"
-            header += f"# NOTE: Using stale cache due to yfinance rate limit: {exc}\n"
-            header += f"# Cache file: {cache_path}\n\n"
-            return header + csv_string
+            data = read_frame(cache_path)
+            return ToolResult(
+                kind="table",
+                data=data,
+                title=title,
+                source="yfinance",
+                notes=[
+                    f"Total records: {len(data)}",
+                    f"NOTE: Using stale cache due to yfinance rate limit: {exc}",
+                ],
+                as_of=cache_as_of(cache_path),
+                cached=True,
+            )
         raise
 
     # Check if data is empty
@@ -154,16 +155,16 @@ def get_YFin_data_online(
         if col in data.columns:
             data[col] = data[col].round(2)
 
-    # Convert DataFrame to CSV string
-    csv_string = data.to_csv()
-    _atomic_write_text(cache_path, csv_string)
-
-    # Add header information
-    header = f"# Stock data for {symbol.upper()} from {start_date} to {end_date}\n"
-    header += f"# Total records: {len(data)}\n"
-    header += f"# Data retrieved on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
+    write_frame(cache_path, data)
 
-    return header + csv_string
+    return ToolResult(
+        kind="table",
+        data=data,
+        title=title,
+        source="yfinance",
+        notes=[f"Total records: {len(data)}"],
+        as_of=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+    )
 
 def get_stock_stats_indicators_window(
     symbol: Annotated[str, "ticker symbol of the company"],
@@ -172,7 +173,7 @@ def get_stock_stats_indicators_window(
         str, "The current trading date you are trading on, YYYY-mm-dd"
     ],
     look_back_days: Annotated[int, "how many days to look back"],
-) -> str:
+) -> ToolResult:
 
     best_ind_params = {
         # Moving Averages
@@ -256,65 +257,52 @@ def get_stock_stats_indicators_window(
     curr_date_dt = datetime.strptime(curr_date, "%Y-%m-%d")
     before = curr_date_dt - relativedelta(days=look_back_days)
 
+    start_str = before.strftime("%Y-%m-%d")
+
     # Optimized: Get stock data once and calculate indicators for all dates
     try:
         indicator_data = _get_stock_stats_bulk(symbol, indicator, curr_date)
-        
-        # Generate the date range we need
-        current_dt = curr_date_dt
-        date_values = []
-        
-        while current_dt >= before:
-            date_str = current_dt.strftime('%Y-%m-%d')
-            
-            # Look up the indicator value for this date
-            if date_str in indicator_data:
-                indicator_value = indicator_data[date_str]
-            else:
-                indicator_value = "N/A: Not a trading day (weekend or holiday)"
-            
-            date_values.append((date_str, indicator_value))
-            current_dt = current_dt - relativedelta(days=1)
-        
-        # Build the result string
-        ind_string = ""
-        for date_str, value in date_values:
-            ind_string += f"{date_str}: {value}\n"
-        
+        window = indicator_data[
+            (indicator_data.index >= start_str) & (indicator_data.index <= end_date)
+        ]
+        values = window.sort_index()
+
     except Exception as e:
         print(f"Error getting bulk stockstats data: {e}")
         # Fallback to original implementation if bulk method fails
-        ind_string = ""
-        curr_date_dt = datetime.strptime(curr_date, "%Y-%m-%d")
-        while curr_date_dt >= before:
-            indicator_value = get_stockstats_indicator(
-                symbol, indicator, curr_date_dt.strftime("%Y-%m-%d")
-            )
-            ind_string += f"{curr_date_dt.strftime('%Y-%m-%d')}: {indicator_value}\n"
-            curr_date_dt = curr_date_dt - relativedelta(days=1)
-
-    result_str = (
-        f"## {indicator} values from {before.strftime('%Y-%m-%d')} to {end_date}:\n\n"
-        + ind_string
-        + "\n\n"
-        + best_ind_params.get(indicator, "No description available.")
+        rows = {}
+        day_dt = before
+        while day_dt <= curr_date_dt:
+            day_str = day_dt.strftime("%Y-%m-%d")
+            indicator_value = get_stockstats_indicator(symbol, indicator, day_str)
+            if indicator_value != "" and not str(indicator_value).startswith("N/A"):
+                rows[day_str] = indicator_value
+            day_dt = day_dt + relativedelta(days=1)
+        values = pd.to_numeric(pd.Series(rows, dtype=object), errors="coerce")
+
+    # Non-trading days (weekends/holidays) are simply absent from the table.
+    table = pd.DataFrame({"Date": list(values.index), indicator: list(values.values)})
+
+    return ToolResult(
+        kind="table",
+        data=table,
+        title=f"{indicator} values from {start_str} to {end_date}",
+        source="yfinance",
+        notes=[best_ind_params.get(indicator, "No description available.")],
     )
 
-    return result_str
-
 
 def _get_stock_stats_bulk(
     symbol: Annotated[str, "ticker symbol of the company"],
     indicator: Annotated[str, "technical indicator to calculate"],
     curr_date: Annotated[str, "current date for reference"]
-) -> dict:
+) -> pd.Series:
     """
     Optimized bulk calculation of stock stats indicators.
     Fetches data once and calculates indicator for all available dates.
-    Returns dict mapping date strings to indicator values.
+    Returns a Series mapping date strings to indicator values.
     """
     from .config import get_config
-    import pandas as pd
     from stockstats import wrap
     import os
     
@@ -339,12 +327,11 @@ def _get_stock_stats_bulk(
         cache_dir.mkdir(parents=True, exist_ok=True)
 
         # Stable cache key so we don't generate a new file every day.
-        data_file = cache_dir / f"{symbol.upper()}-download-period-15y-1d-auto_adjust.csv"
+        data_file = cache_dir / f"{symbol.upper()}-download-period-15y-1d-auto_adjust.pkl"
         ttl_seconds = _get_yfinance_cache_ttl_seconds()
 
-        if _cache_is_fresh(data_file, ttl_seconds):
-            data = pd.read_csv(data_file)
-            data["Date"] = pd.to_datetime(data["Date"])
+        if cache_is_fresh(data_file, ttl_seconds):
+            data = read_frame(data_file)
         else:
             try:
                 data = _yfinance_download_with_retries(
@@ -358,12 +345,11 @@ def _get_stock_stats_bulk(
                     multi_level_index=False,
                 )
                 data = data.reset_index()
-                data.to_csv(data_file, index=False)
+                write_frame(data_file, data)
             except Exception as exc:
                 # If we're rate-limited, fall back to whatever cache exists (even if stale).
                 if _is_rate_limit_error(exc) and data_file.exists():
-                    data = pd.read_csv(data_file)
-                    data["Date"] = pd.to_datetime(data["Date"])
+                    data = read_frame(data_file)
                 else:
                     raise
         
@@ -373,19 +359,10 @@ def _get_stock_stats_bulk(
     # Calculate the indicator for all rows at once
     df[indicator]  # This triggers stockstats to calculate the indicator
     
-    # Create a dictionary mapping date strings to indicator values
-    result_dict = {}
-    for _, row in df.iterrows():
-        date_str = row["Date"]
-        indicator_value = row[indicator]
-        
-        # Handle NaN/None values
-        if pd.isna(indicator_value):
-            result_dict[date_str] = "N/A"
-        else:
-            result_dict[date_str] = str(indicator_value)
-    
-    return result_dict
+    # Series of indicator values (NaN where not yet defined) indexed by YYYY-mm-dd
+    return pd.Series(
+        df[indicator].to_numpy(), index=df["Date"].astype(str).str[:10], name=indicator
+    )
 
 
 def get_stockstats_indicator(
@@ -414,10 +391,24 @@ def get_stockstats_indicator(
     return str(indicator_value)
 
 
+def _fundamentals_result(
+    symbol: str, payload: dict, *, cached: bool = False, notes: list[str] | None = None
+) -> ToolResult:
+    return ToolResult(
+        kind="json",
+        data=payload.get("data", {}),
+        title=f"Fundamentals for {symbol}",
+        source=payload.get("source", "yfinance"),
+        notes=notes or [],
+        as_of=payload.get("retrieved_at"),
+        cached=cached,
+    )
+
+
 def get_fundamentals(
     ticker: Annotated[str, "ticker symbol of the company"],
     curr_date: Annotated[str, "current date (not used for yfinance)"] = None,
-) -> str:
+) -> ToolResult:
     """
     Retrieve company fundamentals using yfinance.
 
@@ -432,12 +423,8 @@ def get_fundamentals(
     cache_path = cache_dir / f"{symbol}-fundamentals.json"
 
     ttl_seconds = _get_yfinance_cache_ttl_seconds()
-    if _cache_is_fresh(cache_path, ttl_seconds):
-        return (
-            f"# Fundamentals for {symbol} (cached)\n"
-            f"# Cache file: {cache_path}\n\n"
-            + cache_path.read_text(encoding="utf-8")
-        )
+    if cache_is_fresh(cache_path, ttl_seconds):
+        return _fundamentals_result(symbol, json.loads(cache_path.read_text(encoding="utf-8")), cached=True)
 
     max_attempts, backoff_base_seconds, backoff_jitter_seconds = _get_yfinance_retry_config()
     last_exc: Exception | None = None
@@ -499,27 +486,23 @@ def get_fundamentals(
             }
 
             cache_dir.mkdir(parents=True, exist_ok=True)
-            _atomic_write_text(
+            atomic_write_text(
                 cache_path,
                 json.dumps(payload, ensure_ascii=False, indent=2, default=str),
             )
 
-            return (
-                f"# Fundamentals for {symbol}\n"
-                f"# Data retrieved on: {payload['retrieved_at']}\n\n"
-                + json.dumps(payload, ensure_ascii=False, indent=2, default=str)
-            )
+            return _fundamentals_result(symbol, payload)
 
         except Exception as exc:
             last_exc = exc
             if not _is_rate_limit_error(exc) or attempt == max_attempts:
                 # If we're rate-limited, try to fall back to stale cache if present.
                 if _is_rate_limit_error(exc) and cache_path.exists():
-                    return (
-                        f"# Fundamentals for {symbol} (cached)\n"
-                        f"# NOTE: Using stale cache due to rate limit error: {exc}\n"
-                        f"# Cache file: {cache_path}\n\n"
-                        + cache_path.read_text(encoding="utf-8")
+                    return _fundamentals_result(
+                        symbol,
+                        json.loads(cache_path.read_text(encoding="utf-8")),
+                        cached=True,
+                        notes=[f"NOTE: Using stale cache due to rate limit error: {exc}"],
                     )
                 raise
 
@@ -531,115 +514,208 @@ def get_fundamentals(
     raise last_exc if last_exc else RuntimeError("yfinance fundamentals failed unexpectedly")
 
 
+# Statement name -> (annual attribute, quarterly attribute) on `yf.Ticker`.
+_STATEMENT_ATTRIBUTES = {
+    "balance_sheet": ("balance_sheet", "quarterly_balance_sheet"),
+    "cashflow": ("cashflow", "quarterly_cashflow"),
+    "income_statement": ("income_stmt", "quarterly_income_stmt"),
+}
+
+# (SYMBOL, freq) -> (fetched_at, {statement: DataFrame}); shared by all runs in the process.
+# Least recently used bundles beyond the bound are dropped (the per-statement disk cache keeps them).
+_STATEMENT_BUNDLES: OrderedDict[tuple[str, str], tuple[float, dict[str, pd.DataFrame]]] = OrderedDict()
+_STATEMENT_BUNDLES_MAX_ITEMS = 64
+_STATEMENT_BUNDLES_LOCK = threading.Lock()
+_STATEMENT_BUNDLE_KEY_LOCKS = KeyedLocks()
+
+
+def _normalize_freq(freq: str | None) -> str:
+    return "quarterly" if (freq or "quarterly").lower() == "quarterly" else "annual"
+
+
+def _fetch_statement(symbol: str, statement: str, freq: str) -> pd.DataFrame:
+    """Fetch one statement with retries, backed by a per-statement disk cache."""
+    cache_path = (
+        _get_yfinance_cache_dir()
+        / "yfinance"
+        / "statements"
+        / f"{symbol}-{freq}-{statement}.pkl"
+    )
+    if cache_is_fresh(cache_path, _get_yfinance_cache_ttl_seconds()):
+        return read_frame(cache_path)
+
+    annual_attr, quarterly_attr = _STATEMENT_ATTRIBUTES[statement]
+    attr = quarterly_attr if freq == "quarterly" else annual_attr
+    try:
+        data = _yfinance_call_with_retries(lambda: getattr(yf.Ticker(symbol), attr))
+    except Exception as exc:
+        if _is_rate_limit_error(exc) and cache_path.exists():
+            print(f"WARNING: Using stale {statement} cache for {symbol} due to rate limit: {exc}")
+            return read_frame(cache_path)
+        raise
+
+    if data is None:
+        data = pd.DataFrame()
+    if not data.empty:
+        write_frame(cache_path, data)
+    return data
+
+
+def get_statement_bundle(
+    ticker: Annotated[str, "ticker symbol of the company"],
+    freq: Annotated[str, "frequency of data: 'annual' or 'quarterly'"] = "quarterly",
+) -> dict[str, pd.DataFrame]:
+    """
+    Fetch balance sheet, cash flow and income statement for a ticker in one go.
+
+    The three statements are retrieved concurrently and kept in process memory, so the
+    fundamentals analyst's follow-up calls for the other statements are served from memory.
+    """
+    symbol = ticker.upper()
+    freq = _normalize_freq(freq)
+    key = (symbol, freq)
+    ttl_seconds = _get_yfinance_cache_ttl_seconds()
+
+    # Per-key lock: concurrent callers for the same ticker wait for a single fetch.
+    with _STATEMENT_BUNDLE_KEY_LOCKS.hold(key):
+        with _STATEMENT_BUNDLES_LOCK:
+            entry = _STATEMENT_BUNDLES.get(key)
+            if entry is not None and time.time() - entry[0] > ttl_seconds:
+                del _STATEMENT_BUNDLES[key]
+                entry = None
+            if entry is not None:
+                _STATEMENT_BUNDLES.move_to_end(key)
+        if entry is not None:
+            return entry[1]
+
+        with ThreadPoolExecutor(max_workers=len(_STATEMENT_ATTRIBUTES)) as executor:
+            futures = {
+                statement: executor.submit(_fetch_statement, symbol, statement, freq)
+                for statement in _STATEMENT_ATTRIBUTES
+            }
+            bundle: dict[str, pd.DataFrame] = {}
+            errors: dict[str, Exception] = {}
+            for statement, future in futures.items():
+                try:
+                    bundle[statement] = future.result()
+                except Exception as exc:
+                    errors[statement] = exc
+
+        if errors and not bundle:
+            raise next(iter(errors.values()))
+        for statement, exc in errors.items():
+            print(f"WARNING: Failed to fetch {statement} for {symbol}: {exc}")
+
+        # Only memoize complete bundles so a failed statement is retried on the next call.
+        if not errors:
+            with _STATEMENT_BUNDLES_LOCK:
+                _STATEMENT_BUNDLES[key] = (time.time(), bundle)
+                _STATEMENT_BUNDLES.move_to_end(key)
+                while len(_STATEMENT_BUNDLES) > _STATEMENT_BUNDLES_MAX_ITEMS:
+                    _STATEMENT_BUNDLES.popitem(last=False)
+        return bundle
+
+
+def _statement_result(
+    ticker: str, statement: str, label: str, freq: str, curr_date: str | None
+) -> ToolResult | str:
+    bundle = get_statement_bundle(ticker, freq)
+    if statement not in bundle:
+        # The concurrent fetch failed for this statement only; retry it directly.
+        data = _fetch_statement(ticker.upper(), statement, _normalize_freq(freq))
+    else:
+        data = bundle[statement]
+
+    notes = []
+    if curr_date and not data.empty:
+        # As-of slicing: hide periods that end after the trading date (avoid look-ahead).
+        period_ends = pd.to_datetime(pd.Series(data.columns), errors="coerce")
+        keep = (period_ends.isna() | (period_ends <= pd.to_datetime(curr_date))).to_numpy()
+        if not keep.all():
+            notes.append(f"Periods after {curr_date} omitted")
+        data = data.loc[:, keep]
+
+    if data.empty:
+        return f"No {label.lower()} data found for symbol '{ticker}'"
+
+    return ToolResult(
+        kind="table",
+        data=data,
+        title=f"{label} data for {ticker.upper()} ({freq})",
+        source="yfinance",
+        notes=notes,
+        as_of=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+    )
+
+
 def get_balance_sheet(
     ticker: Annotated[str, "ticker symbol of the company"],
     freq: Annotated[str, "frequency of data: 'annual' or 'quarterly'"] = "quarterly",
-    curr_date: Annotated[str, "current date (not used for yfinance)"] = None
+    curr_date: Annotated[str, "current date; later periods are omitted"] = None
 ):
     """Get balance sheet data from yfinance."""
-    try:
-        ticker_obj = yf.Ticker(ticker.upper())
-        
-        if freq.lower() == "quarterly":
-            data = ticker_obj.quarterly_balance_sheet
-        else:
-            data = ticker_obj.balance_sheet
-            
-        if data.empty:
-            return f"No balance sheet data found for symbol '{ticker}'"
-            
-        # Convert to CSV string for consistency with other functions
-        csv_string = data.to_csv()
-        
-        # Add header information
-        header = f"# Balance Sheet data for {ticker.upper()} ({freq})\n"
-        header += f"# Data retrieved on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
-        
-        return header + csv_string
-        
-    except Exception as e:
-        return f"Error retrieving balance sheet for {ticker}: {str(e)}"
+    return _statement_result(ticker, "balance_sheet", "Balance Sheet", freq, curr_date)
 
 
 def get_cashflow(
     ticker: Annotated[str, "ticker symbol of the company"],
     freq: Annotated[str, "frequency of data: 'annual' or 'quarterly'"] = "quarterly",
-    curr_date: Annotated[str, "current date (not used for yfinance)"] = None
+    curr_date: Annotated[str, "current date; later periods are omitted"] = None
 ):
     """Get cash flow data from yfinance."""
-    try:
-        ticker_obj = yf.Ticker(ticker.upper())
-        
-        if freq.lower() == "quarterly":
-            data = ticker_obj.quarterly_cashflow
-        else:
-            data = ticker_obj.cashflow
-            
-        if data.empty:
-            return f"No cash flow data found for symbol '{ticker}'"
-            
-        # Convert to CSV string for consistency with other functions
-        csv_string = data.to_csv()
-        
-        # Add header information
-        header = f"# Cash Flow data for {ticker.upper()} ({freq})\n"
-        header += f"# Data retrieved on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
-        
-        return header + csv_string
-        
-    except Exception as e:
-        return f"Error retrieving cash flow for {ticker}: {str(e)}"
+    return _statement_result(ticker, "cashflow", "Cash Flow", freq, curr_date)
 
 
 def get_income_statement(
     ticker: Annotated[str, "ticker symbol of the company"],
     freq: Annotated[str, "frequency of data: 'annual' or 'quarterly'"] = "quarterly",
-    curr_date: Annotated[str, "current date (not used for yfinance)"] = None
+    curr_date: Annotated[str, "current date; later periods are omitted"] = None
 ):
     """Get income statement data from yfinance."""
-    try:
-        ticker_obj = yf.Ticker(ticker.upper())
-        
-        if freq.lower() == "quarterly":
-            data = ticker_obj.quarterly_income_stmt
-        else:
-            data = ticker_obj.income_stmt
-            
-        if data.empty:
-            return f"No income statement data found for symbol '{ticker}'"
-            
-        # Convert to CSV string for consistency with other functions
-        csv_string = data.to_csv()
-        
-        # Add header information
-        header = f"# Income Statement data for {ticker.upper()} ({freq})\n"
-        header += f"# Data retrieved on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
-        
-        return header + csv_string
-        
-    except Exception as e:
-        return f"Error retrieving income statement for {ticker}: {str(e)}"
+    return _statement_result(ticker, "income_statement", "Income Statement", freq, curr_date)
 
 
 def get_insider_transactions(
     ticker: Annotated[str, "ticker symbol of the company"]
 ):
     """Get insider transactions data from yfinance."""
+    symbol = ticker.upper()
+    cache_path = _get_yfinance_cache_dir() / "yfinance" / "insider" / f"{symbol}-insider.pkl"
+    title = f"Insider Transactions data for {symbol}"
+
+    if cache_is_fresh(cache_path, _get_yfinance_cache_ttl_seconds()):
+        return ToolResult(
+            kind="table",
+            data=read_frame(cache_path),
+            title=title,
+            source="yfinance",
+            as_of=cache_as_of(cache_path),
+            cached=True,
+        )
+
     try:
-        ticker_obj = yf.Ticker(ticker.upper())
-        data = ticker_obj.insider_transactions
-        
-        if data is None or data.empty:
-            return f"No insider transactions data found for symbol '{ticker}'"
-            
-        # Convert to CSV string for consistency with other functions
-        csv_string = data.to_csv()
-        
-        # Add header information
-        header = f"# Insider Transactions data for {ticker.upper()}\n"
-        header += f"# Data retrieved on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
-        
-        return header + csv_string
-        
-    except Exception as e:
-        return f"Error retrieving insider transactions for {ticker}: {str(e)}"
+        data = _yfinance_call_with_retries(lambda: yf.Ticker(symbol).insider_transactions)
+    except Exception as exc:
+        if _is_rate_limit_error(exc) and cache_path.exists():
+            return ToolResult(
+                kind="table",
+                data=read_frame(cache_path),
+                title=title,
+                source="yfinance",
+                notes=[f"NOTE: Using stale cache due to yfinance rate limit: {exc}"],
+                as_of=cache_as_of(cache_path),
+                cached=True,
+            )
+        raise
+
+    if data is None or data.empty:
+        return f"No insider transactions data found for symbol '{ticker}'"
+
+    write_frame(cache_path, data)
+    return ToolResult(
+        kind="table",
+        data=data,
+        title=title,
+        source="yfinance",
+        as_of=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+    )
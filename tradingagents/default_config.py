@@ -17,6 +17,25 @@ DEFAULT_CONFIG = {
     "yfinance_retry_max_attempts": int(os.getenv("TRADINGAGENTS_YFINANCE_RETRY_MAX_ATTEMPTS", "5")),
     "yfinance_retry_backoff_base_seconds": float(os.getenv("TRADINGAGENTS_YFINANCE_RETRY_BACKOFF_BASE_SECONDS", "1.0")),
     "yfinance_retry_backoff_jitter_seconds": float(os.getenv("TRADINGAGENTS_YFINANCE_RETRY_BACKOFF_JITTER_SECONDS", "0.25")),
+    # akshare (East Money) caching + request pacing; statements are cached as full report history per symbol.
+    "akshare_cache_ttl_seconds": int(os.getenv("TRADINGAGENTS_AKSHARE_CACHE_TTL_SECONDS", str(60 * 60 * 24))),
+    "akshare_min_interval_seconds": float(os.getenv("TRADINGAGENTS_AKSHARE_MIN_INTERVAL_SECONDS", "0.5")),
+    "akshare_batch_max_workers": int(os.getenv("TRADINGAGENTS_AKSHARE_BATCH_MAX_WORKERS", "8")),
+    "akshare_statement_max_periods": int(os.getenv("TRADINGAGENTS_AKSHARE_STATEMENT_MAX_PERIODS", "8")),
+    # OpenAI web-search vendor cache. Searches whose date window ended before today never expire;
+    # windows that include today are re-searched after the TTL.
+    "openai_cache_enabled": os.getenv("TRADINGAGENTS_OPENAI_CACHE_ENABLED", "1") == "1",
+    "openai_cache_ttl_seconds": int(os.getenv("TRADINGAGENTS_OPENAI_CACHE_TTL_SECONDS", str(60 * 60 * 6))),
+    # Date-scoped shared cache for ticker-independent tools (global news). Shared by all runs
+    # using the same data_cache_dir; past dates never expire, today's entries refresh after the TTL.
+    "shared_cache_enabled": os.getenv("TRADINGAGENTS_SHARED_CACHE_ENABLED", "1") == "1",
+    "shared_cache_ttl_seconds": int(os.getenv("TRADINGAGENTS_SHARED_CACHE_TTL_SECONDS", str(60 * 60))),
+    # Tool output rendering (compact, token-budgeted vendor results sent to the LLM)
+    "tool_output_compact": os.getenv("TRADINGAGENTS_TOOL_OUTPUT_COMPACT", "1") == "1",
+    "tool_output_float_decimals": int(os.getenv("TRADINGAGENTS_TOOL_OUTPUT_FLOAT_DECIMALS", "2")),
+    "tool_output_default_token_budget": int(os.getenv("TRADINGAGENTS_TOOL_OUTPUT_DEFAULT_TOKEN_BUDGET", "2000")),
+    # Per-tool overrides, e.g. {"get_stock_data": 4000}. Unlisted tools use built-in budgets.
+    "tool_output_token_budgets": {},
     # Language settings
     "language": "zh",  # Options: "en", "zh"
     # LLM settings
@@ -27,18 +46,114 @@ DEFAULT_CONFIG = {
     # Embedding + memory (Chroma) settings
     # When using local embedding models (e.g. Ollama `nomic-embed-text`), long situation strings can exceed
     # the embedding model input limit. Enable summarization-before-embedding to keep retrieval working.
+    # embedding_provider: "openai" (any OpenAI-compatible endpoint, incl. Ollama), or in-process
+    # "hashing" (deterministic, no model) / "onnx" (CPU sentence model in local_embedding_model_path,
+    # needs the onnx extra: onnxruntime + tokenizers). Local providers need no network and skip summarization.
+    "embedding_provider": os.getenv("TRADINGAGENTS_EMBEDDING_PROVIDER", "openai"),
+    "local_embedding_dimensions": int(os.getenv("TRADINGAGENTS_LOCAL_EMBEDDING_DIMENSIONS", "1024")),
+    "local_embedding_model_path": os.getenv("TRADINGAGENTS_LOCAL_EMBEDDING_MODEL_PATH", ""),
+    "local_embedding_max_length": 256,
     "embedding_model": os.getenv("TRADINGAGENTS_EMBEDDING_MODEL", "text-embedding-3-large"),
     "embedding_summarize_enabled": os.getenv("TRADINGAGENTS_EMBEDDING_SUMMARIZE_ENABLED", "1") == "1",
     "embedding_context_length_tokens": int(os.getenv("TRADINGAGENTS_EMBEDDING_CONTEXT_LENGTH_TOKENS", "8000")),
     "embedding_summarize_margin_tokens": int(os.getenv("TRADINGAGENTS_EMBEDDING_SUMMARIZE_MARGIN_TOKENS", "256")),
     "embedding_summary_max_tokens": int(os.getenv("TRADINGAGENTS_EMBEDDING_SUMMARY_MAX_TOKENS", "1024")),
     "embedding_summarize_input_max_tokens": int(os.getenv("TRADINGAGENTS_EMBEDDING_SUMMARIZE_INPUT_MAX_TOKENS", "32000")),
+    # Summaries are kept in one LRU shared by all memories (0 disables it) and persisted under
+    # data_cache_dir/embedding_summaries/ so long situations are summarized once across runs.
     "embedding_summary_cache_max_items": int(os.getenv("TRADINGAGENTS_EMBEDDING_SUMMARY_CACHE_MAX_ITEMS", "256")),
+    "embedding_summary_cache_persist": os.getenv("TRADINGAGENTS_EMBEDDING_SUMMARY_CACHE_PERSIST", "1") == "1",
+    # Process-wide embedding cache shared by all memories, keyed by (model, sha256(prepared text)).
+    # When persisted, vectors are stored under data_cache_dir/embeddings/ and reused across runs.
+    "embedding_cache_enabled": os.getenv("TRADINGAGENTS_EMBEDDING_CACHE_ENABLED", "1") == "1",
+    "embedding_cache_max_items": int(os.getenv("TRADINGAGENTS_EMBEDDING_CACHE_MAX_ITEMS", "4096")),
+    "embedding_cache_persist": os.getenv("TRADINGAGENTS_EMBEDDING_CACHE_PERSIST", "1") == "1",
+    # Embedding requests send arrays of inputs; batches are capped by item count and total tokens.
+    "embedding_batch_size": int(os.getenv("TRADINGAGENTS_EMBEDDING_BATCH_SIZE", "64")),
+    "embedding_batch_max_tokens": int(os.getenv("TRADINGAGENTS_EMBEDDING_BATCH_MAX_TOKENS", "100000")),
     "embedding_log_summarization": os.getenv("TRADINGAGENTS_EMBEDDING_LOG_SUMMARIZATION", "0") == "1",
+    # Memory banks, shared by every graph in the process. "ephemeral" keeps them in memory only;
+    # "persistent" stores each role's bank under memory_dir/memory_bank/ and reopens it on start
+    # without re-embedding.
+    "memory_backend": os.getenv("TRADINGAGENTS_MEMORY_BACKEND", "ephemeral"),  # Options: ephemeral, persistent
+    "memory_dir": os.getenv("TRADINGAGENTS_MEMORY_DIR", "./memory"),
+    # Vector index behind each bank. "numpy" is an exact in-process index (fast start, no Chroma);
+    # with memory_numpy_mmap, persisted vectors are memory-mapped instead of read on open.
+    "memory_vector_backend": os.getenv("TRADINGAGENTS_MEMORY_VECTOR_BACKEND", "chroma"),  # Options: chroma, numpy
+    "memory_numpy_mmap": os.getenv("TRADINGAGENTS_MEMORY_NUMPY_MMAP", "0") == "1",
+    # Compression. memory_embedding_dimensions truncates vectors to their leading dims (0 = full width,
+    # for Matryoshka models such as text-embedding-3-*). memory_quantization ("none", "float16", "int8";
+    # numpy backend only) shrinks the searched matrix; the best rescore_factor x k candidates are
+    # re-ranked with full-precision rows memory-mapped from disk (0 or 1 = no re-ranking). Run `python -m tradingagents.agents.utils.memory_benchmark`
+    # to see recall@k for each setting.
+    "memory_embedding_dimensions": int(os.getenv("TRADINGAGENTS_MEMORY_EMBEDDING_DIMENSIONS", "0")),
+    "memory_quantization": os.getenv("TRADINGAGENTS_MEMORY_QUANTIZATION", "none"),
+    "memory_rescore_factor": int(os.getenv("TRADINGAGENTS_MEMORY_RESCORE_FACTOR", "4")),
+    # Per-bank overrides of any memory/embedding setting, keyed by bank name, e.g.
+    # {"trader_memory": {"memory_embedding_dimensions": 512, "memory_quantization": "int8"}}.
+    "memory_bank_settings": {},
+    # Retention. Rows with cosine similarity >= memory_dedupe_threshold are merged (0 = off); banks
+    # above memory_max_items (0 = unbounded) are compacted once they overflow by memory_compaction_slack.
+    # memory_eviction: "weighted" keeps recent and high-|returns_losses| lessons, "oldest" drops by age.
+    "memory_max_items": int(os.getenv("TRADINGAGENTS_MEMORY_MAX_ITEMS", "0")),
+    "memory_dedupe_threshold": float(os.getenv("TRADINGAGENTS_MEMORY_DEDUPE_THRESHOLD", "0")),
+    "memory_eviction": os.getenv("TRADINGAGENTS_MEMORY_EVICTION", "weighted"),  # Options: weighted, oldest
+    "memory_eviction_half_life_days": 180,
+    "memory_compaction_slack": 0.1,
+    # Partitioning. Situations are tagged with ticker, date, market and sector; a query for a ticker is
+    # pre-filtered to its partition and widened through memory_partition_scopes until it has n_matches.
+    # Rows stored without a ticker (including banks written before partitioning) are searched after the
+    # partitions; memory_partition_fallback_global lets it fall back to the whole bank (other names) last.
+    "memory_partition_scopes": ["ticker", "sector", "market"],
+    "memory_partition_fallback_global": os.getenv("TRADINGAGENTS_MEMORY_PARTITION_FALLBACK_GLOBAL", "0") == "1",
+    # Sector tags come from memory_sector_map ({"NVDA": "Technology"}). memory_sector_lookup also looks
+    # unmapped tickers up on yfinance (a network call, once per run before the graph starts).
+    "memory_sector_map": {},
+    "memory_sector_lookup": os.getenv("TRADINGAGENTS_MEMORY_SECTOR_LOOKUP", "0") == "1",
+    "memory_bank": os.getenv("TRADINGAGENTS_MEMORY_BANK", "default"),
+    # Optional directory of `<role>_memory.npz` snapshots (see TradingAgentsGraph.export_memories)
+    # imported into empty banks when a graph is created.
+    "memory_snapshot_dir": os.getenv("TRADINGAGENTS_MEMORY_SNAPSHOT_DIR", ""),
     # Debate and discussion settings
     "max_debate_rounds": 1,
     "max_risk_discuss_rounds": 1,
     "max_recur_limit": 100,
+    # Run the selected analysts concurrently (each with its own tool loop and message channel)
+    # instead of one after another; their reports are joined before the research debate.
+    "parallel_analysts": os.getenv("TRADINGAGENTS_PARALLEL_ANALYSTS", "0") == "1",
+    # Reflection (reflect_and_remember): the five role reflections run on a bounded thread pool;
+    # reflection_single_call asks for all five in one structured LLM call instead.
+    "reflection_max_workers": 5,
+    "reflection_single_call": os.getenv("TRADINGAGENTS_REFLECTION_SINGLE_CALL", "0") == "1",
+    # Resumable runs: SQLite file for LangGraph checkpoints ("" = off; needs the optional
+    # langgraph-checkpoint-sqlite package). propagate(..., resume=False) starts a run over;
+    # replay_from="risk" (or "research", "trader", a node name) re-runs from that stage.
+    "checkpoint_db_path": os.getenv("TRADINGAGENTS_CHECKPOINT_DB_PATH", ""),
+    # Batch runs (propagate_many / apropagate_many): items analysed at once on one shared graph.
+    "batch_max_concurrency": int(os.getenv("TRADINGAGENTS_BATCH_MAX_CONCURRENCY", "4")),
+    # Tool execution: same-turn tool calls of an analyst run concurrently on the graph's pool of
+    # tool_max_workers threads per run in flight. A call running longer than its timeout
+    # (tool_timeouts[name], else tool_timeout_seconds; 0 = none) is abandoned to a thread of its
+    # own and reported to the LLM as unavailable.
+    "tool_max_workers": int(os.getenv("TRADINGAGENTS_TOOL_MAX_WORKERS", "8")),
+    "tool_timeout_seconds": float(os.getenv("TRADINGAGENTS_TOOL_TIMEOUT_SECONDS", "120")),
+    "tool_timeouts": {},
+    # Tool-result memo, only active with data_prefetch (which depends on it): identical
+    # route_to_vendor calls within this many seconds share one fetch (0 = off). It is how
+    # prefetched data reaches the analysts' tool calls.
+    "tool_result_cache_ttl_seconds": int(os.getenv("TRADINGAGENTS_TOOL_RESULT_CACHE_TTL_SECONDS", "900")),
+    # Data prefetch: a first graph node issues the selected analysts' predictable data calls
+    # (price window, common indicators, statements, past week of news) concurrently.
+    # prefetch_wait blocks the analysts until it finishes (up to prefetch_timeout_seconds).
+    # Results reach the analysts through the tool-result memo, so it also needs
+    # tool_result_cache_ttl_seconds > 0.
+    "data_prefetch": os.getenv("TRADINGAGENTS_DATA_PREFETCH", "0") == "1",
+    "prefetch_wait": False,
+    "prefetch_timeout_seconds": 120,
+    "prefetch_max_workers": 8,
+    "prefetch_price_lookback_days": 90,
+    "prefetch_news_lookback_days": 7,
+    "prefetch_indicators": ["close_50_sma", "close_200_sma", "close_10_ema", "macd", "rsi", "boll", "atr"],
     # Data vendor configuration
     # If true, do not attempt fallback vendors when a primary vendor fails.
     # This makes runs "fail-fast" on the configured vendor(s) for each tool/category.
@@ -1,17 +1,22 @@
 # TradingAgents/graph/__init__.py
 
 from .trading_graph import TradingAgentsGraph
+from .batch import PropagationResult, summarize
 from .conditional_logic import ConditionalLogic
 from .setup import GraphSetup
 from .propagation import Propagator
 from .reflection import Reflector
 from .signal_processing import SignalProcessor
+from .tool_execution import ConcurrentToolNode
 
 __all__ = [
     "TradingAgentsGraph",
+    "PropagationResult",
+    "summarize",
     "ConditionalLogic",
     "GraphSetup",
     "Propagator",
     "Reflector",
     "SignalProcessor",
+    "ConcurrentToolNode",
 ]
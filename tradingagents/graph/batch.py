@@ -0,0 +1,54 @@
+# TradingAgents/graph/batch.py
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+BatchItem = Tuple[str, str]
+
+
+@dataclass
+class PropagationResult:
+    """Outcome of one (ticker, trade date) of `propagate_many`; `error` is set instead of raising."""
+
+    index: int
+    ticker: str
+    trade_date: str
+    decision: Optional[str] = None
+    final_state: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    latency_seconds: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def normalize_items(items: Iterable[BatchItem]) -> list[BatchItem]:
+    """`(ticker, trade_date)` pairs with the date as a string, in submission order."""
+    normalized = []
+    for item in items:
+        ticker, trade_date = item
+        normalized.append((str(ticker), str(trade_date)))
+    return normalized
+
+
+def summarize(results: Iterable[PropagationResult]) -> Dict[str, Any]:
+    """Counts and latency percentiles of a finished batch."""
+    results = list(results)
+    latencies = sorted(result.latency_seconds for result in results)
+
+    def percentile(q: float) -> float:
+        if not latencies:
+            return 0.0
+        return latencies[min(len(latencies) - 1, int(q * len(latencies)))]
+
+    return {
+        "total": len(results),
+        "succeeded": sum(result.ok for result in results),
+        "failed": [(result.ticker, result.trade_date, result.error) for result in results if not result.ok],
+        "latency_p50_seconds": percentile(0.5),
+        "latency_p95_seconds": percentile(0.95),
+        "latency_max_seconds": latencies[-1] if latencies else 0.0,
+    }
@@ -0,0 +1,101 @@
+# TradingAgents/graph/checkpointing.py
+
+import asyncio
+import hashlib
+import json
+import sqlite3
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional
+
+# Config keys that change what a run computes; a different value starts a different checkpoint thread.
+FINGERPRINT_KEYS = (
+    "llm_provider",
+    "deep_think_llm",
+    "quick_think_llm",
+    "backend_url",
+    "language",
+    "max_debate_rounds",
+    "max_risk_discuss_rounds",
+    "data_vendors",
+    "tool_vendors",
+    "parallel_analysts",
+    "data_prefetch",
+)
+
+# Stage names accepted by `replay_from`, mapped to the node that starts the stage.
+REPLAY_STAGES = {
+    "research": "Bull Researcher",
+    "trader": "Trader",
+    "risk": "Risky Analyst",
+}
+
+
+def config_fingerprint(config: Dict[str, Any], selected_analysts: Iterable[str]) -> str:
+    """Short stable hash of the settings (and graph topology) a checkpoint is only valid for."""
+    relevant = {key: config.get(key) for key in FINGERPRINT_KEYS}
+    relevant["selected_analysts"] = list(selected_analysts)
+    payload = json.dumps(relevant, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:12]
+
+
+def run_thread_id(ticker: str, trade_date: str, fingerprint: str) -> str:
+    """Checkpoint thread of a (ticker, trade date, config) run."""
+    return f"{ticker}:{trade_date}:{fingerprint}"
+
+
+@lru_cache(maxsize=1)
+def _saver_class():
+    try:
+        from langgraph.checkpoint.sqlite import SqliteSaver
+    except ImportError as e:
+        raise ImportError(
+            "checkpoint_db_path requires the optional package langgraph-checkpoint-sqlite; "
+            "install the checkpoint extra with `pip install -e \".[checkpoint]\"`"
+        ) from e
+
+    class ThreadedSqliteSaver(SqliteSaver):
+        """SqliteSaver whose async methods run the (locked) sync ones off the event loop,
+        so `propagate` and `apropagate` share one checkpointer."""
+
+        async def aget_tuple(self, config):
+            return await asyncio.to_thread(self.get_tuple, config)
+
+        async def alist(self, config, *, filter=None, before=None, limit=None):
+            checkpoints = await asyncio.to_thread(
+                lambda: list(self.list(config, filter=filter, before=before, limit=limit))
+            )
+            for checkpoint in checkpoints:
+                yield checkpoint
+
+        async def aput(self, config, checkpoint, metadata, new_versions):
+            return await asyncio.to_thread(self.put, config, checkpoint, metadata, new_versions)
+
+        async def aput_writes(self, config, writes, task_id, task_path=""):
+            return await asyncio.to_thread(self.put_writes, config, writes, task_id, task_path)
+
+        async def adelete_thread(self, thread_id):
+            return await asyncio.to_thread(self.delete_thread, thread_id)
+
+    return ThreadedSqliteSaver
+
+
+def open_checkpointer(path: str):
+    """SQLite checkpointer at `path`, usable from threads and from the event loop."""
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    connection = sqlite3.connect(path, check_same_thread=False)
+    return _saver_class()(connection)
+
+
+def replay_node(replay_from: str) -> str:
+    """Graph node a replay starts at; `replay_from` is a node name or a `REPLAY_STAGES` key."""
+    return REPLAY_STAGES.get(replay_from, replay_from)
+
+
+def find_replay_checkpoint(history: Iterable[Any], node: str) -> Optional[Any]:
+    """The snapshot taken just before `node` first ran, from a newest-first state history."""
+    found = None
+    for snapshot in history:
+        if node in (snapshot.next or ()):
+            found = snapshot
+    return found
@@ -1,8 +1,20 @@
 # TradingAgents/graph/reflection.py
 
+import json
+import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any
 from langchain_openai import ChatOpenAI
 
+# (memory role, label in prompts, report the role produced)
+REFLECTION_COMPONENTS = (
+    ("bull", "BULL", lambda state: state["investment_debate_state"]["bull_history"]),
+    ("bear", "BEAR", lambda state: state["investment_debate_state"]["bear_history"]),
+    ("trader", "TRADER", lambda state: state["trader_investment_plan"]),
+    ("invest_judge", "INVEST JUDGE", lambda state: state["investment_debate_state"]["judge_decision"]),
+    ("risk_manager", "RISK JUDGE", lambda state: state["risk_debate_state"]["judge_decision"]),
+)
+
 
 class Reflector:
     """Handles reflection on decisions and updating memory."""
@@ -46,6 +58,22 @@ Your goal is to deliver detailed insights into investment decisions and highligh
 Adhere strictly to these instructions, and ensure your output is detailed, accurate, and actionable. You will also be given objective descriptions of the market from a price movements, technical indicator, news, and sentiment perspective to provide more context for your analysis.
 """
 
+    def _outcome_metadata(self, current_state, returns_losses) -> Dict[str, Any]:
+        """
+        Ticker and trade date partition the lesson; numeric outcomes let retention favour
+        large wins/losses.
+        """
+        metadata: Dict[str, Any] = {}
+        if current_state.get("company_of_interest"):
+            metadata["ticker"] = str(current_state["company_of_interest"])
+        if current_state.get("trade_date"):
+            metadata["date"] = str(current_state["trade_date"])
+        try:
+            metadata["returns_losses"] = float(returns_losses)
+        except (TypeError, ValueError):
+            pass
+        return metadata
+
     def _extract_current_situation(self, current_state: Dict[str, Any]) -> str:
         """Extract the current market situation from the state."""
         curr_market_report = current_state["market_report"]
@@ -70,6 +98,90 @@ Adhere strictly to these instructions, and ensure your output is detailed, accur
         result = self.quick_thinking_llm.invoke(messages).content
         return result
 
+    def _reflect_combined(
+        self, reports: Dict[str, str], labels: Dict[str, str], situation: str, returns_losses
+    ) -> Dict[str, str]:
+        """One LLM call reflecting on every component; returns the reflections it could parse."""
+        sections = "\n\n".join(
+            f"### {role}: {labels[role]} Analysis/Decision\n{report}" for role, report in reports.items()
+        )
+        messages = [
+            ("system", self.reflection_system_prompt),
+            (
+                "human",
+                f"Returns: {returns_losses}\n\nObjective Market Reports for Reference: {situation}\n\n"
+                f"{sections}\n\n"
+                "Write a separate reflection for each section above, following the guidelines for each. "
+                f"Respond with only a JSON object whose keys are {list(reports)} and whose values are "
+                "the reflection texts.",
+            ),
+        ]
+        content = self.quick_thinking_llm.invoke(messages).content
+        try:
+            parsed = json.loads(content[content.index("{") : content.rindex("}") + 1])
+        except ValueError as e:
+            logging.getLogger(__name__).warning(
+                "Could not parse combined reflection, reflecting per component: %s", e
+            )
+            return {}
+        return {
+            role: value
+            for role, value in parsed.items()
+            if role in reports and isinstance(value, str) and value.strip()
+        }
+
+    def reflect_all(
+        self,
+        current_state,
+        returns_losses,
+        memories: Dict[str, Any],
+        max_workers: int = 5,
+        single_call: bool = False,
+    ) -> Dict[str, str]:
+        """
+        Reflect for every role in `memories` ("bull", "bear", "trader", "invest_judge",
+        "risk_manager") concurrently and store the lessons. The situation is embedded once
+        per distinct embedding setup and the bank inserts run in parallel. With
+        `single_call`, one LLM call produces all reflections (components it misses are
+        reflected individually). Returns the reflection per role.
+        """
+        situation = self._extract_current_situation(current_state)
+        components = [c for c in REFLECTION_COMPONENTS if c[0] in memories]
+        reports = {role: report(current_state) for role, _, report in components}
+        labels = {role: label for role, label, _ in components}
+        workers = max(1, min(int(max_workers), len(components)))
+
+        results = self._reflect_combined(reports, labels, situation, returns_losses) if single_call else {}
+        missing = [role for role in reports if role not in results]
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = {
+                role: pool.submit(
+                    self._reflect_on_component, labels[role], reports[role], situation, returns_losses
+                )
+                for role in missing
+            }
+            results.update({role: future.result() for role, future in futures.items()})
+
+        embeddings: Dict[tuple, Any] = {}
+        for role in reports:
+            key = memories[role].embedding_key()
+            if key not in embeddings:
+                embeddings[key] = memories[role].embed_queries([situation])
+
+        metadata = self._outcome_metadata(current_state, returns_losses)
+
+        def _remember(role: str) -> None:
+            memory = memories[role]
+            memory.add_situations(
+                [(situation, results[role])],
+                metadata=metadata,
+                embeddings=embeddings[memory.embedding_key()],
+            )
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            list(pool.map(_remember, reports))
+        return results
+
     def reflect_bull_researcher(self, current_state, returns_losses, bull_memory):
         """Reflect on bull researcher's analysis and update memory."""
         situation = self._extract_current_situation(current_state)
@@ -78,7 +190,7 @@ Adhere strictly to these instructions, and ensure your output is detailed, accur
         result = self._reflect_on_component(
             "BULL", bull_debate_history, situation, returns_losses
         )
-        bull_memory.add_situations([(situation, result)])
+        bull_memory.add_situations([(situation, result)], metadata=self._outcome_metadata(current_state, returns_losses))
 
     def reflect_bear_researcher(self, current_state, returns_losses, bear_memory):
         """Reflect on bear researcher's analysis and update memory."""
@@ -88,7 +200,7 @@ Adhere strictly to these instructions, and ensure your output is detailed, accur
         result = self._reflect_on_component(
             "BEAR", bear_debate_history, situation, returns_losses
         )
-        bear_memory.add_situations([(situation, result)])
+        bear_memory.add_situations([(situation, result)], metadata=self._outcome_metadata(current_state, returns_losses))
 
     def reflect_trader(self, current_state, returns_losses, trader_memory):
         """Reflect on trader's decision and update memory."""
@@ -98,7 +210,7 @@ Adhere strictly to these instructions, and ensure your output is detailed, accur
         result = self._reflect_on_component(
             "TRADER", trader_decision, situation, returns_losses
         )
-        trader_memory.add_situations([(situation, result)])
+        trader_memory.add_situations([(situation, result)], metadata=self._outcome_metadata(current_state, returns_losses))
 
     def reflect_invest_judge(self, current_state, returns_losses, invest_judge_memory):
         """Reflect on investment judge's decision and update memory."""
@@ -108,7 +220,7 @@ Adhere strictly to these instructions, and ensure your output is detailed, accur
         result = self._reflect_on_component(
             "INVEST JUDGE", judge_decision, situation, returns_losses
         )
-        invest_judge_memory.add_situations([(situation, result)])
+        invest_judge_memory.add_situations([(situation, result)], metadata=self._outcome_metadata(current_state, returns_losses))
 
     def reflect_risk_manager(self, current_state, returns_losses, risk_manager_memory):
         """Reflect on risk manager's decision and update memory."""
@@ -118,4 +230,4 @@ Adhere strictly to these instructions, and ensure your output is detailed, accur
         result = self._reflect_on_component(
             "RISK JUDGE", judge_decision, situation, returns_losses
         )
-        risk_manager_memory.add_situations([(situation, result)])
+        risk_manager_memory.add_situations([(situation, result)], metadata=self._outcome_metadata(current_state, returns_losses))
@@ -1,9 +1,10 @@
 # TradingAgents/graph/setup.py
 
 from typing import Dict, Any
+from langchain_core.messages import HumanMessage
+from langchain_core.runnables import RunnableLambda
 from langchain_openai import ChatOpenAI
 from langgraph.graph import END, StateGraph, START
-from langgraph.prebuilt import ToolNode
 
 from tradingagents.agents import *
 from tradingagents.agents.utils.agent_states import AgentState
@@ -11,6 +12,46 @@ from tradingagents.agents.utils.agent_states import AgentState
 from .conditional_logic import ConditionalLogic
 
 
+def message_channel(analyst_type: str) -> str:
+    """State key holding an analyst's own conversation when analysts run in parallel."""
+    return f"{analyst_type}_messages"
+
+
+def _on_message_channel(node, channel: str):
+    """
+    Run `node` (analyst, tool node or message clearer) against `channel` instead of the
+    shared `messages` list, so parallel analysts keep separate tool loops.
+    """
+
+    def view_of(state):
+        messages = state.get(channel) or []
+        # The first call seeds the channel the way the initial state seeds `messages`.
+        seed = [] if messages else [HumanMessage(content=state["company_of_interest"])]
+        return seed, {**state, "messages": messages + seed}
+
+    def on_channel(seed, update):
+        update = dict(update)
+        update[channel] = seed + list(update.pop("messages", []))
+        return update
+
+    def run(state, config):
+        seed, view = view_of(state)
+        return on_channel(seed, node.invoke(view, config) if hasattr(node, "invoke") else node(view))
+
+    async def arun(state, config):
+        seed, view = view_of(state)
+        return on_channel(seed, await node.ainvoke(view, config) if hasattr(node, "ainvoke") else node(view))
+
+    return RunnableLambda(run, afunc=arun)
+
+
+def _route_on_message_channel(condition, channel: str):
+    def route(state):
+        return condition({**state, "messages": state.get(channel) or []})
+
+    return route
+
+
 class GraphSetup:
     """Handles the setup and configuration of the agent graph."""
 
@@ -18,7 +59,7 @@ class GraphSetup:
         self,
         quick_thinking_llm: ChatOpenAI,
         deep_thinking_llm: ChatOpenAI,
-        tool_nodes: Dict[str, ToolNode],
+        tool_nodes: Dict[str, Any],
         bull_memory,
         bear_memory,
         trader_memory,
@@ -26,6 +67,8 @@ class GraphSetup:
         risk_manager_memory,
         conditional_logic: ConditionalLogic,
         lang: str = "en",
+        parallel_analysts: bool = False,
+        data_prefetch: bool = False,
     ):
         """Initialize with required components."""
         self.quick_thinking_llm = quick_thinking_llm
@@ -38,9 +81,38 @@ class GraphSetup:
         self.risk_manager_memory = risk_manager_memory
         self.conditional_logic = conditional_logic
         self.lang = lang
+        self.parallel_analysts = parallel_analysts
+        self.data_prefetch = data_prefetch
+
+    def _chain_analysts(self, workflow: StateGraph, selected_analysts, entry=START):
+        """Connect the analysts in sequence, sharing the `messages` channel."""
+        # Start with the first analyst
+        first_analyst = selected_analysts[0]
+        workflow.add_edge(entry, f"{first_analyst.capitalize()} Analyst")
+
+        # Connect analysts in sequence
+        for i, analyst_type in enumerate(selected_analysts):
+            current_analyst = f"{analyst_type.capitalize()} Analyst"
+            current_tools = f"tools_{analyst_type}"
+            current_clear = f"Msg Clear {analyst_type.capitalize()}"
+
+            # Add conditional edges for current analyst
+            workflow.add_conditional_edges(
+                current_analyst,
+                getattr(self.conditional_logic, f"should_continue_{analyst_type}"),
+                [current_tools, current_clear],
+            )
+            workflow.add_edge(current_tools, current_analyst)
+
+            # Connect to next analyst or to Memory Recall if this is the last analyst
+            if i < len(selected_analysts) - 1:
+                next_analyst = f"{selected_analysts[i+1].capitalize()} Analyst"
+                workflow.add_edge(current_clear, next_analyst)
+            else:
+                workflow.add_edge(current_clear, "Memory Recall")
 
     def setup_graph(
-        self, selected_analysts=["market", "social", "news", "fundamentals"]
+        self, selected_analysts=["market", "social", "news", "fundamentals"], checkpointer=None
     ):
         """Set up and compile the agent workflow graph.
 
@@ -50,6 +122,8 @@ class GraphSetup:
                 - "social": Social media analyst
                 - "news": News analyst
                 - "fundamentals": Fundamentals analyst
+            checkpointer: Optional LangGraph checkpointer persisting the state after every step,
+                which lets an interrupted run resume and a finished one be replayed from a node.
         """
         if len(selected_analysts) == 0:
             raise ValueError("Trading Agents Graph Setup Error: no analysts selected!")
@@ -107,18 +181,35 @@ class GraphSetup:
             self.deep_thinking_llm, self.risk_manager_memory, self.lang
         )
 
+        # Recall past lessons for every role bank once, before the debates start
+        memory_recall_node = create_memory_recall(
+            [
+                self.bull_memory,
+                self.bear_memory,
+                self.invest_judge_memory,
+                self.trader_memory,
+                self.risk_manager_memory,
+            ]
+        )
+
         # Create workflow
         workflow = StateGraph(AgentState)
 
         # Add analyst nodes to the graph
         for analyst_type, node in analyst_nodes.items():
+            clear_node = delete_nodes[analyst_type]
+            tool_node = tool_nodes[analyst_type]
+            if self.parallel_analysts:
+                channel = message_channel(analyst_type)
+                node = _on_message_channel(node, channel)
+                clear_node = _on_message_channel(clear_node, channel)
+                tool_node = _on_message_channel(tool_node, channel)
             workflow.add_node(f"{analyst_type.capitalize()} Analyst", node)
-            workflow.add_node(
-                f"Msg Clear {analyst_type.capitalize()}", delete_nodes[analyst_type]
-            )
-            workflow.add_node(f"tools_{analyst_type}", tool_nodes[analyst_type])
+            workflow.add_node(f"Msg Clear {analyst_type.capitalize()}", clear_node)
+            workflow.add_node(f"tools_{analyst_type}", tool_node)
 
         # Add other nodes
+        workflow.add_node("Memory Recall", memory_recall_node)
         workflow.add_node("Bull Researcher", bull_researcher_node)
         workflow.add_node("Bear Researcher", bear_researcher_node)
         workflow.add_node("Research Manager", research_manager_node)
@@ -129,30 +220,36 @@ class GraphSetup:
         workflow.add_node("Risk Judge", risk_manager_node)
 
         # Define edges
-        # Start with the first analyst
-        first_analyst = selected_analysts[0]
-        workflow.add_edge(START, f"{first_analyst.capitalize()} Analyst")
+        entry = START
+        if self.data_prefetch:
+            # Warm the data caches for every selected analyst before (and while) they run
+            workflow.add_node("Data Prefetch", create_data_prefetch(selected_analysts))
+            workflow.add_edge(START, "Data Prefetch")
+            entry = "Data Prefetch"
 
-        # Connect analysts in sequence
-        for i, analyst_type in enumerate(selected_analysts):
-            current_analyst = f"{analyst_type.capitalize()} Analyst"
-            current_tools = f"tools_{analyst_type}"
-            current_clear = f"Msg Clear {analyst_type.capitalize()}"
-
-            # Add conditional edges for current analyst
-            workflow.add_conditional_edges(
-                current_analyst,
-                getattr(self.conditional_logic, f"should_continue_{analyst_type}"),
-                [current_tools, current_clear],
+        if self.parallel_analysts:
+            # Fan out: every analyst runs its own tool loop concurrently; Memory Recall waits for all
+            for analyst_type in selected_analysts:
+                current_analyst = f"{analyst_type.capitalize()} Analyst"
+                current_tools = f"tools_{analyst_type}"
+                workflow.add_edge(entry, current_analyst)
+                workflow.add_conditional_edges(
+                    current_analyst,
+                    _route_on_message_channel(
+                        getattr(self.conditional_logic, f"should_continue_{analyst_type}"),
+                        message_channel(analyst_type),
+                    ),
+                    [current_tools, f"Msg Clear {analyst_type.capitalize()}"],
+                )
+                workflow.add_edge(current_tools, current_analyst)
+            workflow.add_edge(
+                [f"Msg Clear {analyst_type.capitalize()}" for analyst_type in selected_analysts],
+                "Memory Recall",
             )
-            workflow.add_edge(current_tools, current_analyst)
+        else:
+            self._chain_analysts(workflow, selected_analysts, entry)
 
-            # Connect to next analyst or to Bull Researcher if this is the last analyst
-            if i < len(selected_analysts) - 1:
-                next_analyst = f"{selected_analysts[i+1].capitalize()} Analyst"
-                workflow.add_edge(current_clear, next_analyst)
-            else:
-                workflow.add_edge(current_clear, "Bull Researcher")
+        workflow.add_edge("Memory Recall", "Bull Researcher")
 
         # Add remaining edges
         workflow.add_conditional_edges(
@@ -201,4 +298,4 @@ class GraphSetup:
         workflow.add_edge("Risk Judge", END)
 
         # Compile and return
-        return workflow.compile()
+        return workflow.compile(checkpointer=checkpointer)
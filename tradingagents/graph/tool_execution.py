@@ -0,0 +1,268 @@
+# TradingAgents/graph/tool_execution.py
+
+import asyncio
+import contextvars
+import itertools
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from langchain_core.messages import AIMessage, ToolMessage
+from langchain_core.runnables import Runnable, RunnableConfig
+from langchain_core.tools import BaseTool
+
+
+class ToolJob:
+    """A submitted call: `started` resolves (to its monotonic start time) when a worker picks it up."""
+
+    def __init__(self, fn: Callable[..., Any], args: tuple):
+        self.fn = fn
+        self.args = args
+        self.started: Future = Future()
+        self.future: Future = Future()
+        self.abandoned = False
+
+    def cancel(self) -> bool:
+        """Drop the call if no worker has picked it up yet."""
+        if self.future.cancel():
+            self.started.cancel()
+            return True
+        return False
+
+
+class ToolPool:
+    """
+    Worker threads for tool calls: `workers_per_run` for each run registered with `run_slot`.
+
+    A running call cannot be interrupted, so one that misses its deadline is `abandon`ed: its
+    thread stops counting against the pool and a replacement is started, which keeps hung
+    tools from exhausting the workers. Abandoned threads exit when their call returns.
+    """
+
+    def __init__(self, workers_per_run: int, thread_name_prefix: str = "ta-tool"):
+        self.workers_per_run = max(1, int(workers_per_run))
+        self._prefix = thread_name_prefix
+        self._queue: "queue.SimpleQueue[ToolJob]" = queue.SimpleQueue()
+        self._lock = threading.Lock()
+        self._idle = threading.Semaphore(0)
+        self._counter = itertools.count()
+        self._runs = 0
+        self._threads = 0
+        self._abandoned = 0
+        self._log = logging.getLogger(__name__)
+
+    @property
+    def max_workers(self) -> int:
+        return self.workers_per_run * max(1, self._runs)
+
+    @property
+    def abandoned(self) -> int:
+        """Calls still running after their caller gave up on them."""
+        return self._abandoned
+
+    @contextmanager
+    def run_slot(self):
+        """Size the pool for one more concurrent run while the block executes."""
+        with self._lock:
+            self._runs += 1
+        try:
+            yield self
+        finally:
+            with self._lock:
+                self._runs -= 1
+
+    def submit(self, fn: Callable[..., Any], *args: Any) -> ToolJob:
+        job = ToolJob(fn, args)
+        self._queue.put(job)
+        if not self._idle.acquire(blocking=False):
+            with self._lock:
+                if self._threads - self._abandoned < self.max_workers:
+                    self._spawn()
+        return job
+
+    def abandon(self, job: ToolJob, name: str) -> None:
+        """Give up on `job`: drop it if queued, else let it finish on a thread of its own."""
+        if job.cancel():
+            return
+        with self._lock:
+            if job.future.done():
+                return
+            job.abandoned = True
+            self._abandoned += 1
+            self._spawn()
+            abandoned = self._abandoned
+        self._log.warning("Abandoned tool call %s is still running (%d abandoned calls in flight)", name, abandoned)
+
+    def _spawn(self) -> None:
+        # Called with self._lock held.
+        self._threads += 1
+        threading.Thread(target=self._work, name=f"{self._prefix}_{next(self._counter)}", daemon=True).start()
+
+    def _work(self) -> None:
+        while True:
+            job = self._queue.get()
+            if job.future.set_running_or_notify_cancel():
+                started_at = time.monotonic()
+                job.started.set_result(started_at)
+                try:
+                    job.future.set_result(job.fn(*job.args))
+                except BaseException as e:
+                    job.future.set_exception(e)
+                with self._lock:
+                    if job.abandoned:
+                        self._abandoned -= 1
+                        self._log.info(
+                            "Abandoned tool call finished after %.0fs", time.monotonic() - started_at
+                        )
+                    if self._threads - self._abandoned > self.max_workers:
+                        self._threads -= 1
+                        return
+            self._idle.release()
+
+
+_POOLS: Dict[int, ToolPool] = {}
+_POOLS_LOCK = threading.Lock()
+
+
+def get_tool_pool(max_workers: int) -> ToolPool:
+    """Process-wide pool of a given size, for tool nodes not given a pool of their own."""
+    with _POOLS_LOCK:
+        pool = _POOLS.get(max_workers)
+        if pool is None:
+            pool = ToolPool(max_workers)
+            _POOLS[max_workers] = pool
+        return pool
+
+
+class ConcurrentToolNode(Runnable):
+    """
+    Graph node executing the tool calls of an analyst's last message concurrently.
+
+    Calls run on a bounded `ToolPool` (the graph's, else a shared one of `max_workers`); each
+    one has a deadline (`timeout_seconds`, or its entry in `tool_timeouts`) counted from when
+    it starts running, so waiting for a free worker does not time it out. A call that misses
+    its deadline cannot be interrupted, so it is abandoned to the pool and the LLM receives a
+    timeout error for it instead of the run stalling. Tool messages are returned in the
+    order of the calls.
+
+    Under `ainvoke` (graph `ainvoke`/`astream`) the node awaits the same pool instead of
+    blocking a thread, so the number of threads is bounded by the pool, not by the number of
+    concurrent runs.
+    """
+
+    def __init__(
+        self,
+        tools: Sequence[BaseTool],
+        max_workers: int = 8,
+        timeout_seconds: Optional[float] = 120.0,
+        tool_timeouts: Optional[Dict[str, float]] = None,
+        messages_key: str = "messages",
+        pool: Optional[ToolPool] = None,
+    ):
+        self.tools_by_name = {tool.name: tool for tool in tools}
+        self.max_workers = max(1, int(max_workers))
+        self.timeout_seconds = timeout_seconds
+        self.tool_timeouts = dict(tool_timeouts or {})
+        self.messages_key = messages_key
+        self.pool = pool
+        self._log = logging.getLogger(__name__)
+
+    def _get_pool(self) -> ToolPool:
+        return self.pool if self.pool is not None else get_tool_pool(self.max_workers)
+
+    def _remaining(self, name: str, started_at: float) -> Optional[float]:
+        timeout = self._timeout_for(name)
+        return None if timeout is None else max(0.0, started_at + timeout - time.monotonic())
+
+    def _timeout_for(self, name: str) -> Optional[float]:
+        timeout = self.tool_timeouts.get(name, self.timeout_seconds)
+        return float(timeout) if timeout else None
+
+    def _run_call(self, call: Dict[str, Any], config: Optional[RunnableConfig]) -> ToolMessage:
+        tool = self.tools_by_name[call["name"]]
+        result = tool.invoke({**call, "type": "tool_call"}, config)
+        if isinstance(result, ToolMessage):
+            return result
+        return ToolMessage(content=str(result), tool_call_id=call["id"], name=call["name"])
+
+    def _error_message(self, call: Dict[str, Any], content: str) -> ToolMessage:
+        return ToolMessage(content=content, tool_call_id=call["id"], name=call["name"], status="error")
+
+    def _unknown_tool_message(self, call: Dict[str, Any]) -> ToolMessage:
+        return self._error_message(
+            call, f"Error: {call['name']} is not a valid tool, try one of [{', '.join(self.tools_by_name)}]."
+        )
+
+    def _timeout_message(self, call: Dict[str, Any]) -> ToolMessage:
+        timeout = self._timeout_for(call["name"])
+        self._log.warning("Tool call %s timed out after %.0fs", call["name"], timeout)
+        return self._error_message(call, f"Error: {call['name']} timed out after {timeout:.0f}s; the data is unavailable.")
+
+    def _tool_calls(self, state: Dict[str, Any]) -> List[Dict[str, Any]]:
+        last_message = state[self.messages_key][-1]
+        return list(getattr(last_message, "tool_calls", None) or []) if isinstance(last_message, AIMessage) else []
+
+    def invoke(
+        self, state: Dict[str, Any], config: Optional[RunnableConfig] = None, **kwargs: Any
+    ) -> Dict[str, List[ToolMessage]]:
+        calls = self._tool_calls(state)
+
+        pool = self._get_pool()
+        jobs: List[Optional[ToolJob]] = []
+        for call in calls:
+            if call["name"] not in self.tools_by_name:
+                jobs.append(None)
+                continue
+            # Each call gets its own copy of the context (callbacks, tracing) of this node.
+            context = contextvars.copy_context()
+            jobs.append(pool.submit(context.run, self._run_call, call, config))
+
+        messages: List[ToolMessage] = []
+        for call, job in zip(calls, jobs):
+            if job is None:
+                messages.append(self._unknown_tool_message(call))
+                continue
+            try:
+                started_at = job.started.result()
+                messages.append(job.future.result(timeout=self._remaining(call["name"], started_at)))
+            except FutureTimeoutError:
+                pool.abandon(job, call["name"])
+                messages.append(self._timeout_message(call))
+            except Exception as e:
+                messages.append(self._error_message(call, f"Error: {e!r}\n Please fix your mistakes."))
+        return {self.messages_key: messages}
+
+    async def ainvoke(
+        self, state: Dict[str, Any], config: Optional[RunnableConfig] = None, **kwargs: Any
+    ) -> Dict[str, List[ToolMessage]]:
+        pool = self._get_pool()
+
+        async def run(call: Dict[str, Any]) -> ToolMessage:
+            if call["name"] not in self.tools_by_name:
+                return self._unknown_tool_message(call)
+            context = contextvars.copy_context()
+            job = pool.submit(context.run, self._run_call, call, config)
+            try:
+                # Shielded, so a cancelled await does not cancel the job's futures under the worker.
+                started_at = await asyncio.shield(asyncio.wrap_future(job.started))
+                return await asyncio.wait_for(
+                    asyncio.shield(asyncio.wrap_future(job.future)), self._remaining(call["name"], started_at)
+                )
+            except asyncio.TimeoutError:
+                pool.abandon(job, call["name"])
+                return self._timeout_message(call)
+            except asyncio.CancelledError:
+                pool.abandon(job, call["name"])
+                raise
+            except Exception as e:
+                return self._error_message(call, f"Error: {e!r}\n Please fix your mistakes.")
+
+        messages = await asyncio.gather(*(run(call) for call in self._tool_calls(state)))
+        return {self.messages_key: list(messages)}
+
+    def __call__(self, state: Dict[str, Any], config: RunnableConfig) -> Dict[str, List[ToolMessage]]:
+        return self.invoke(state, config)
@@ -1,21 +1,26 @@
 # TradingAgents/graph/trading_graph.py
 
 import os
+import asyncio
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 import json
 from datetime import date
-from typing import Dict, Any, Tuple, List, Optional
+from typing import Dict, Any, Tuple, List, Optional, Iterable, Iterator, AsyncIterator
 
 from langchain_openai import ChatOpenAI
 from langchain_anthropic import ChatAnthropic
 from langchain_google_genai import ChatGoogleGenerativeAI
 from langchain_ollama import ChatOllama
 
-from langgraph.prebuilt import ToolNode
 
 from tradingagents.agents import *
 from tradingagents.default_config import DEFAULT_CONFIG
 from tradingagents.agents.utils.memory import FinancialSituationMemory
+from tradingagents.agents.utils.memory_partitions import resolve_sector
 from tradingagents.agents.utils.agent_states import (
     AgentState,
     InvestDebateState,
@@ -37,10 +42,19 @@ from tradingagents.agents.utils.agent_utils import (
     get_global_news
 )
 
+from .batch import BatchItem, PropagationResult, normalize_items
+from .checkpointing import (
+    config_fingerprint,
+    find_replay_checkpoint,
+    open_checkpointer,
+    replay_node,
+    run_thread_id,
+)
 from .conditional_logic import ConditionalLogic
 from .setup import GraphSetup
 from .propagation import Propagator
 from .reflection import Reflector
+from .tool_execution import ConcurrentToolNode, ToolPool
 from .signal_processing import SignalProcessor
 
 
@@ -62,6 +76,7 @@ class TradingAgentsGraph:
         """
         self.debug = debug
         self.config = config or DEFAULT_CONFIG
+        self.selected_analysts = list(selected_analysts)
 
         # Update the interface's config
         set_config(self.config)
@@ -97,7 +112,13 @@ class TradingAgentsGraph:
         self.invest_judge_memory = FinancialSituationMemory("invest_judge_memory", self.config)
         self.risk_manager_memory = FinancialSituationMemory("risk_manager_memory", self.config)
 
+        snapshot_dir = self.config.get("memory_snapshot_dir")
+        if snapshot_dir:
+            self.import_memories(snapshot_dir, only_empty=True)
+
         # Create tool nodes
+        # Tool calls of this graph's runs: tool_max_workers threads per run in flight.
+        self.tool_pool = ToolPool(int(self.config.get("tool_max_workers", 8)))
         self.tool_nodes = self._create_tool_nodes()
 
         # Get language from config
@@ -119,6 +140,8 @@ class TradingAgentsGraph:
             self.risk_manager_memory,
             self.conditional_logic,
             self.lang,
+            parallel_analysts=bool(self.config.get("parallel_analysts", False)),
+            data_prefetch=bool(self.config.get("data_prefetch", False)),
         )
 
         self.propagator = Propagator()
@@ -128,63 +151,111 @@ class TradingAgentsGraph:
         # State tracking
         self.curr_state = None
         self.ticker = None
-        self.log_states_dict = {}  # date to full state dict
+        self.log_states_dict = {}  # ticker to {date: full state dict}
+        self._log_lock = threading.Lock()
+
+        # Optional persistent checkpoints: one thread per (ticker, date, config fingerprint)
+        checkpoint_db_path = self.config.get("checkpoint_db_path")
+        self.checkpointer = open_checkpointer(checkpoint_db_path) if checkpoint_db_path else None
+        self.config_fingerprint = config_fingerprint(self.config, self.selected_analysts)
 
         # Set up the graph
-        self.graph = self.graph_setup.setup_graph(selected_analysts)
+        self.graph = self.graph_setup.setup_graph(selected_analysts, checkpointer=self.checkpointer)
 
-    def _create_tool_nodes(self) -> Dict[str, ToolNode]:
+    def _create_tool_nodes(self) -> Dict[str, ConcurrentToolNode]:
         """Create tool nodes for different data sources using abstract methods."""
+        tool_sets = {
+            "market": [
+                # Core stock data tools
+                get_stock_data,
+                # Technical indicators
+                get_indicators,
+            ],
+            "social": [
+                # News tools for social media analysis
+                get_news,
+            ],
+            "news": [
+                # News and insider information
+                get_news,
+                get_global_news,
+                get_insider_sentiment,
+                get_insider_transactions,
+            ],
+            "fundamentals": [
+                # Fundamental analysis tools
+                get_fundamentals,
+                get_balance_sheet,
+                get_cashflow,
+                get_income_statement,
+            ],
+        }
+        # Same-turn tool calls run concurrently, each bounded by its timeout
         return {
-            "market": ToolNode(
-                [
-                    # Core stock data tools
-                    get_stock_data,
-                    # Technical indicators
-                    get_indicators,
-                ]
-            ),
-            "social": ToolNode(
-                [
-                    # News tools for social media analysis
-                    get_news,
-                ]
-            ),
-            "news": ToolNode(
-                [
-                    # News and insider information
-                    get_news,
-                    get_global_news,
-                    get_insider_sentiment,
-                    get_insider_transactions,
-                ]
-            ),
-            "fundamentals": ToolNode(
-                [
-                    # Fundamental analysis tools
-                    get_fundamentals,
-                    get_balance_sheet,
-                    get_cashflow,
-                    get_income_statement,
-                ]
-            ),
+            analyst: ConcurrentToolNode(
+                tools,
+                max_workers=int(self.config.get("tool_max_workers", 8)),
+                timeout_seconds=self.config.get("tool_timeout_seconds", 120),
+                tool_timeouts=self.config.get("tool_timeouts") or {},
+                pool=self.tool_pool,
+            )
+            for analyst, tools in tool_sets.items()
         }
 
-    def propagate(self, company_name, trade_date):
-        """Run the trading agents graph for a company on a specific date."""
+    def _graph_input(self, company_name, trade_date, resume=True, replay_from=None):
+        """Graph input and invocation args of a run.
+
+        Without a checkpointer this is always a fresh run. With one, a run of the same
+        (ticker, date, config) that stopped part-way continues after its last completed node
+        and a finished one returns its stored state, unless `resume` is False (start over).
+        `replay_from` (a node name or "research", "trader", "risk") re-runs the graph from
+        the checkpoint taken before that node first ran, keeping everything upstream.
+        """
+        # Memory partition tags read the sector from here on; an opt-in network lookup happens now.
+        resolve_sector(company_name, self.config)
+        init_agent_state = self.propagator.create_initial_state(company_name, trade_date)
+        if self.checkpointer is None:
+            if replay_from:
+                raise ValueError("replay_from requires checkpoint_db_path to be set")
+            return init_agent_state, self.propagator.get_graph_args()
+
+        thread_id = run_thread_id(company_name, str(trade_date), self.config_fingerprint)
+        args = self.propagator.get_graph_args(thread_id)
+
+        if replay_from:
+            node = replay_node(replay_from)
+            snapshot = find_replay_checkpoint(self.graph.get_state_history(args["config"]), node)
+            if snapshot is None:
+                raise ValueError(f"No checkpoint of {company_name} on {trade_date} before {node}")
+            args["config"] = {**args["config"], "configurable": dict(snapshot.config["configurable"])}
+            return None, args
+
+        if resume and self.graph.get_state(args["config"]).values:
+            return None, args
+
+        self.checkpointer.delete_thread(thread_id)
+        return init_agent_state, args
+
+    def propagate(self, company_name, trade_date, resume=True, replay_from=None):
+        """Run the trading agents graph for a company on a specific date.
+
+        With `checkpoint_db_path` set, `resume` and `replay_from` select how an earlier run of
+        the same company, date and config is reused (see `_graph_input`).
+        """
 
         self.ticker = company_name
+        final_state, signal = self._run(company_name, trade_date, resume, replay_from)
 
-        # Initialize state
-        init_agent_state = self.propagator.create_initial_state(
-            company_name, trade_date
-        )
-        args = self.propagator.get_graph_args()
+        # Store current state for reflection
+        self.curr_state = final_state
+        return final_state, signal
 
+    def _run(self, company_name, trade_date, resume=True, replay_from=None):
+        """`propagate` without recording the run on the instance (safe from batch workers)."""
         if self.debug:
             # Debug mode with tracing
             trace = []
-            for chunk in self.graph.stream(init_agent_state, **args):
+            for chunk in self.stream(company_name, trade_date, resume, replay_from):
                 if chunk.get("messages"):
                     chunk["messages"][-1].pretty_print()
                 trace.append(chunk)
@@ -194,10 +265,9 @@ class TradingAgentsGraph:
             final_state = trace[-1]
         else:
             # Standard mode without tracing
-            final_state = self.graph.invoke(init_agent_state, **args)
-
-        # Store current state for reflection
-        self.curr_state = final_state
+            init_agent_state, args = self._graph_input(company_name, trade_date, resume, replay_from)
+            with self.tool_pool.run_slot():
+                final_state = self.graph.invoke(init_agent_state, **args)
 
         # Log state
         self._log_state(trade_date, final_state)
@@ -205,9 +275,132 @@ class TradingAgentsGraph:
         # Return decision and processed signal
         return final_state, self.process_signal(final_state["final_trade_decision"])
 
+    def stream(self, company_name, trade_date, resume=True, replay_from=None):
+        """Stream the graph's state after each step for a company and date (full snapshots, "values" mode).
+
+        Runs are started, resumed or replayed as by `propagate`; a finished checkpointed run
+        yields its stored state once. Nothing is logged or recorded on the instance.
+        """
+        init_agent_state, args = self._graph_input(company_name, trade_date, resume, replay_from)
+        with self.tool_pool.run_slot():
+            yield from self.graph.stream(init_agent_state, **args)
+
+    async def astream(self, company_name, trade_date, resume=True, replay_from=None):
+        """Async variant of `stream` that does not block the event loop.
+
+        Model calls are awaited and tool calls run on the bounded tool pool, so many runs
+        can share one event loop. Yields full state snapshots like `graph.stream` in "values" mode.
+        """
+        init_agent_state, args = await asyncio.to_thread(
+            self._graph_input, company_name, trade_date, resume, replay_from
+        )
+        with self.tool_pool.run_slot():
+            async for chunk in self.graph.astream(init_agent_state, **args):
+                yield chunk
+
+    async def apropagate(self, company_name, trade_date, resume=True, replay_from=None):
+        """Async variant of `propagate`; concurrent calls may share one instance and one event loop."""
+        self.ticker = company_name
+        final_state, signal = await self._arun(company_name, trade_date, resume, replay_from)
+
+        # Store current state for reflection (the last run to finish when several are in flight)
+        self.curr_state = final_state
+        return final_state, signal
+
+    async def _arun(self, company_name, trade_date, resume=True, replay_from=None):
+        """`apropagate` without recording the run on the instance (safe from batch runs)."""
+        if self.debug:
+            final_state = None
+            async for chunk in self.astream(company_name, trade_date, resume, replay_from):
+                if chunk.get("messages"):
+                    chunk["messages"][-1].pretty_print()
+                final_state = chunk
+
+            if final_state is None:
+                raise RuntimeError("Graph produced no output (empty trace).")
+        else:
+            init_agent_state, args = await asyncio.to_thread(
+                self._graph_input, company_name, trade_date, resume, replay_from
+            )
+            with self.tool_pool.run_slot():
+                final_state = await self.graph.ainvoke(init_agent_state, **args)
+
+        self._log_state(trade_date, final_state)
+
+        return final_state, await self.signal_processor.aprocess_signal(final_state["final_trade_decision"])
+
+    def propagate_many(
+        self, items: Iterable[BatchItem], max_concurrency: Optional[int] = None
+    ) -> Iterator[PropagationResult]:
+        """Run `propagate` for every (ticker, trade_date), yielding results as they complete.
+
+        Up to `max_concurrency` runs (default `batch_max_concurrency`) share this instance's
+        compiled graph, LLM clients, memories and data caches. A failing item is reported
+        with its error instead of stopping the batch. Batch runs leave `curr_state` alone;
+        pass a result to `reflect_and_remember` to learn from it.
+        """
+        items = normalize_items(items)
+        workers = max(1, int(max_concurrency or self.config.get("batch_max_concurrency", 4)))
+        pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ta-batch")
+        try:
+            futures = [
+                pool.submit(self._propagate_item, index, ticker, trade_date)
+                for index, (ticker, trade_date) in enumerate(items)
+            ]
+            for future in as_completed(futures):
+                yield future.result()
+        finally:
+            # If the caller stops iterating early, drop the items that have not started.
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def _propagate_item(self, index: int, ticker: str, trade_date: str) -> PropagationResult:
+        result = PropagationResult(index=index, ticker=ticker, trade_date=trade_date)
+        start = time.perf_counter()
+        try:
+            result.final_state, result.decision = self._run(ticker, trade_date)
+        except Exception as e:
+            logging.getLogger(__name__).exception("Propagation of %s on %s failed", ticker, trade_date)
+            result.error = f"{type(e).__name__}: {e}"
+        result.latency_seconds = time.perf_counter() - start
+        return result
+
+    async def apropagate_many(
+        self, items: Iterable[BatchItem], max_concurrency: Optional[int] = None
+    ) -> AsyncIterator[PropagationResult]:
+        """Async variant of `propagate_many`: up to `max_concurrency` `apropagate` runs on the current event loop."""
+        items = normalize_items(items)
+        semaphore = asyncio.Semaphore(max(1, int(max_concurrency or self.config.get("batch_max_concurrency", 4))))
+
+        async def run(index: int, ticker: str, trade_date: str) -> PropagationResult:
+            async with semaphore:
+                result = PropagationResult(index=index, ticker=ticker, trade_date=trade_date)
+                start = time.perf_counter()
+                try:
+                    result.final_state, result.decision = await self._arun(ticker, trade_date)
+                except Exception as e:
+                    logging.getLogger(__name__).exception("Propagation of %s on %s failed", ticker, trade_date)
+                    result.error = f"{type(e).__name__}: {e}"
+                result.latency_seconds = time.perf_counter() - start
+                return result
+
+        tasks = [asyncio.ensure_future(run(index, *item)) for index, item in enumerate(items)]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+
     def _log_state(self, trade_date, final_state):
         """Log the final state to a JSON file."""
-        self.log_states_dict[str(trade_date)] = {
+        # Batch runs log concurrently; each ticker keeps its own file of dates.
+        ticker = final_state["company_of_interest"]
+        with self._log_lock:
+            self._write_state_log(ticker, trade_date, final_state)
+
+    def _write_state_log(self, ticker, trade_date, final_state):
+        states = self.log_states_dict.setdefault(ticker, {})
+        states[str(trade_date)] = {
             "company_of_interest": final_state["company_of_interest"],
             "trade_date": final_state["trade_date"],
             "market_report": final_state["market_report"],
@@ -238,33 +431,80 @@ class TradingAgentsGraph:
         }
 
         # Save to file
-        directory = Path(f"eval_results/{self.ticker}/TradingAgentsStrategy_logs/")
+        directory = Path(f"eval_results/{ticker}/TradingAgentsStrategy_logs/")
         directory.mkdir(parents=True, exist_ok=True)
 
         with open(
-            f"eval_results/{self.ticker}/TradingAgentsStrategy_logs/full_states_log_{trade_date}.json",
+            f"eval_results/{ticker}/TradingAgentsStrategy_logs/full_states_log_{trade_date}.json",
             "w",
         ) as f:
-            json.dump(self.log_states_dict, f, indent=4)
+            json.dump(states, f, indent=4)
 
-    def reflect_and_remember(self, returns_losses):
-        """Reflect on decisions and update memory based on returns."""
-        self.reflector.reflect_bull_researcher(
-            self.curr_state, returns_losses, self.bull_memory
-        )
-        self.reflector.reflect_bear_researcher(
-            self.curr_state, returns_losses, self.bear_memory
-        )
-        self.reflector.reflect_trader(
-            self.curr_state, returns_losses, self.trader_memory
-        )
-        self.reflector.reflect_invest_judge(
-            self.curr_state, returns_losses, self.invest_judge_memory
-        )
-        self.reflector.reflect_risk_manager(
-            self.curr_state, returns_losses, self.risk_manager_memory
+    def reflect_and_remember(self, returns_losses, state=None):
+        """Reflect on decisions and update memory based on returns.
+
+        `state` is the final state (or the `PropagationResult`) of the run to reflect on;
+        by default the last `propagate`/`apropagate` run.
+        """
+        if isinstance(state, PropagationResult):
+            if state.final_state is None:
+                raise ValueError(f"Run of {state.ticker} on {state.trade_date} has no final state: {state.error}")
+            state = state.final_state
+        if state is None:
+            state = self.curr_state
+        if state is None:
+            raise ValueError("No run to reflect on; call propagate first or pass its state")
+        return self.reflector.reflect_all(
+            state,
+            returns_losses,
+            {
+                "bull": self.bull_memory,
+                "bear": self.bear_memory,
+                "trader": self.trader_memory,
+                "invest_judge": self.invest_judge_memory,
+                "risk_manager": self.risk_manager_memory,
+            },
+            max_workers=int(self.config.get("reflection_max_workers", 5)),
+            single_call=bool(self.config.get("reflection_single_call", False)),
         )
 
+    def _memories(self) -> Dict[str, FinancialSituationMemory]:
+        return {
+            memory.name: memory
+            for memory in (
+                self.bull_memory,
+                self.bear_memory,
+                self.trader_memory,
+                self.invest_judge_memory,
+                self.risk_manager_memory,
+            )
+        }
+
+    def export_memories(self, directory) -> Dict[str, int]:
+        """Write one `<name>.npz` snapshot per memory bank into `directory`."""
+        directory = Path(directory)
+        return {
+            name: memory.export_snapshot(directory / f"{name}.npz")
+            for name, memory in self._memories().items()
+        }
+
+    def import_memories(self, directory, only_empty: bool = False) -> Dict[str, int]:
+        """Load `<name>.npz` snapshots from `directory`; banks without a snapshot are left as-is."""
+        directory = Path(directory)
+        imported = {}
+        for name, memory in self._memories().items():
+            path = directory / f"{name}.npz"
+            if not path.exists():
+                continue
+            if only_empty and memory.situation_collection.count() > 0:
+                continue
+            imported[name] = memory.import_snapshot(path)
+        return imported
+
+    def compact_memories(self) -> Dict[str, Dict[str, Any]]:
+        """Dedupe and evict every memory bank per its retention settings; returns metrics per bank."""
+        return {name: memory.compact() for name, memory in self._memories().items()}
+
     def process_signal(self, full_signal):
         """Process a signal to extract the core decision."""
         return self.signal_processor.process_signal(full_signal)
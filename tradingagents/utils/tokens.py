@@ -0,0 +1,139 @@
+"""
+Shared token accounting for prompt and embedding budgets.
+
+- Encoders are resolved once per model (and failures are remembered, so an offline
+  `tiktoken` does not retry its download on every call).
+- Counts of longer texts are memoized by content hash; the same report is often counted
+  several times per step.
+- Trimming encodes once and slices the token array, so the result is exact and O(n)
+  instead of re-tokenizing while shrinking a character budget.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Literal
+
+DEFAULT_ENCODING = "cl100k_base"
+
+# Texts shorter than this are counted directly; hashing would cost about as much.
+_MEMO_MIN_CHARS = 256
+_MEMO_MAX_ITEMS = 4096
+
+_memo: "OrderedDict[tuple[str, bytes], int]" = OrderedDict()
+_memo_lock = threading.Lock()
+
+
+@lru_cache(maxsize=None)
+def get_encoding(model: str | None = None):
+    """`tiktoken` encoding for `model` (cl100k_base when unknown), or None if unavailable."""
+    try:
+        import tiktoken  # type: ignore
+    except Exception:
+        return None
+
+    if model:
+        try:
+            return tiktoken.encoding_for_model(model)
+        except Exception:
+            pass
+    try:
+        return tiktoken.get_encoding(DEFAULT_ENCODING)
+    except Exception:
+        return None
+
+
+def estimate_tokens(text: str) -> int:
+    """Heuristic count used when no encoder is available (CJK ~1 token/char, ASCII ~4 chars/token)."""
+    ascii_chars = sum(1 for ch in text if ord(ch) < 128)
+    non_ascii_chars = len(text) - ascii_chars
+    return int(non_ascii_chars + (ascii_chars / 4))
+
+
+def encode(text: str, model: str | None = None) -> list[int] | None:
+    encoding = get_encoding(model)
+    if encoding is None:
+        return None
+    return encoding.encode(text, disallowed_special=())
+
+
+def count_tokens(text: str, model: str | None = None) -> int:
+    """Token count for `text` under `model`'s encoder (heuristic when none is available)."""
+    if not text:
+        return 0
+
+    encoding = get_encoding(model)
+    encoding_name = encoding.name if encoding is not None else "estimate"
+    key = None
+    if len(text) >= _MEMO_MIN_CHARS:
+        key = (encoding_name, hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest())
+        with _memo_lock:
+            cached = _memo.get(key)
+            if cached is not None:
+                _memo.move_to_end(key)
+                return cached
+
+    if encoding is not None:
+        tokens = len(encoding.encode(text, disallowed_special=()))
+    else:
+        tokens = max(1, estimate_tokens(text))
+
+    if key is not None:
+        with _memo_lock:
+            _memo[key] = tokens
+            while len(_memo) > _MEMO_MAX_ITEMS:
+                _memo.popitem(last=False)
+    return tokens
+
+
+def _decode(encoding, ids: list[int]) -> str:
+    # Slicing can split a multi-byte character; drop the replacement characters it leaves.
+    return encoding.decode(ids).strip("�")
+
+
+def truncate_to_tokens(
+    text: str,
+    budget: int,
+    model: str | None = None,
+    keep: Literal["head", "tail", "middle"] = "head",
+    marker: str = "\n...\n",
+) -> str:
+    """
+    Trim `text` to at most `budget` tokens, keeping its head, tail, or both ends ("middle"
+    cuts the middle out). `marker` replaces the removed part and counts toward the budget.
+    """
+    budget = max(0, int(budget))
+    encoding = get_encoding(model)
+    if encoding is None:
+        return _truncate_chars(text, budget, keep, marker)
+
+    ids = encoding.encode(text, disallowed_special=())
+    if len(ids) <= budget:
+        return text
+
+    marker_ids = encoding.encode(marker, disallowed_special=()) if marker else []
+    room = max(0, budget - len(marker_ids))
+    if keep == "tail":
+        return marker + _decode(encoding, ids[len(ids) - room:]) if room else ""
+    if keep == "middle":
+        head = room // 2
+        tail = room - head
+        return _decode(encoding, ids[:head]) + marker + _decode(encoding, ids[len(ids) - tail:])
+    return _decode(encoding, ids[:room]) + marker if room else ""
+
+
+def _truncate_chars(text: str, budget: int, keep: str, marker: str) -> str:
+    """Heuristic trimming when no encoder is available."""
+    tokens = estimate_tokens(text)
+    if tokens <= budget:
+        return text
+    max_chars = max(0, int(len(text) * budget / max(tokens, 1)) - len(marker))
+    if keep == "tail":
+        return marker + text[len(text) - max_chars:]
+    if keep == "middle":
+        head = max_chars // 2
+        return text[:head] + marker + text[len(text) - (max_chars - head):]
+    return text[:max_chars] + marker